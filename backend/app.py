@@ -1,28 +1,65 @@
 from flask import Flask
 from flask_cors import CORS
 from config import Config
+from utils import database, compression
+from models.user import User
+from utils.auth_middleware import require_auth
+from utils.tokens import revoked_users
+from utils.passwords import get_hasher_stats
+from utils.rate_limit import get_login_limiter_stats
+from utils.catalog_cache import catalog_cache
+from utils.image_variants import variant_worker
+from utils.export_jobs import export_worker
+from utils.json_provider import get_json_provider_class
 
 from routes.auth import auth_bp
 from routes.business import business_bp
 from routes.individual import individual_bp
 from routes.products import products_bp
 from routes.superadmin import superadmin_bp
+from routes.images import images_bp
+from commands import register_commands
 
 app = Flask(__name__)
+app.json = get_json_provider_class(Config.JSON_PROVIDER)(app)
 app.config.from_object(Config)
 
-CORS(app, origins=Config.CORS_ORIGINS.split(','), supports_credentials=True)
+database.init_app(app)
+compression.init_app(app)
+
+CORS(app, origins=Config.CORS_ORIGINS.split(','), supports_credentials=True, expose_headers=['Content-Disposition'])
 
 app.register_blueprint(auth_bp, url_prefix='/api')
 app.register_blueprint(business_bp, url_prefix='/api')
 app.register_blueprint(individual_bp, url_prefix='/api')
 app.register_blueprint(products_bp, url_prefix='/api')
 app.register_blueprint(superadmin_bp, url_prefix='/api')
+app.register_blueprint(images_bp, url_prefix='/api')
+
+register_commands(app)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     return {'success': True, 'message': 'NandhaGarments API is running'}
 
+@app.route('/api/metrics', methods=['GET'])
+@require_auth(['superadmin'])
+def metrics():
+    return {
+        'success': True,
+        'data': {
+            'dbPool': database.get_pool_stats(),
+            'authCache': User.get_auth_cache_stats(),
+            'revokedUsers': len(revoked_users),
+            'passwordHasher': get_hasher_stats(),
+            'loginRateLimiter': get_login_limiter_stats(),
+            'catalogCache': catalog_cache.stats(),
+            'imageVariants': variant_worker.stats(),
+            'compression': compression.get_compression_stats(),
+            'exportJobs': export_worker.stats()
+        }
+    }
+
 @app.errorhandler(404)
 def not_found(error):
     return {'success': False, 'message': 'Endpoint not found', 'error': 'Route does not exist'}, 404
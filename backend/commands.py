@@ -0,0 +1,209 @@
+import json
+import os
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+import click
+from flask.json.provider import DefaultJSONProvider
+from models.product import bump_catalog_revision
+from models.stats import Stats
+from utils.database import get_db_connection
+from utils.export_jobs import export_worker
+from utils.image_store import image_name, is_data_url, store_images
+from utils.image_variants import generate_variants
+from utils.json_provider import JSON_PROVIDERS, orjson
+from utils.raw_json import RawJSON
+
+def _benchmark_payloads(orders, products):
+    """Synthetic responses shaped like /superadmin/orders and a catalog page"""
+    now = datetime(2025, 7, 11, 6, 57, 33)
+    order_rows = [
+        {
+            'id': order_id,
+            'user_id': order_id % 50,
+            'totalAmount': Decimal('4500.00'),
+            'status': 'pending',
+            'deliveryAddress': '123 Business Street, Coimbatore, Tamil Nadu, 641001',
+            'measurementId': None,
+            'paymentMethod': 'cod',
+            'paymentStatus': 'pending',
+            'createdAt': now - timedelta(hours=order_id),
+            'updatedAt': now,
+            'user_name': 'John Customer',
+            'user_email': 'john@example.com',
+            'user_type': 'business',
+            'items': [
+                {
+                    'id': order_id * 10 + line,
+                    'order_id': order_id,
+                    'productId': line + 1,
+                    'productName': 'Premium Cotton Shirt',
+                    'quantity': 2,
+                    'price': Decimal('1500.00'),
+                    'size': 'L',
+                    'created_at': now
+                }
+                for line in range(3)
+            ]
+        }
+        for order_id in range(1, orders + 1)
+    ]
+    images = json.dumps([f'/api/images/{index:064x}.jpg' for index in range(4)])
+    product_rows = [
+        {
+            'id': product_id,
+            'name': 'Premium Cotton Shirt',
+            'description': 'High-quality cotton shirt perfect for formal occasions',
+            'price': Decimal('2000.00'),
+            'sellingPrice': Decimal('1500.00'),
+            'images': RawJSON(images),
+            'availableSizes': RawJSON('["S", "M", "L", "XL"]'),
+            'specifications': RawJSON('{"material": "100% Cotton", "care": "Machine washable", "origin": "India"}'),
+            'status': 'active',
+            'rating': Decimal('4.50'),
+            'reviewCount': 25,
+            'createdAt': now,
+            'updatedAt': now
+        }
+        for product_id in range(1, products + 1)
+    ]
+    return {
+        'orders': {'success': True, 'data': order_rows},
+        'catalog page': {'success': True, 'data': {'products': product_rows, 'totalProducts': products}}
+    }
+
+def _decode_fragments(value):
+    if isinstance(value, RawJSON):
+        return value.decode()
+    if isinstance(value, dict):
+        return {key: _decode_fragments(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_fragments(item) for item in value]
+    return value
+
+def register_commands(app):
+    @app.cli.command('migrate-images')
+    @click.option('--batch-size', default=50, show_default=True, help='Products loaded per query')
+    def migrate_images(batch_size):
+        """Move base64 data URLs in products.images into the image store"""
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        last_id = 0
+        migrated = 0
+        while True:
+            cursor.execute(
+                "SELECT id, images FROM products WHERE id > %s ORDER BY id LIMIT %s",
+                (last_id, batch_size)
+            )
+            products = cursor.fetchall()
+            if not products:
+                break
+            
+            for product in products:
+                last_id = product['id']
+                images = json.loads(product['images']) if product['images'] else []
+                if not any(is_data_url(image) for image in images):
+                    continue
+                
+                cursor.execute(
+                    "UPDATE products SET images = %s WHERE id = %s",
+                    (json.dumps(store_images(images)), product['id'])
+                )
+                bump_catalog_revision(cursor)
+                migrated += 1
+            
+            click.echo(f'Processed products up to id {last_id}, {migrated} migrated')
+        
+        connection.close()
+        click.echo(f'Done: {migrated} products migrated')
+    
+    @app.cli.command('generate-image-variants')
+    @click.option('--workers', default=4, show_default=True, help='Images resized in parallel')
+    @click.option('--batch-size', default=50, show_default=True, help='Products loaded per query')
+    @click.option('--checkpoint', default='.image-variants.checkpoint', show_default=True,
+                  help='File recording the last fully processed product id')
+    @click.option('--restart', is_flag=True, help='Ignore the checkpoint and start from the first product')
+    def generate_image_variants(workers, batch_size, checkpoint, restart):
+        """Backfill thumbnail and medium variants for every stored product image"""
+        last_id = 0
+        if not restart and os.path.exists(checkpoint):
+            with open(checkpoint) as checkpoint_file:
+                last_id = int(checkpoint_file.read().strip() or 0)
+            click.echo(f'Resuming after product id {last_id}')
+        
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        generated = 0
+        failed = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                cursor.execute(
+                    "SELECT id, images FROM products WHERE id > %s ORDER BY id LIMIT %s",
+                    (last_id, batch_size)
+                )
+                products = cursor.fetchall()
+                if not products:
+                    break
+                
+                names = set()
+                for product in products:
+                    for image in json.loads(product['images']) if product['images'] else []:
+                        name = image_name(image)
+                        if name:
+                            names.add(name)
+                
+                futures = [executor.submit(generate_variants, name) for name in names]
+                for future in futures:
+                    try:
+                        generated += future.result()
+                    except Exception as e:
+                        failed += 1
+                        click.echo(f'Failed to generate variants: {e}', err=True)
+                
+                # Only advance the checkpoint once the whole batch is on disk
+                last_id = products[-1]['id']
+                with open(checkpoint, 'w') as checkpoint_file:
+                    checkpoint_file.write(str(last_id))
+                click.echo(f'Processed products up to id {last_id}, {generated} variants written')
+        
+        connection.close()
+        click.echo(f'Done: {generated} variants written, {failed} images failed')
+    
+    @app.cli.command('reconcile-stats')
+    def reconcile_stats():
+        """Recompute the dashboard counters from the source tables and report drift"""
+        drift = Stats.reconcile()
+        for column, (stored, actual) in drift.items():
+            click.echo(f'{column}: {stored} -> {actual}')
+        click.echo(f'Done: {len(drift)} counters corrected')
+    
+    @app.cli.command('expire-exports')
+    def expire_exports():
+        """Delete expired order export jobs and their files"""
+        removed = export_worker.expire_jobs()
+        click.echo(f'Done: {removed} expired exports removed')
+    
+    @app.cli.command('benchmark-json')
+    @click.option('--orders', default=2000, show_default=True, help='Orders in the orders payload')
+    @click.option('--products', default=48, show_default=True, help='Products in the catalog payload')
+    @click.option('--repeat', default=20, show_default=True, help='Serializations timed per provider')
+    def benchmark_json(orders, products, repeat):
+        """Compare Flask's default encoder with the app's JSON providers"""
+        providers = {'flask default': DefaultJSONProvider(app)}
+        for name, provider_class in JSON_PROVIDERS.items():
+            if name == 'orjson' and orjson is None:
+                click.echo('orjson is not installed, skipping it')
+                continue
+            providers[name] = provider_class(app)
+        
+        for payload_name, payload in _benchmark_payloads(orders, products).items():
+            click.echo(f'{payload_name}:')
+            for provider_name, provider in providers.items():
+                # The stock provider cannot embed fragments, so it gets them decoded as before
+                document = _decode_fragments(payload) if provider_name == 'flask default' else payload
+                size = len(provider.dumps(document))
+                seconds = min(timeit.repeat(lambda: provider.dumps(document), number=1, repeat=repeat))
+                click.echo(f'  {provider_name:<14} {seconds * 1000:8.2f} ms  {size / 1024:8.1f} KiB')
\ No newline at end of file
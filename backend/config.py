@@ -9,13 +9,67 @@ class Config:
     DB_NAME = os.getenv('DB_NAME', 'nandha_garments')
     DB_USER = os.getenv('DB_USER', 'root')
     DB_PASSWORD = os.getenv('DB_PASSWORD', '')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
+    DB_POOL_MAX_LIFETIME = int(os.getenv('DB_POOL_MAX_LIFETIME', 3600))
+    DB_POOL_IDLE_TIMEOUT = int(os.getenv('DB_POOL_IDLE_TIMEOUT', 300))
+    DB_POOL_PING_INTERVAL = int(os.getenv('DB_POOL_PING_INTERVAL', 30))
     
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'fallback-secret-key')
     JWT_ALGORITHM = os.getenv('JWT_ALGORITHM', 'HS256')
-    JWT_ACCESS_TOKEN_EXPIRE_HOURS = int(os.getenv('JWT_ACCESS_TOKEN_EXPIRE_HOURS', 24))
+    JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv('JWT_ACCESS_TOKEN_EXPIRE_MINUTES', 15))
+    JWT_REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv('JWT_REFRESH_TOKEN_EXPIRE_DAYS', 7))
+    
+    AUTH_CACHE_SIZE = int(os.getenv('AUTH_CACHE_SIZE', 10000))
+    AUTH_CACHE_TTL = int(os.getenv('AUTH_CACHE_TTL', 30))
     
     APP_PORT = int(os.getenv('APP_PORT', 5000))
     APP_DEBUG = os.getenv('APP_DEBUG', 'True').lower() == 'true'
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:3000')
+    JSON_PROVIDER = os.getenv('JSON_PROVIDER', 'auto')
+    
+    PRODUCT_FULLTEXT_SEARCH = os.getenv('PRODUCT_FULLTEXT_SEARCH', 'True').lower() == 'true'
+    # Must match the server's innodb_ft_min_token_size
+    FULLTEXT_MIN_TOKEN_SIZE = int(os.getenv('FULLTEXT_MIN_TOKEN_SIZE', 3))
+    PRODUCT_BATCH_MAX_IDS = int(os.getenv('PRODUCT_BATCH_MAX_IDS', 100))
+    PRODUCTS_PAGE_SIZE = int(os.getenv('PRODUCTS_PAGE_SIZE', 12))
+    PRODUCTS_MAX_PAGE_SIZE = int(os.getenv('PRODUCTS_MAX_PAGE_SIZE', 48))
+    ADMIN_PRODUCTS_PAGE_SIZE = int(os.getenv('ADMIN_PRODUCTS_PAGE_SIZE', 24))
+    ADMIN_PRODUCTS_MAX_PAGE_SIZE = int(os.getenv('ADMIN_PRODUCTS_MAX_PAGE_SIZE', 100))
+    USERS_PAGE_SIZE = int(os.getenv('USERS_PAGE_SIZE', 20))
+    USERS_MAX_PAGE_SIZE = int(os.getenv('USERS_MAX_PAGE_SIZE', 100))
+    ORDERS_PAGE_SIZE = int(os.getenv('ORDERS_PAGE_SIZE', 20))
+    ORDERS_MAX_PAGE_SIZE = int(os.getenv('ORDERS_MAX_PAGE_SIZE', 100))
+    EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', 500))
+    EXPORT_MAX_LIMIT = int(os.getenv('EXPORT_MAX_LIMIT', 1000000))
+    EXPORT_STORE_PATH = os.getenv('EXPORT_STORE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads', 'exports'))
+    EXPORT_WORKERS = int(os.getenv('EXPORT_WORKERS', 2))
+    EXPORT_MAX_QUEUED = int(os.getenv('EXPORT_MAX_QUEUED', 10))
+    EXPORT_JOB_TTL = int(os.getenv('EXPORT_JOB_TTL', 24 * 60 * 60))
+    EXPORT_DEDUPE_WINDOW = int(os.getenv('EXPORT_DEDUPE_WINDOW', 300))
+    EXPORT_JOB_STALE_AFTER = int(os.getenv('EXPORT_JOB_STALE_AFTER', 15 * 60))
+    EXPORT_SWEEP_INTERVAL = int(os.getenv('EXPORT_SWEEP_INTERVAL', 60))
+    
+    IMAGE_STORE_PATH = os.getenv('IMAGE_STORE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads', 'images'))
+    IMAGE_VARIANT_WORKERS = int(os.getenv('IMAGE_VARIANT_WORKERS', 2))
+    
+    CATALOG_CACHE_MAX_ENTRIES = int(os.getenv('CATALOG_CACHE_MAX_ENTRIES', 1000))
+    CATALOG_CACHE_MAX_BYTES = int(os.getenv('CATALOG_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+    CATALOG_CACHE_TTL = int(os.getenv('CATALOG_CACHE_TTL', 60))
+    CATALOG_STATE_TTL = int(os.getenv('CATALOG_STATE_TTL', 5))
+    CATALOG_CACHE_CONTROL = os.getenv('CATALOG_CACHE_CONTROL', 'public, max-age=0, must-revalidate')
+    
+    COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'True').lower() == 'true'
+    COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+    COMPRESSION_CACHE_MAX_ENTRIES = int(os.getenv('COMPRESSION_CACHE_MAX_ENTRIES', 500))
+    COMPRESSION_CACHE_MAX_BYTES = int(os.getenv('COMPRESSION_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+    
+    BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 12))
+    BCRYPT_WORKERS = int(os.getenv('BCRYPT_WORKERS', 2))
+    BCRYPT_MAX_PENDING = int(os.getenv('BCRYPT_MAX_PENDING', 16))
+    BCRYPT_TIMEOUT = float(os.getenv('BCRYPT_TIMEOUT', 5))
     
-    BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 12))
\ No newline at end of file
+    LOGIN_RATE_LIMIT_PER_IP = int(os.getenv('LOGIN_RATE_LIMIT_PER_IP', 20))
+    LOGIN_RATE_LIMIT_PER_EMAIL = int(os.getenv('LOGIN_RATE_LIMIT_PER_EMAIL', 5))
+    LOGIN_RATE_LIMIT_WINDOW = int(os.getenv('LOGIN_RATE_LIMIT_WINDOW', 60))
+    RATE_LIMIT_REDIS_URL = os.getenv('RATE_LIMIT_REDIS_URL', '')
\ No newline at end of file
@@ -0,0 +1,3 @@
+USE nandha_garments;
+
+ALTER TABLE products ADD FULLTEXT INDEX ft_name_description (name, description);
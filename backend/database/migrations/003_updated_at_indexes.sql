@@ -0,0 +1,5 @@
+USE nandha_garments;
+
+ALTER TABLE products ADD INDEX idx_updated_at (updated_at);
+ALTER TABLE orders ADD INDEX idx_updated_at (updated_at);
+ALTER TABLE orders ADD INDEX idx_user_updated_at (user_id, updated_at);
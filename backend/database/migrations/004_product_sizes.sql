@@ -0,0 +1,18 @@
+USE nandha_garments;
+
+ALTER TABLE products ADD INDEX idx_rating (rating);
+
+CREATE TABLE product_sizes (
+    product_id INT NOT NULL,
+    size VARCHAR(20) NOT NULL,
+    PRIMARY KEY (size, product_id),
+    FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE,
+    INDEX idx_product_id (product_id)
+);
+
+-- Backfill from the available_sizes JSON column
+INSERT IGNORE INTO product_sizes (product_id, size)
+SELECT p.id, s.size
+FROM products p,
+     JSON_TABLE(p.available_sizes, '$[*]' COLUMNS (size VARCHAR(20) PATH '$')) s
+WHERE s.size IS NOT NULL AND s.size <> '';
@@ -0,0 +1,42 @@
+USE nandha_garments;
+
+CREATE TABLE dashboard_stats (
+    id TINYINT PRIMARY KEY,
+    business_users INT NOT NULL DEFAULT 0,
+    individual_users INT NOT NULL DEFAULT 0,
+    pending_users INT NOT NULL DEFAULT 0,
+    approved_users INT NOT NULL DEFAULT 0,
+    rejected_users INT NOT NULL DEFAULT 0,
+    blocked_users INT NOT NULL DEFAULT 0,
+    active_products INT NOT NULL DEFAULT 0,
+    total_orders INT NOT NULL DEFAULT 0,
+    pending_orders INT NOT NULL DEFAULT 0,
+    confirmed_orders INT NOT NULL DEFAULT 0,
+    in_progress_orders INT NOT NULL DEFAULT 0,
+    ready_orders INT NOT NULL DEFAULT 0,
+    delivered_orders INT NOT NULL DEFAULT 0,
+    cancelled_orders INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14,2) NOT NULL DEFAULT 0.00,
+    reconciled_at DATETIME NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+-- Seed the counters from the current data; `flask reconcile-stats` recomputes them later
+INSERT INTO dashboard_stats (id, business_users, individual_users, pending_users, approved_users, rejected_users, blocked_users, active_products, total_orders, pending_orders, confirmed_orders, in_progress_orders, ready_orders, delivered_orders, cancelled_orders, revenue, reconciled_at)
+SELECT 1,
+       (SELECT COUNT(*) FROM users WHERE user_type = 'business'),
+       (SELECT COUNT(*) FROM users WHERE user_type = 'individual'),
+       (SELECT COUNT(*) FROM users WHERE status = 'pending'),
+       (SELECT COUNT(*) FROM users WHERE status = 'approved'),
+       (SELECT COUNT(*) FROM users WHERE status = 'rejected'),
+       (SELECT COUNT(*) FROM users WHERE status = 'blocked'),
+       (SELECT COUNT(*) FROM products WHERE status = 'active'),
+       (SELECT COUNT(*) FROM orders),
+       (SELECT COUNT(*) FROM orders WHERE status = 'pending'),
+       (SELECT COUNT(*) FROM orders WHERE status = 'confirmed'),
+       (SELECT COUNT(*) FROM orders WHERE status = 'in_progress'),
+       (SELECT COUNT(*) FROM orders WHERE status = 'ready'),
+       (SELECT COUNT(*) FROM orders WHERE status = 'delivered'),
+       (SELECT COUNT(*) FROM orders WHERE status = 'cancelled'),
+       (SELECT COALESCE(SUM(total_amount), 0) FROM orders),
+       NOW();
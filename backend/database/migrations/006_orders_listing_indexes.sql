@@ -0,0 +1,4 @@
+USE nandha_garments;
+
+ALTER TABLE orders ADD INDEX idx_status_created_at (status, created_at);
+ALTER TABLE orders ADD INDEX idx_user_created_at (user_id, created_at);
@@ -0,0 +1,22 @@
+USE nandha_garments;
+
+CREATE TABLE export_jobs (
+    id CHAR(32) PRIMARY KEY,
+    created_by INT NOT NULL,
+    filters JSON NOT NULL,
+    filters_key CHAR(64) NOT NULL,
+    format VARCHAR(10) NOT NULL,
+    status ENUM('queued', 'running', 'completed', 'failed') DEFAULT 'queued',
+    total_orders INT NULL,
+    processed_orders INT NOT NULL DEFAULT 0,
+    file_name VARCHAR(64) NULL,
+    file_size BIGINT NULL,
+    error TEXT NULL,
+    started_at DATETIME NULL,
+    finished_at DATETIME NULL,
+    expires_at DATETIME NOT NULL,
+    created_at DATETIME NOT NULL,
+    FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE CASCADE,
+    INDEX idx_filters_key_created_at (filters_key, created_at),
+    INDEX idx_expires_at (expires_at)
+);
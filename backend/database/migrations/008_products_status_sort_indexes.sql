@@ -0,0 +1,8 @@
+USE nandha_garments;
+
+-- Catalog and admin listings filter on status and sort by one of these columns
+ALTER TABLE products
+    ADD INDEX idx_status_name (status, name),
+    ADD INDEX idx_status_price (status, selling_price),
+    ADD INDEX idx_status_created_at (status, created_at),
+    DROP INDEX idx_status;
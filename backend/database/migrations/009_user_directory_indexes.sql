@@ -0,0 +1,10 @@
+USE nandha_garments;
+
+-- Empty logos become NULL so list rows can tell "has a logo" without reading the LONGTEXT
+UPDATE business_profiles SET logo = NULL WHERE logo = '';
+
+-- The admin directories filter on user_type (and often status) and page by created_at
+ALTER TABLE users
+    ADD INDEX idx_type_status_created_at (user_type, status, created_at),
+    ADD INDEX idx_type_created_at (user_type, created_at),
+    DROP INDEX idx_user_type;
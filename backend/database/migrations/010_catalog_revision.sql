@@ -0,0 +1,9 @@
+USE nandha_garments;
+
+-- Single-row counter bumped inside every product write; catalog ETags are derived from it
+CREATE TABLE catalog_revision (
+    id TINYINT PRIMARY KEY,
+    revision BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO catalog_revision (id, revision) VALUES (1, 0);
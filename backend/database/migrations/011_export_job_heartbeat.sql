@@ -0,0 +1,6 @@
+USE nandha_garments;
+
+-- Running exports touch heartbeat_at as they progress; running jobs whose
+-- heartbeat is older than EXPORT_JOB_STALE_AFTER are marked failed
+ALTER TABLE export_jobs
+    ADD COLUMN heartbeat_at DATETIME NULL AFTER started_at;
@@ -10,8 +10,9 @@ CREATE TABLE users (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_email (email),
-    INDEX idx_user_type (user_type),
-    INDEX idx_status (status)
+    INDEX idx_status (status),
+    INDEX idx_type_status_created_at (user_type, status, created_at),
+    INDEX idx_type_created_at (user_type, created_at)
 );
 
 CREATE TABLE business_profiles (
@@ -86,9 +87,22 @@ CREATE TABLE products (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_name (name),
-    INDEX idx_status (status),
     INDEX idx_price (selling_price),
-    INDEX idx_created_at (created_at)
+    INDEX idx_rating (rating),
+    INDEX idx_created_at (created_at),
+    INDEX idx_updated_at (updated_at),
+    INDEX idx_status_name (status, name),
+    INDEX idx_status_price (status, selling_price),
+    INDEX idx_status_created_at (status, created_at),
+    FULLTEXT INDEX ft_name_description (name, description)
+);
+
+CREATE TABLE product_sizes (
+    product_id INT NOT NULL,
+    size VARCHAR(20) NOT NULL,
+    PRIMARY KEY (size, product_id),
+    FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE,
+    INDEX idx_product_id (product_id)
 );
 
 CREATE TABLE cart_items (
@@ -122,6 +136,10 @@ CREATE TABLE orders (
     INDEX idx_user_id (user_id),
     INDEX idx_status (status),
     INDEX idx_created_at (created_at),
+    INDEX idx_updated_at (updated_at),
+    INDEX idx_user_updated_at (user_id, updated_at),
+    INDEX idx_status_created_at (status, created_at),
+    INDEX idx_user_created_at (user_id, created_at),
     INDEX idx_measurement_id (measurement_id)
 );
 
@@ -140,6 +158,67 @@ CREATE TABLE order_items (
     INDEX idx_product_id (product_id)
 );
 
+CREATE TABLE refresh_tokens (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    user_id INT NOT NULL,
+    token_hash CHAR(64) NOT NULL,
+    expires_at DATETIME NOT NULL,
+    revoked_at DATETIME NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    UNIQUE KEY unique_token_hash (token_hash),
+    INDEX idx_user_id (user_id),
+    INDEX idx_expires_at (expires_at)
+);
+
+CREATE TABLE dashboard_stats (
+    id TINYINT PRIMARY KEY,
+    business_users INT NOT NULL DEFAULT 0,
+    individual_users INT NOT NULL DEFAULT 0,
+    pending_users INT NOT NULL DEFAULT 0,
+    approved_users INT NOT NULL DEFAULT 0,
+    rejected_users INT NOT NULL DEFAULT 0,
+    blocked_users INT NOT NULL DEFAULT 0,
+    active_products INT NOT NULL DEFAULT 0,
+    total_orders INT NOT NULL DEFAULT 0,
+    pending_orders INT NOT NULL DEFAULT 0,
+    confirmed_orders INT NOT NULL DEFAULT 0,
+    in_progress_orders INT NOT NULL DEFAULT 0,
+    ready_orders INT NOT NULL DEFAULT 0,
+    delivered_orders INT NOT NULL DEFAULT 0,
+    cancelled_orders INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14,2) NOT NULL DEFAULT 0.00,
+    reconciled_at DATETIME NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+CREATE TABLE catalog_revision (
+    id TINYINT PRIMARY KEY,
+    revision BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE export_jobs (
+    id CHAR(32) PRIMARY KEY,
+    created_by INT NOT NULL,
+    filters JSON NOT NULL,
+    filters_key CHAR(64) NOT NULL,
+    format VARCHAR(10) NOT NULL,
+    status ENUM('queued', 'running', 'completed', 'failed') DEFAULT 'queued',
+    total_orders INT NULL,
+    processed_orders INT NOT NULL DEFAULT 0,
+    file_name VARCHAR(64) NULL,
+    file_size BIGINT NULL,
+    error TEXT NULL,
+    started_at DATETIME NULL,
+    heartbeat_at DATETIME NULL,
+    finished_at DATETIME NULL,
+    expires_at DATETIME NOT NULL,
+    created_at DATETIME NOT NULL,
+    FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE CASCADE,
+    INDEX idx_filters_key_created_at (filters_key, created_at),
+    INDEX idx_expires_at (expires_at)
+);
+
 INSERT INTO users (email, password_hash, user_type, status) VALUES 
 ('admin@nandhagarments.com', '$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj/RIY8rN8s6', 'superadmin', 'approved'),
 ('business@company.com', '$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewdBPj/RIY8rN8s6', 'business', 'approved'),
@@ -156,6 +235,11 @@ INSERT INTO products (name, description, price, selling_price, images, available
 ('Formal Pants', 'Comfortable formal pants for office wear', 3000.00, 2500.00, '["data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD//gA7Q1JFQVR"]', '["30", "32", "34", "36", "38"]', '{"material": "Cotton Blend", "care": "Dry clean", "origin": "India"}'),
 ('Casual T-Shirt', 'Comfortable casual t-shirt for everyday wear', 800.00, 600.00, '["data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD//gA7Q1JFQVR"]', '["S", "M", "L", "XL", "XXL"]', '{"material": "Cotton", "care": "Machine washable", "origin": "India"}');
 
+INSERT INTO product_sizes (product_id, size)
+SELECT p.id, s.size
+FROM products p,
+     JSON_TABLE(p.available_sizes, '$[*]' COLUMNS (size VARCHAR(20) PATH '$')) s;
+
 INSERT INTO measurements (user_id, customer_id, name, gender, notes, chest, waist, seat, shirtLength, armLength, neck, hip, poloShirtLength, shoulderWidth, wrist, biceps) VALUES 
 (2, 'CUST001', 'John Customer', 'male', 'Prefers loose fit', 40.0, 34.0, 38.0, 28.0, 24.0, 15.5, 36.0, 26.0, 18.0, 7.0, 14.0),
 (3, NULL, 'My Measurements', 'female', 'Standard fit', 36.0, 28.0, 36.0, 26.0, 22.0, 13.5, 38.0, 24.0, 16.0, 6.5, 12.0);
@@ -167,4 +251,25 @@ INSERT INTO orders (user_id, total_amount, status, delivery_address, measurement
 INSERT INTO order_items (order_id, product_id, product_name, quantity, price, size) VALUES 
 (1, 1, 'Premium Cotton Shirt', 2, 1500.00, 'L'),
 (1, 2, 'Formal Pants', 1, 2500.00, '34'),
-(2, 3, 'Casual T-Shirt', 1, 600.00, 'M');
\ No newline at end of file
+(2, 3, 'Casual T-Shirt', 1, 600.00, 'M');
+
+INSERT INTO dashboard_stats (id, business_users, individual_users, pending_users, approved_users, rejected_users, blocked_users, active_products, total_orders, pending_orders, confirmed_orders, in_progress_orders, ready_orders, delivered_orders, cancelled_orders, revenue, reconciled_at)
+SELECT 1,
+       (SELECT COUNT(*) FROM users WHERE user_type = 'business'),
+       (SELECT COUNT(*) FROM users WHERE user_type = 'individual'),
+       (SELECT COUNT(*) FROM users WHERE status = 'pending'),
+       (SELECT COUNT(*) FROM users WHERE status = 'approved'),
+       (SELECT COUNT(*) FROM users WHERE status = 'rejected'),
+       (SELECT COUNT(*) FROM users WHERE status = 'blocked'),
+       (SELECT COUNT(*) FROM products WHERE status = 'active'),
+       (SELECT COUNT(*) FROM orders),
+       (SELECT COUNT(*) FROM orders WHERE status = 'pending'),
+       (SELECT COUNT(*) FROM orders WHERE status = 'confirmed'),
+       (SELECT COUNT(*) FROM orders WHERE status = 'in_progress'),
+       (SELECT COUNT(*) FROM orders WHERE status = 'ready'),
+       (SELECT COUNT(*) FROM orders WHERE status = 'delivered'),
+       (SELECT COUNT(*) FROM orders WHERE status = 'cancelled'),
+       (SELECT COALESCE(SUM(total_amount), 0) FROM orders),
+       NOW();
+
+INSERT INTO catalog_revision (id, revision) VALUES (1, 0);
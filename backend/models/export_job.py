@@ -0,0 +1,163 @@
+import json
+from datetime import datetime, timedelta
+from utils.database import get_db_connection
+from utils.raw_json import load_json
+
+# Running jobs whose worker has not reported since the cutoff; the process that
+# owned them most likely crashed or restarted. Queued jobs have no heartbeat and
+# may simply be waiting behind other exports, so they are left alone; an orphaned
+# one drops out of dedupe after the dedupe window and is deleted when it expires.
+STALE_JOB_CONDITION = "status = 'running' AND heartbeat_at < %s"
+
+class ExportJob:
+    @staticmethod
+    def create_job(job_id, user_id, filters, filters_key, export_format, ttl):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        now = datetime.utcnow()
+        cursor.execute("""
+            INSERT INTO export_jobs (id, created_by, filters, filters_key, format, expires_at, created_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, (job_id, user_id, json.dumps(filters), filters_key, export_format, now + timedelta(seconds=ttl), now))
+        connection.close()
+        return ExportJob.get_job(job_id)
+    
+    @staticmethod
+    def get_job(job_id):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute(
+            "SELECT * FROM export_jobs WHERE id = %s AND expires_at > UTC_TIMESTAMP()",
+            (job_id,)
+        )
+        job = cursor.fetchone()
+        connection.close()
+        return job
+    
+    @staticmethod
+    def find_recent_job(filters_key, window, stale_after):
+        """Latest unexpired, not failed or stale job for the same filters created in the last ``window`` seconds"""
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        now = datetime.utcnow()
+        cursor.execute(f"""
+            SELECT * FROM export_jobs
+            WHERE filters_key = %s AND created_at >= %s
+              AND status != 'failed' AND expires_at > UTC_TIMESTAMP()
+              AND NOT ({STALE_JOB_CONDITION})
+            ORDER BY created_at DESC
+            LIMIT 1
+        """, (filters_key, now - timedelta(seconds=window), now - timedelta(seconds=stale_after)))
+        job = cursor.fetchone()
+        connection.close()
+        return job
+    
+    @staticmethod
+    def mark_running(job_id, total_orders):
+        """Claim a queued job; False if it is no longer queued"""
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute("""
+            UPDATE export_jobs
+            SET status = 'running', total_orders = %s, started_at = UTC_TIMESTAMP(), heartbeat_at = UTC_TIMESTAMP()
+            WHERE id = %s AND status = 'queued'
+        """, (total_orders, job_id))
+        connection.close()
+        return cursor.rowcount > 0
+    
+    @staticmethod
+    def update_progress(job_id, processed_orders):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute(
+            "UPDATE export_jobs SET processed_orders = %s, heartbeat_at = UTC_TIMESTAMP() WHERE id = %s",
+            (processed_orders, job_id)
+        )
+        connection.close()
+    
+    @staticmethod
+    def mark_completed(job_id, processed_orders, file_name, file_size):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute("""
+            UPDATE export_jobs
+            SET status = 'completed', processed_orders = %s, file_name = %s, file_size = %s,
+                finished_at = UTC_TIMESTAMP()
+            WHERE id = %s
+        """, (processed_orders, file_name, file_size, job_id))
+        connection.close()
+    
+    @staticmethod
+    def mark_failed(job_id, error):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute(
+            "UPDATE export_jobs SET status = 'failed', error = %s, finished_at = UTC_TIMESTAMP() WHERE id = %s",
+            (error, job_id)
+        )
+        connection.close()
+    
+    @staticmethod
+    def fail_stale_jobs(stale_after):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute(f"""
+            UPDATE export_jobs
+            SET status = 'failed', error = 'Export stopped before finishing', finished_at = UTC_TIMESTAMP()
+            WHERE {STALE_JOB_CONDITION}
+        """, (datetime.utcnow() - timedelta(seconds=stale_after),))
+        connection.close()
+        return cursor.rowcount
+    
+    @staticmethod
+    def get_expired_jobs():
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute("SELECT id, file_name FROM export_jobs WHERE expires_at <= UTC_TIMESTAMP()")
+        jobs = cursor.fetchall()
+        connection.close()
+        return jobs
+    
+    @staticmethod
+    def delete_jobs(job_ids):
+        if not job_ids:
+            return 0
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        placeholders = ', '.join(['%s'] * len(job_ids))
+        cursor.execute(f"DELETE FROM export_jobs WHERE id IN ({placeholders})", list(job_ids))
+        connection.close()
+        return cursor.rowcount
+
+def format_export_job(job):
+    """API shape for an export_jobs row"""
+    total = job['total_orders']
+    processed = job['processed_orders']
+    return {
+        'id': job['id'],
+        'status': job['status'],
+        'format': job['format'],
+        'filters': load_json(job['filters']),
+        'progress': {
+            'processedOrders': processed,
+            'totalOrders': total,
+            'percent': 100 if job['status'] == 'completed' else (min(99, processed * 100 // total) if total else 0)
+        },
+        'fileSize': job['file_size'],
+        'error': job['error'],
+        'createdAt': job['created_at'],
+        'startedAt': job['started_at'],
+        'finishedAt': job['finished_at'],
+        'expiresAt': job['expires_at'],
+        'downloadUrl': f"/api/superadmin/exports/{job['id']}/download" if job['status'] == 'completed' else None
+    }
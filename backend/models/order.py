@@ -1,5 +1,77 @@
+from collections import defaultdict
 from utils.database import get_db_connection
 from utils.field_mapping import map_order_to_frontend
+from utils.fields import project
+from models.stats import Stats
+
+# Response field -> column, for ?fields= projections. 'items' is loaded separately.
+ORDER_FIELDS = {
+    'id': 'o.id',
+    'user_id': 'o.user_id',
+    'totalAmount': 'o.total_amount',
+    'status': 'o.status',
+    'deliveryAddress': 'o.delivery_address',
+    'measurementId': 'o.measurement_id',
+    'paymentMethod': 'o.payment_method',
+    'paymentStatus': 'o.payment_status',
+    'createdAt': 'o.created_at',
+    'updatedAt': 'o.updated_at',
+    'items': None
+}
+
+USER_NAME_EXPRESSION = """CASE 
+                   WHEN bp.contact_person_name IS NOT NULL THEN bp.contact_person_name
+                   WHEN ip.name IS NOT NULL THEN ip.name
+                   ELSE 'Unknown User'
+               END as user_name"""
+
+ORDER_USER_FIELDS = {
+    'user_name': USER_NAME_EXPRESSION,
+    'user_email': 'u.email as user_email',
+    'user_type': 'u.user_type'
+}
+
+ALL_ORDER_FIELDS = dict(ORDER_FIELDS, **ORDER_USER_FIELDS)
+
+def _order_columns(fields, field_columns, default='o.*'):
+    if not fields:
+        return default
+    return ', '.join(field_columns[field] for field in fields if field_columns[field])
+
+def _wants_items(fields):
+    return not fields or 'items' in fields
+
+def attach_order_items(cursor, orders):
+    """Load the items of every order in one IN query and group them per order"""
+    if not orders:
+        return
+    
+    order_ids = [order['id'] for order in orders]
+    placeholders = ', '.join(['%s'] * len(order_ids))
+    cursor.execute(f"SELECT * FROM order_items WHERE order_id IN ({placeholders}) ORDER BY id", order_ids)
+    
+    items_by_order = defaultdict(list)
+    for item in cursor.fetchall():
+        items_by_order[item['order_id']].append(item)
+    for order in orders:
+        order['items'] = items_by_order.get(order['id'], [])
+
+def _order_filter_conditions(filters):
+    """WHERE conditions for the superadmin listing; dateTo is inclusive of that whole day"""
+    conditions, params = [], []
+    if filters.get('status'):
+        conditions.append("o.status = %s")
+        params.append(filters['status'])
+    if filters.get('userType'):
+        conditions.append("u.user_type = %s")
+        params.append(filters['userType'])
+    if filters.get('dateFrom'):
+        conditions.append("o.created_at >= %s")
+        params.append(filters['dateFrom'])
+    if filters.get('dateTo'):
+        conditions.append("o.created_at < %s + INTERVAL 1 DAY")
+        params.append(filters['dateTo'])
+    return conditions, params
 
 class Order:
     @staticmethod
@@ -9,73 +81,125 @@ class Order:
         
         total_amount = sum(item['quantity'] * item['price'] for item in items)
         
-        cursor.execute(
-            "INSERT INTO orders (user_id, total_amount, delivery_address, measurement_id) VALUES (%s, %s, %s, %s)",
-            (user_id, total_amount, delivery_address, measurement_id)
-        )
-        
-        order_id = cursor.lastrowid
-        
-        for item in items:
+        connection.begin()
+        try:
             cursor.execute(
+                "INSERT INTO orders (user_id, total_amount, delivery_address, measurement_id) VALUES (%s, %s, %s, %s)",
+                (user_id, total_amount, delivery_address, measurement_id)
+            )
+            
+            order_id = cursor.lastrowid
+            
+            # PyMySQL rewrites executemany INSERT ... VALUES into one multi-row statement
+            cursor.executemany(
                 "INSERT INTO order_items (order_id, product_id, product_name, quantity, price, size) VALUES (%s, %s, %s, %s, %s, %s)",
-                (order_id, item['product_id'], item['product_name'], item['quantity'], item['price'], item['size'])
+                [
+                    (order_id, item['product_id'], item['product_name'], item['quantity'], item['price'], item['size'])
+                    for item in items
+                ]
             )
+            Stats.apply(cursor, {'total_orders': 1, 'pending_orders': 1, 'revenue': round(total_amount, 2)})
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
         
-        connection.close()
         return order_id
     
     @staticmethod
-    def get_orders_by_user(user_id):
+    def get_orders_by_user(user_id, fields=None):
         connection = get_db_connection()
         cursor = connection.cursor()
         
-        cursor.execute("SELECT * FROM orders WHERE user_id = %s ORDER BY created_at DESC", (user_id,))
+        cursor.execute(
+            f"SELECT {_order_columns(fields, ORDER_FIELDS)} FROM orders o WHERE o.user_id = %s ORDER BY o.created_at DESC",
+            (user_id,)
+        )
         orders = cursor.fetchall()
         
-        for order in orders:
-            cursor.execute("SELECT * FROM order_items WHERE order_id = %s", (order['id'],))
-            order['items'] = cursor.fetchall()
+        if _wants_items(fields):
+            attach_order_items(cursor, orders)
         
         connection.close()
-        return [map_order_to_frontend(order) for order in orders]
+        return [project(map_order_to_frontend(order), fields) for order in orders]
     
     @staticmethod
-    def get_all_orders():
+    def get_orders_state(user_id=None):
+        """Fingerprint of a user's orders (or all orders) used as a cache validator.
+        
+        updated_at only has one-second resolution, so the checksum also covers
+        each order's status; two status changes within a second still change it.
+        """
         connection = get_db_connection()
         cursor = connection.cursor()
         
-        query = """
-        SELECT o.*, 
-               CASE 
-                   WHEN bp.contact_person_name IS NOT NULL THEN bp.contact_person_name
-                   WHEN ip.name IS NOT NULL THEN ip.name
-                   ELSE 'Unknown User'
-               END as user_name,
-               u.email as user_email,
-               u.user_type
+        query = (
+            "SELECT COUNT(*) as count, MAX(id) as max_id, "
+            "COALESCE(SUM(CRC32(CONCAT_WS(':', id, status, updated_at))), 0) as checksum FROM orders"
+        )
+        if user_id is None:
+            cursor.execute(query)
+        else:
+            cursor.execute(query + " WHERE user_id = %s", (user_id,))
+        state = cursor.fetchone()
+        connection.close()
+        
+        return f"{state['count']}:{state['max_id'] or 0}:{state['checksum']}"
+    
+    @staticmethod
+    def get_all_orders(filters=None, page=1, limit=20, fields=None):
+        """One page of every user's orders, newest first; returns (orders, total_count)"""
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        conditions, params = _order_filter_conditions(filters or {})
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        # The count only needs users when filtering on user type
+        count_join = "JOIN users u ON o.user_id = u.id" if (filters or {}).get('userType') else ""
+        cursor.execute(f"SELECT COUNT(*) as count FROM orders o {count_join} {where_clause}", params)
+        total_count = cursor.fetchone()['count']
+        
+        default_columns = ', '.join(['o.*'] + list(ORDER_USER_FIELDS.values()))
+        query = f"""
+        SELECT {_order_columns(fields, ALL_ORDER_FIELDS, default_columns)}
         FROM orders o
         JOIN users u ON o.user_id = u.id
         LEFT JOIN business_profiles bp ON u.id = bp.user_id
         LEFT JOIN individual_profiles ip ON u.id = ip.user_id
-        ORDER BY o.created_at DESC
+        {where_clause}
+        ORDER BY o.created_at DESC, o.id DESC
+        LIMIT %s OFFSET %s
         """
         
-        cursor.execute(query)
+        cursor.execute(query, params + [limit, max(page - 1, 0) * limit])
         orders = cursor.fetchall()
         
-        for order in orders:
-            cursor.execute("SELECT * FROM order_items WHERE order_id = %s", (order['id'],))
-            order['items'] = cursor.fetchall()
+        if _wants_items(fields):
+            attach_order_items(cursor, orders)
         
         connection.close()
-        return [map_order_to_frontend(order) for order in orders]
+        return [project(map_order_to_frontend(order), fields) for order in orders], total_count
     
     @staticmethod
     def update_order_status(order_id, status):
         connection = get_db_connection()
         cursor = connection.cursor()
         
-        cursor.execute("UPDATE orders SET status = %s WHERE id = %s", (status, order_id))
-        connection.close()
-        return cursor.rowcount > 0
\ No newline at end of file
+        connection.begin()
+        try:
+            cursor.execute("SELECT status FROM orders WHERE id = %s FOR UPDATE", (order_id,))
+            order = cursor.fetchone()
+            if order:
+                cursor.execute("UPDATE orders SET status = %s WHERE id = %s", (status, order_id))
+                if order['status'] != status:
+                    Stats.apply(cursor, {f"{order['status']}_orders": -1, f'{status}_orders': 1})
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+        return order is not None
\ No newline at end of file
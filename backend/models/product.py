@@ -1,6 +1,194 @@
 import json
-from utils.database import get_db_connection
+import re
+from config import Config
+from utils.catalog_cache import catalog_cache
+from utils.database import escape_like, get_db_connection
 from utils.field_mapping import map_product_to_frontend
+from utils.image_store import store_images
+from utils.image_variants import variant_worker
+from utils.pagination import encode_cursor, decode_cursor
+from utils.fields import project
+from utils.raw_json import raw_json
+from models.stats import Stats
+
+PRODUCT_COLUMNS = """id, name, description, price, selling_price, images, available_sizes,
+    specifications, status, rating, review_count, created_at, updated_at"""
+
+# Response field -> column, for ?fields= projections
+PRODUCT_FIELDS = {
+    'id': 'id',
+    'name': 'name',
+    'description': 'description',
+    'price': 'price',
+    'sellingPrice': 'selling_price',
+    'images': 'images',
+    'availableSizes': 'available_sizes',
+    'specifications': 'specifications',
+    'status': 'status',
+    'rating': 'rating',
+    'reviewCount': 'review_count',
+    'createdAt': 'created_at',
+    'updatedAt': 'updated_at',
+    # First image only, read out of the JSON column so list rows skip the rest of the array
+    'thumbnail': "JSON_UNQUOTE(JSON_EXTRACT(images, '$[0]')) as thumbnail"
+}
+
+PRODUCT_STATUSES = ('active', 'inactive')
+
+# Admin listing rows: enough for the product cards; the editor loads the full product
+ADMIN_PRODUCT_LIST_FIELDS = [
+    'id', 'name', 'description', 'price', 'sellingPrice', 'availableSizes',
+    'status', 'rating', 'reviewCount', 'createdAt', 'updatedAt', 'thumbnail'
+]
+
+# Enough of a product to price an order line
+ORDER_PRODUCT_FIELDS = ['id', 'name', 'sellingPrice']
+
+# (column, direction) per sort option. Each is served by idx_status_name /
+# idx_status_price / idx_status_created_at (or the single-column indexes when no
+# status is filtered), whose entries end in the primary key, so id breaks ties.
+PRODUCT_SORTS = {
+    'name_asc': ('name', 'ASC'),
+    'name_desc': ('name', 'DESC'),
+    'price_asc': ('selling_price', 'ASC'),
+    'price_desc': ('selling_price', 'DESC'),
+    'date_asc': ('created_at', 'ASC'),
+    'date_desc': ('created_at', 'DESC')
+}
+
+DEFAULT_PRODUCT_SORT = 'date_desc'
+
+JSON_COLUMNS = ('images', 'available_sizes', 'specifications')
+
+RELEVANCE_SORT = 'relevance'
+
+RELEVANCE_EXPRESSION = "MATCH(name, description) AGAINST (%s IN BOOLEAN MODE)"
+
+# InnoDB's default full-text stopword list (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD)
+FULLTEXT_STOPWORDS = frozenset((
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for', 'from', 'how', 'i',
+    'in', 'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'what', 'when',
+    'where', 'who', 'will', 'with', 'und', 'www'
+))
+
+def _fulltext_query(search):
+    """Turn free text into a boolean-mode query requiring every word, prefix-matched.
+    
+    Stopwords and words shorter than the index's minimum token size are never
+    indexed, so requiring them would match nothing; they are dropped, and an
+    empty result sends the caller back to the LIKE search.
+    """
+    terms = [
+        term for term in re.findall(r'\w+', search.lower())
+        if len(term) >= Config.FULLTEXT_MIN_TOKEN_SIZE and term not in FULLTEXT_STOPWORDS
+    ][:10]
+    return ' '.join(f'+{term}*' for term in terms)
+
+# Minimum-rating thresholds reported in the rating facet
+RATING_FACETS = (4, 3, 2, 1)
+
+MAX_SIZE_LENGTH = 20
+
+def _search_conditions(search, filters=None, exclude=()):
+    """Return (conditions, params, fulltext_query); fulltext_query is None when not searching ft_name_description.
+    
+    ``filters`` may hold status (default 'active', None for any), minPrice,
+    maxPrice, sizes and minRating. Facets named in ``exclude`` are left out so
+    their own counts are not narrowed by the current selection.
+    """
+    filters = filters or {}
+    conditions = []
+    params = []
+    fulltext_query = None
+    
+    status = filters.get('status', 'active')
+    if status and 'status' not in exclude:
+        conditions.append("status = %s")
+        params.append(status)
+    
+    if search:
+        if Config.PRODUCT_FULLTEXT_SEARCH:
+            fulltext_query = _fulltext_query(search) or None
+        if fulltext_query:
+            conditions.append(RELEVANCE_EXPRESSION)
+            params.append(fulltext_query)
+        else:
+            pattern = '%' + escape_like(search) + '%'
+            conditions.append("(name LIKE %s OR description LIKE %s)")
+            params.extend([pattern, pattern])
+    
+    if 'price' not in exclude:
+        if filters.get('minPrice') is not None:
+            conditions.append("selling_price >= %s")
+            params.append(filters['minPrice'])
+        if filters.get('maxPrice') is not None:
+            conditions.append("selling_price <= %s")
+            params.append(filters['maxPrice'])
+    
+    if filters.get('minRating') is not None and 'rating' not in exclude:
+        conditions.append("rating >= %s")
+        params.append(filters['minRating'])
+    
+    sizes = filters.get('sizes')
+    if sizes and 'sizes' not in exclude:
+        # Resolved through product_sizes' (size, product_id) key rather than the JSON column
+        placeholders = ', '.join(['%s'] * len(sizes))
+        conditions.append(f"id IN (SELECT product_id FROM product_sizes WHERE size IN ({placeholders}))")
+        params.extend(sizes)
+    
+    if not conditions:
+        conditions.append("1 = 1")
+    return conditions, params, fulltext_query
+
+def _normalize_sizes(sizes):
+    normalized = []
+    for size in sizes or []:
+        size = str(size).strip()[:MAX_SIZE_LENGTH]
+        if size and size not in normalized:
+            normalized.append(size)
+    return normalized
+
+def _save_sizes(cursor, product_id, sizes):
+    """Mirror available_sizes into product_sizes, which the size filter and facet read"""
+    cursor.execute("DELETE FROM product_sizes WHERE product_id = %s", (product_id,))
+    if sizes:
+        cursor.executemany(
+            "INSERT INTO product_sizes (product_id, size) VALUES (%s, %s)",
+            [(product_id, size) for size in sizes]
+        )
+
+def _sort_spec(sort_by, fulltext_query):
+    """Return (sort option, key expression, result column, direction) for a requested sort"""
+    if sort_by == RELEVANCE_SORT and fulltext_query:
+        return RELEVANCE_SORT, RELEVANCE_EXPRESSION, 'relevance', 'DESC'
+    if sort_by not in PRODUCT_SORTS:
+        sort_by = DEFAULT_PRODUCT_SORT
+    column, direction = PRODUCT_SORTS[sort_by]
+    return sort_by, column, column, direction
+
+def _columns_for(fields, extra=()):
+    if not fields:
+        return PRODUCT_COLUMNS
+    columns = [PRODUCT_FIELDS[field] for field in fields]
+    columns.extend(column for column in extra if column not in columns)
+    return ', '.join(columns)
+
+def _select_clause(fulltext_query, columns=PRODUCT_COLUMNS):
+    if fulltext_query:
+        return f"SELECT {columns}, {RELEVANCE_EXPRESSION} as relevance", [fulltext_query]
+    return f"SELECT {columns}", []
+
+def bump_catalog_revision(cursor):
+    """Advance the catalog revision; call inside the transaction that writes products"""
+    cursor.execute("UPDATE catalog_revision SET revision = revision + 1 WHERE id = 1")
+
+def _wrap_json_columns(product):
+    """Pass JSON columns through as pre-encoded fragments instead of decoding them"""
+    product.pop('relevance', None)
+    for column in JSON_COLUMNS:
+        if product.get(column):
+            product[column] = raw_json(product[column])
+    return product
 
 class Product:
     @staticmethod
@@ -13,85 +201,210 @@ class Product:
         VALUES (%s, %s, %s, %s, %s, %s, %s)
         """
         
+        images = store_images(data.get('images', []))
+        sizes = _normalize_sizes(data.get('available_sizes', []))
         values = (
             data.get('name'), data.get('description'), data.get('price'),
-            data.get('selling_price'), json.dumps(data.get('images', [])),
-            json.dumps(data.get('available_sizes', [])), json.dumps(data.get('specifications', {}))
+            data.get('selling_price'), json.dumps(images),
+            json.dumps(sizes), json.dumps(data.get('specifications', {}))
         )
         
-        cursor.execute(query, values)
-        product_id = cursor.lastrowid
-        connection.close()
+        connection.begin()
+        try:
+            cursor.execute(query, values)
+            product_id = cursor.lastrowid
+            _save_sizes(cursor, product_id, sizes)
+            Stats.apply(cursor, {'active_products': 1})
+            bump_catalog_revision(cursor)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+        
+        catalog_cache.bump()
+        variant_worker.schedule(images)
         return product_id
     
     @staticmethod
-    def get_products(search=None, sort_by='created_at', sort_order='DESC', page=1, limit=12):
+    def get_products(search=None, sort_by='created_at', sort_order='DESC', page=1, limit=12, fields=None, filters=None):
         connection = get_db_connection()
         cursor = connection.cursor()
         
-        cursor.execute("SELECT * FROM products WHERE status = 'active'")
-        all_products = cursor.fetchall()
-        
-        for product in all_products:
-            if product['images']:
-                product['images'] = json.loads(product['images'])
-            if product['available_sizes']:
-                product['available_sizes'] = json.loads(product['available_sizes'])
-            if product['specifications']:
-                product['specifications'] = json.loads(product['specifications'])
-        
-        filtered_products = all_products
-        if search:
-            search_lower = search.lower()
-            filtered_products = [
-                product for product in all_products 
-                if (search_lower in product['name'].lower() if product['name'] else False) or 
-                (search_lower in product['description'].lower() if product['description'] else False)
-            ]
+        conditions, params, fulltext_query = _search_conditions(search, filters)
+        sort_by, _, order_column, direction = _sort_spec(sort_by, fulltext_query)
+        where_clause = " AND ".join(conditions)
         
-        sort_mapping = {
-            'name_asc': ('name', False),
-            'name_desc': ('name', True),
-            'price_asc': ('selling_price', False),
-            'price_desc': ('selling_price', True),
-            'date_asc': ('created_at', False),
-            'date_desc': ('created_at', True)
-        }
-        
-        if sort_by in sort_mapping:
-            sort_key, reverse = sort_mapping[sort_by]
-            filtered_products.sort(key=lambda x: x[sort_key] if x[sort_key] is not None else '', reverse=reverse)
-        else:
-            filtered_products.sort(key=lambda x: x['created_at'] if x['created_at'] is not None else '', reverse=True)
+        cursor.execute(f"SELECT COUNT(*) as count FROM products WHERE {where_clause}", params)
+        total_count = cursor.fetchone()['count']
+        
+        select_clause, select_params = _select_clause(fulltext_query, _columns_for(fields))
+        cursor.execute(
+            f"{select_clause} FROM products WHERE {where_clause} "
+            f"ORDER BY {order_column} {direction}, id {direction} LIMIT %s OFFSET %s",
+            select_params + params + [limit, max(page - 1, 0) * limit]
+        )
+        products = cursor.fetchall()
+        connection.close()
         
-        total_count = len(filtered_products)
+        return [project(map_product_to_frontend(_wrap_json_columns(product)), fields) for product in products], total_count
+    
+    @staticmethod
+    def get_products_page(search=None, sort_by=DEFAULT_PRODUCT_SORT, cursor=None, limit=12, include_total=False,
+                          fields=None, filters=None):
+        """Keyset pagination: seek past the cursor position instead of skipping OFFSET rows"""
+        conditions, params, fulltext_query = _search_conditions(search, filters)
+        sort_by, key_expression, order_column, direction = _sort_spec(sort_by, fulltext_query)
+        total_count = None
         
-        start_index = (page - 1) * limit
-        end_index = start_index + limit
-        paginated_products = filtered_products[start_index:end_index]
+        connection = get_db_connection()
+        db_cursor = connection.cursor()
         
+        if include_total:
+            db_cursor.execute(f"SELECT COUNT(*) as count FROM products WHERE {' AND '.join(conditions)}", params)
+            total_count = db_cursor.fetchone()['count']
+        
+        if cursor:
+            key, last_id = decode_cursor(cursor, sort_by)
+            comparison = '>' if direction == 'ASC' else '<'
+            conditions.append(f"({key_expression}, id) {comparison} (%s, %s)")
+            if order_column == 'relevance':
+                params.append(fulltext_query)
+            params.extend([key, last_id])
+        
+        # The sort key must be read back to build nextCursor even if not requested
+        extra_columns = () if order_column == 'relevance' else (order_column,)
+        select_clause, select_params = _select_clause(fulltext_query, _columns_for(fields, extra_columns))
+        db_cursor.execute(
+            f"{select_clause} FROM products WHERE {' AND '.join(conditions)} "
+            f"ORDER BY {order_column} {direction}, id {direction} LIMIT %s",
+            select_params + params + [limit + 1]
+        )
+        products = db_cursor.fetchall()
         connection.close()
-        return [map_product_to_frontend(product) for product in paginated_products], total_count
         
+        next_cursor = None
+        if len(products) > limit:
+            products = products[:limit]
+            last = products[-1]
+            next_cursor = encode_cursor(sort_by, last[order_column], last['id'])
+        
+        products = [project(map_product_to_frontend(_wrap_json_columns(product)), fields) for product in products]
+        return products, next_cursor, total_count
+    
+    @staticmethod
+    def get_product_facets(search=None, filters=None, facets=('sizes', 'rating', 'price')):
+        """Counts for each facet under the search and every other active filter"""
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        result = {}
+        
+        if 'sizes' in facets:
+            conditions, params, _ = _search_conditions(search, filters, exclude=('sizes',))
+            cursor.execute(
+                f"SELECT size, COUNT(*) as count FROM product_sizes "
+                f"WHERE product_id IN (SELECT id FROM products WHERE {' AND '.join(conditions)}) "
+                f"GROUP BY size ORDER BY size",
+                params
+            )
+            result['sizes'] = [{'value': row['size'], 'count': row['count']} for row in cursor.fetchall()]
+        
+        if 'rating' in facets:
+            conditions, params, _ = _search_conditions(search, filters, exclude=('rating',))
+            thresholds = ', '.join(f"SUM(rating >= {threshold}) as r{threshold}" for threshold in RATING_FACETS)
+            cursor.execute(f"SELECT {thresholds} FROM products WHERE {' AND '.join(conditions)}", params)
+            row = cursor.fetchone()
+            result['rating'] = [
+                {'minRating': threshold, 'count': int(row[f'r{threshold}'] or 0)}
+                for threshold in RATING_FACETS
+            ]
+        
+        if 'price' in facets:
+            conditions, params, _ = _search_conditions(search, filters, exclude=('price',))
+            cursor.execute(
+                f"SELECT MIN(selling_price) as min_price, MAX(selling_price) as max_price "
+                f"FROM products WHERE {' AND '.join(conditions)}",
+                params
+            )
+            row = cursor.fetchone()
+            result['price'] = {'min': row['min_price'], 'max': row['max_price']}
+        
+        if 'status' in facets:
+            conditions, params, _ = _search_conditions(search, filters, exclude=('status',))
+            cursor.execute(
+                f"SELECT status, COUNT(*) as count FROM products WHERE {' AND '.join(conditions)} GROUP BY status",
+                params
+            )
+            result['status'] = [{'value': row['status'], 'count': row['count']} for row in cursor.fetchall()]
+        
+        connection.close()
+        return result
+    
     @staticmethod
     def get_product_by_id(product_id):
         connection = get_db_connection()
         cursor = connection.cursor()
         
-        cursor.execute("SELECT * FROM products WHERE id = %s", (product_id,))
+        cursor.execute(f"SELECT {PRODUCT_COLUMNS} FROM products WHERE id = %s", (product_id,))
         product = cursor.fetchone()
+        connection.close()
         
         if product:
-            if product['images']:
-                product['images'] = json.loads(product['images'])
-            if product['available_sizes']:
-                product['available_sizes'] = json.loads(product['available_sizes'])
-            if product['specifications']:
-                product['specifications'] = json.loads(product['specifications'])
-            return map_product_to_frontend(product)
+            return map_product_to_frontend(_wrap_json_columns(product))
+        return None
+    
+    @staticmethod
+    def get_catalog_state():
+        """Fingerprint that changes whenever a product is added, edited or removed.
         
+        The revision is incremented by every product write in its own
+        transaction, so edits within the same second still change it; the
+        table aggregates only catch writes made outside the app.
+        """
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute("""
+            SELECT (SELECT revision FROM catalog_revision WHERE id = 1) as revision,
+                   COUNT(*) as count, MAX(id) as max_id, MAX(updated_at) as updated_at
+            FROM products
+        """)
+        state = cursor.fetchone()
         connection.close()
-        return None
+        
+        updated_at = state['updated_at'].isoformat() if state['updated_at'] else ''
+        return f"{state['revision'] or 0}:{state['count']}:{state['max_id'] or 0}:{updated_at}"
+    
+    @staticmethod
+    def get_products_by_ids(product_ids, fields=None):
+        """Resolve many products in one primary-key lookup.
+        
+        Returns (products, missing_ids): products follow the order of
+        ``product_ids`` with duplicates collapsed, and missing_ids lists the
+        requested IDs that do not exist.
+        """
+        product_ids = list(dict.fromkeys(int(product_id) for product_id in product_ids))
+        if not product_ids:
+            return [], []
+        
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        placeholders = ', '.join(['%s'] * len(product_ids))
+        cursor.execute(
+            f"SELECT {_columns_for(fields)} FROM products WHERE id IN ({placeholders})",
+            product_ids
+        )
+        rows = {row['id']: row for row in cursor.fetchall()}
+        connection.close()
+        
+        products = [
+            project(map_product_to_frontend(_wrap_json_columns(rows[product_id])), fields)
+            for product_id in product_ids if product_id in rows
+        ]
+        missing_ids = [product_id for product_id in product_ids if product_id not in rows]
+        return products, missing_ids
     
     @staticmethod
     def update_product(product_id, data):
@@ -103,22 +416,53 @@ class Product:
         images = %s, available_sizes = %s, specifications = %s WHERE id = %s
         """
         
+        images = store_images(data.get('images', []))
+        sizes = _normalize_sizes(data.get('available_sizes', []))
         values = (
             data.get('name'), data.get('description'), data.get('price'),
-            data.get('selling_price'), json.dumps(data.get('images', [])),
-            json.dumps(data.get('available_sizes', [])), json.dumps(data.get('specifications', {})),
+            data.get('selling_price'), json.dumps(images),
+            json.dumps(sizes), json.dumps(data.get('specifications', {})),
             product_id
         )
         
-        cursor.execute(query, values)
-        connection.close()
-        return cursor.rowcount > 0
+        connection.begin()
+        try:
+            cursor.execute(query, values)
+            updated = cursor.rowcount > 0
+            if updated:
+                _save_sizes(cursor, product_id, sizes)
+                bump_catalog_revision(cursor)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+        
+        catalog_cache.bump()
+        variant_worker.schedule(images)
+        return updated
     
     @staticmethod
     def delete_product(product_id):
         connection = get_db_connection()
         cursor = connection.cursor()
         
-        cursor.execute("DELETE FROM products WHERE id = %s", (product_id,))
-        connection.close()
-        return cursor.rowcount > 0
\ No newline at end of file
+        connection.begin()
+        try:
+            cursor.execute("SELECT status FROM products WHERE id = %s FOR UPDATE", (product_id,))
+            product = cursor.fetchone()
+            if product:
+                cursor.execute("DELETE FROM products WHERE id = %s", (product_id,))
+                if product['status'] == 'active':
+                    Stats.apply(cursor, {'active_products': -1})
+                bump_catalog_revision(cursor)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+        
+        catalog_cache.bump()
+        return product is not None
\ No newline at end of file
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+from config import Config
+from utils.database import get_db_connection
+from utils.tokens import generate_refresh_token, hash_refresh_token
+
+class RefreshToken:
+    @staticmethod
+    def create_token(user_id):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        token = generate_refresh_token()
+        expires_at = datetime.utcnow() + timedelta(days=Config.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+        
+        cursor.execute(
+            "INSERT INTO refresh_tokens (user_id, token_hash, expires_at) VALUES (%s, %s, %s)",
+            (user_id, hash_refresh_token(token), expires_at)
+        )
+        connection.close()
+        return token
+    
+    @staticmethod
+    def get_token_user(token):
+        """Return the current users row for an unexpired, unrevoked refresh token"""
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute("""
+            SELECT rt.id as token_id, u.id, u.email, u.user_type, u.status
+            FROM refresh_tokens rt
+            JOIN users u ON rt.user_id = u.id
+            WHERE rt.token_hash = %s AND rt.revoked_at IS NULL AND rt.expires_at > UTC_TIMESTAMP()
+        """, (hash_refresh_token(token),))
+        user = cursor.fetchone()
+        connection.close()
+        return user
+    
+    @staticmethod
+    def revoke_token(token_id):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute(
+            "UPDATE refresh_tokens SET revoked_at = UTC_TIMESTAMP() WHERE id = %s AND revoked_at IS NULL",
+            (token_id,)
+        )
+        connection.close()
+        return cursor.rowcount > 0
+    
+    @staticmethod
+    def revoke_user_tokens(user_id):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute(
+            "UPDATE refresh_tokens SET revoked_at = UTC_TIMESTAMP() WHERE user_id = %s AND revoked_at IS NULL",
+            (user_id,)
+        )
+        connection.close()
+        return cursor.rowcount
@@ -0,0 +1,97 @@
+from decimal import Decimal
+from utils.database import get_db_connection
+
+USER_TYPES = ('business', 'individual')
+USER_STATUSES = ('pending', 'approved', 'rejected', 'blocked')
+ORDER_STATUSES = ('pending', 'confirmed', 'in_progress', 'ready', 'delivered', 'cancelled')
+
+# Counter column -> aggregate it mirrors; reconcile() recomputes every column from these
+COUNTER_QUERIES = {
+    **{f'{user_type}_users': f"SELECT COUNT(*) FROM users WHERE user_type = '{user_type}'" for user_type in USER_TYPES},
+    **{f'{status}_users': f"SELECT COUNT(*) FROM users WHERE status = '{status}'" for status in USER_STATUSES},
+    'active_products': "SELECT COUNT(*) FROM products WHERE status = 'active'",
+    'total_orders': "SELECT COUNT(*) FROM orders",
+    **{f'{status}_orders': f"SELECT COUNT(*) FROM orders WHERE status = '{status}'" for status in ORDER_STATUSES},
+    'revenue': "SELECT COALESCE(SUM(total_amount), 0) FROM orders"
+}
+
+STATS_ROW_ID = 1
+
+def user_deltas(user_type, status, sign=1):
+    deltas = {f'{status}_users': sign}
+    if user_type in USER_TYPES:
+        deltas[f'{user_type}_users'] = sign
+    return deltas
+
+class Stats:
+    """Single-row counters behind the superadmin dashboard.
+    
+    Writers call ``apply`` with their own cursor inside the transaction that
+    changes the underlying rows, so counters commit or roll back with them.
+    ``reconcile`` recomputes everything from the source tables to repair drift.
+    """
+    
+    @staticmethod
+    def apply(cursor, deltas):
+        deltas = {column: delta for column, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        unknown = set(deltas) - set(COUNTER_QUERIES)
+        if unknown:
+            raise ValueError(f"Unknown counters: {', '.join(sorted(unknown))}")
+        
+        assignments = ', '.join(f"{column} = {column} + %s" for column in deltas)
+        cursor.execute(
+            f"UPDATE dashboard_stats SET {assignments} WHERE id = %s",
+            list(deltas.values()) + [STATS_ROW_ID]
+        )
+    
+    @staticmethod
+    def get_counters():
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute("SELECT * FROM dashboard_stats WHERE id = %s", (STATS_ROW_ID,))
+        counters = cursor.fetchone()
+        connection.close()
+        return counters
+    
+    @staticmethod
+    def reconcile():
+        """Rewrite the counters from the source tables; return {column: (stored, actual)} for any that drifted"""
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        columns = list(COUNTER_QUERIES)
+        connection.begin()
+        try:
+            # Lock the counters row first so concurrent writers queue behind the recount
+            cursor.execute("SELECT * FROM dashboard_stats WHERE id = %s FOR UPDATE", (STATS_ROW_ID,))
+            stored = cursor.fetchone()
+            
+            cursor.execute(
+                "SELECT " + ', '.join(f"({query}) as {column}" for column, query in COUNTER_QUERIES.items())
+            )
+            actual = cursor.fetchone()
+            
+            cursor.execute(
+                f"INSERT INTO dashboard_stats (id, {', '.join(columns)}, reconciled_at) "
+                f"VALUES (%s, {', '.join(['%s'] * len(columns))}, NOW()) "
+                f"ON DUPLICATE KEY UPDATE {', '.join(f'{column} = VALUES({column})' for column in columns)}, "
+                f"reconciled_at = VALUES(reconciled_at)",
+                [STATS_ROW_ID] + [actual[column] for column in columns]
+            )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+        
+        if stored is None:
+            return {column: (None, actual[column]) for column in columns}
+        return {
+            column: (stored[column], actual[column])
+            for column in columns
+            if Decimal(stored[column]) != Decimal(actual[column])
+        }
@@ -1,4 +1,102 @@
-from utils.database import get_db_connection
+from config import Config
+from utils.cache import TTLCache
+from utils.database import escape_like, get_db_connection
+from utils.field_mapping import map_business_profile_to_frontend, map_individual_profile_to_frontend
+from utils.fields import project
+from utils.image_store import CONTENT_TYPE_EXTENSIONS
+from models.stats import Stats, user_deltas
+
+# Columns require_auth needs, keyed by user_id. Entries are dropped explicitly
+# on status changes; the TTL bounds staleness for writes made by other workers.
+auth_user_cache = TTLCache(Config.AUTH_CACHE_SIZE, Config.AUTH_CACHE_TTL)
+
+# Response field -> column for the superadmin user directories (?fields=)
+BUSINESS_USER_FIELDS = {
+    'id': 'u.id',
+    'email': 'u.email',
+    'status': 'u.status',
+    'createdAt': 'u.created_at',
+    'legalEntityName': 'bp.legal_entity_name',
+    'contactPersonName': 'bp.contact_person_name',
+    'contactNumber': 'bp.contact_number',
+    'gst': 'bp.gst_number',
+    'pan': 'bp.pan_number',
+    'address': 'bp.address',
+    # Raster data URL logos are served by /superadmin/users/<id>/logo; http(s) URLs
+    # are returned as they are and anything else is not linked at all
+    'logoUrl': (
+        "CASE WHEN "
+        + ' OR '.join(f"bp.logo LIKE 'data:{content_type};base64,%%'" for content_type in CONTENT_TYPE_EXTENSIONS)
+        + " THEN CONCAT('/api/superadmin/users/', u.id, '/logo') "
+        "WHEN bp.logo LIKE 'http://%%' OR bp.logo LIKE 'https://%%' THEN bp.logo "
+        "ELSE NULL END as logoUrl"
+    )
+}
+
+INDIVIDUAL_USER_FIELDS = {
+    'id': 'u.id',
+    'email': 'u.email',
+    'status': 'u.status',
+    'createdAt': 'u.created_at',
+    'name': 'ip.name',
+    'contactNumber': 'ip.contact_number',
+    'address': 'ip.address'
+}
+
+# Per user type: profile join, field columns, the column that marks a profile as present,
+# the name sort column and the columns ?search= matches
+USER_DIRECTORIES = {
+    'business': {
+        'join': 'LEFT JOIN business_profiles bp ON u.id = bp.user_id',
+        'fields': BUSINESS_USER_FIELDS,
+        'marker': 'bp.legal_entity_name',
+        'name_column': 'bp.legal_entity_name',
+        'search_columns': ('u.email', 'bp.legal_entity_name', 'bp.contact_person_name', 'bp.gst_number'),
+        'mapper': map_business_profile_to_frontend
+    },
+    'individual': {
+        'join': 'LEFT JOIN individual_profiles ip ON u.id = ip.user_id',
+        'fields': INDIVIDUAL_USER_FIELDS,
+        'marker': 'ip.name',
+        'name_column': 'ip.name',
+        'search_columns': ('u.email', 'ip.name'),
+        'mapper': map_individual_profile_to_frontend
+    }
+}
+
+# ORDER BY per sort option; {name} is the directory's name column. pending_first
+# puts the approval queue at the top, newest first within each group.
+USER_DIRECTORY_SORTS = {
+    'pending_first': "(u.status = 'pending') DESC, u.created_at DESC, u.id DESC",
+    'newest': 'u.created_at DESC, u.id DESC',
+    'oldest': 'u.created_at ASC, u.id ASC',
+    'name': '{name} ASC, u.id ASC'
+}
+
+DEFAULT_USER_DIRECTORY_SORT = 'pending_first'
+
+def _user_columns(fields, field_columns, marker_column):
+    """Columns to select for a projection; the profile marker decides whether profile keys are present"""
+    names = fields or list(field_columns)
+    columns = [field_columns[name] for name in names]
+    if marker_column not in columns:
+        columns.append(marker_column)
+    return ', '.join(columns)
+
+def _map_user_row(user, profile_mapper, marker):
+    mapped_user = {
+        'id': user['id'],
+        'email': user.get('email'),
+        'status': user.get('status'),
+        'createdAt': user.get('created_at')
+    }
+    if user[marker]:
+        profile_data = {
+            key: value for key, value in user.items()
+            if key not in ('id', 'email', 'status', 'created_at')
+        }
+        mapped_user.update(profile_mapper(profile_data))
+    return mapped_user
 
 class User:
     @staticmethod
@@ -6,12 +104,20 @@ class User:
         connection = get_db_connection()
         cursor = connection.cursor()
         
-        cursor.execute(
-            "INSERT INTO users (email, password_hash, user_type, status) VALUES (%s, %s, %s, %s)",
-            (email, password_hash, user_type, status)
-        )
-        user_id = cursor.lastrowid
-        connection.close()
+        connection.begin()
+        try:
+            cursor.execute(
+                "INSERT INTO users (email, password_hash, user_type, status) VALUES (%s, %s, %s, %s)",
+                (email, password_hash, user_type, status)
+            )
+            user_id = cursor.lastrowid
+            Stats.apply(cursor, user_deltas(user_type, status))
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
         return user_id
     
     @staticmethod
@@ -34,11 +140,133 @@ class User:
         connection.close()
         return user
     
+    @staticmethod
+    def get_auth_user(user_id):
+        user = auth_user_cache.get(user_id)
+        if user is not None:
+            return dict(user)
+        
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute("SELECT id, email, user_type, status FROM users WHERE id = %s", (user_id,))
+        user = cursor.fetchone()
+        connection.close()
+        
+        if user:
+            auth_user_cache.set(user_id, user)
+            return dict(user)
+        return None
+    
+    @staticmethod
+    def invalidate_auth_user(user_id):
+        auth_user_cache.invalidate(user_id)
+    
+    @staticmethod
+    def get_auth_cache_stats():
+        return auth_user_cache.stats()
+    
+    @staticmethod
+    def update_password_hash(user_id, password_hash):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute("UPDATE users SET password_hash = %s WHERE id = %s", (password_hash, user_id))
+        connection.close()
+        return cursor.rowcount > 0
+    
     @staticmethod
     def update_user_status(user_id, status):
         connection = get_db_connection()
         cursor = connection.cursor()
         
-        cursor.execute("UPDATE users SET status = %s WHERE id = %s", (status, user_id))
+        connection.begin()
+        try:
+            cursor.execute("SELECT status FROM users WHERE id = %s FOR UPDATE", (user_id,))
+            user = cursor.fetchone()
+            if user:
+                cursor.execute("UPDATE users SET status = %s WHERE id = %s", (status, user_id))
+                if user['status'] != status:
+                    Stats.apply(cursor, {f"{user['status']}_users": -1, f'{status}_users': 1})
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+        User.invalidate_auth_user(user_id)
+        return user is not None
+    
+    @staticmethod
+    def get_user_directory(user_type, fields=None, search=None, status=None, sort_by=DEFAULT_USER_DIRECTORY_SORT,
+                           page=1, limit=20):
+        """One page of business or individual users.
+        
+        Returns (users, total_count, status_counts); status_counts covers the
+        search but not the status filter, so every status tab can show its size.
+        """
+        directory = USER_DIRECTORIES[user_type]
+        conditions = ["u.user_type = %s"]
+        params = [user_type]
+        
+        if search:
+            pattern = '%' + escape_like(search) + '%'
+            conditions.append('(' + ' OR '.join(f"{column} LIKE %s" for column in directory['search_columns']) + ')')
+            params.extend([pattern] * len(directory['search_columns']))
+        
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        # The profile join only matters for the count when searching profile columns
+        cursor.execute(
+            f"SELECT u.status, COUNT(*) as count FROM users u {directory['join'] if search else ''} "
+            f"WHERE {' AND '.join(conditions)} GROUP BY u.status",
+            params
+        )
+        status_counts = {row['status']: row['count'] for row in cursor.fetchall()}
+        
+        if status:
+            conditions.append("u.status = %s")
+            params.append(status)
+            total_count = status_counts.get(status, 0)
+        else:
+            total_count = sum(status_counts.values())
+        
+        order_by = USER_DIRECTORY_SORTS.get(sort_by, USER_DIRECTORY_SORTS[DEFAULT_USER_DIRECTORY_SORT])
+        columns = _user_columns(fields, directory['fields'], directory['marker'])
+        cursor.execute(
+            f"SELECT {columns} FROM users u {directory['join']} "
+            f"WHERE {' AND '.join(conditions)} "
+            f"ORDER BY {order_by.format(name=directory['name_column'])} LIMIT %s OFFSET %s",
+            params + [limit, max(page - 1, 0) * limit]
+        )
+        users = cursor.fetchall()
+        connection.close()
+        
+        marker = directory['marker'].split('.')[1]
+        users = [project(_map_user_row(user, directory['mapper'], marker), fields) for user in users]
+        return users, total_count, status_counts
+    
+    @staticmethod
+    def get_business_logo_state(user_id):
+        """Cheap validator for a business logo: (has_logo, profile updated_at), or None without a profile"""
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute(
+            "SELECT logo IS NOT NULL as has_logo, updated_at FROM business_profiles WHERE user_id = %s",
+            (user_id,)
+        )
+        state = cursor.fetchone()
+        connection.close()
+        return state
+    
+    @staticmethod
+    def get_business_logo(user_id):
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        
+        cursor.execute("SELECT logo FROM business_profiles WHERE user_id = %s", (user_id,))
+        profile = cursor.fetchone()
         connection.close()
-        return cursor.rowcount > 0
\ No newline at end of file
+        return profile['logo'] if profile else None
\ No newline at end of file
@@ -1,16 +1,27 @@
 from flask import Blueprint, request, jsonify
-import bcrypt
-import jwt
-from datetime import datetime, timedelta
-from config import Config
 from models.user import User
+from models.refresh_token import RefreshToken
 from utils.database import get_db_connection
 from utils.validators import validate_email, validate_gst, validate_pan, validate_phone
 from utils.field_mapping import map_business_profile_to_frontend, map_individual_profile_to_frontend
+from utils.tokens import issue_access_token
+from utils.rate_limit import limit_login_attempts
+from utils.passwords import PasswordHasherBusy, hash_password, check_password, needs_rehash, rehash_in_background
 
 auth_bp = Blueprint('auth', __name__)
 
+@auth_bp.errorhandler(PasswordHasherBusy)
+def password_hasher_busy(error):
+    response = jsonify({
+        'success': False,
+        'message': 'Server is busy',
+        'error': 'Too many login attempts in progress, please retry shortly'
+    })
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
 @auth_bp.route('/auth/superadmin/login', methods=['POST'])
+@limit_login_attempts
 def superadmin_login():
     data = request.get_json()
     email = data.get('email')
@@ -31,25 +42,25 @@ def superadmin_login():
             'error': 'Email or password is incorrect'
         }), 401
     
-    if not bcrypt.checkpw(password.encode('utf-8'), user['password_hash'].encode('utf-8')):
+    if not check_password(password, user['password_hash']):
         return jsonify({
             'success': False,
             'message': 'Invalid credentials',
             'error': 'Email or password is incorrect'
         }), 401
     
-    token = jwt.encode({
-        'user_id': user['id'],
-        'email': user['email'],
-        'user_type': user['user_type'],
-        'exp': datetime.utcnow() + timedelta(hours=Config.JWT_ACCESS_TOKEN_EXPIRE_HOURS)
-    }, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+    if needs_rehash(user['password_hash']):
+        rehash_in_background(user['id'], password, User.update_password_hash)
+    
+    token = issue_access_token(user)
+    refresh_token = RefreshToken.create_token(user['id'])
     
     return jsonify({
         'success': True,
         'message': 'Login successful',
         'data': {
             'token': token,
+            'refreshToken': refresh_token,
             'user': {
                 'id': user['id'],
                 'email': user['email'],
@@ -59,7 +70,51 @@ def superadmin_login():
         }
     })
 
+@auth_bp.route('/auth/refresh', methods=['POST'])
+def refresh():
+    data = request.get_json() or {}
+    refresh_token = data.get('refreshToken')
+    
+    if not refresh_token:
+        return jsonify({
+            'success': False,
+            'message': 'Refresh token is required',
+            'error': 'Missing refresh token'
+        }), 400
+    
+    user = RefreshToken.get_token_user(refresh_token)
+    if not user:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid refresh token',
+            'error': 'Please login again'
+        }), 401
+    
+    # Rotate on every use so a leaked refresh token is only good once
+    if not RefreshToken.revoke_token(user['token_id']):
+        return jsonify({
+            'success': False,
+            'message': 'Invalid refresh token',
+            'error': 'Please login again'
+        }), 401
+    
+    if user['status'] != 'approved':
+        return jsonify({
+            'success': False,
+            'message': 'Account not approved',
+            'error': 'Your account status does not allow access'
+        }), 403
+    
+    return jsonify({
+        'success': True,
+        'data': {
+            'token': issue_access_token(user),
+            'refreshToken': RefreshToken.create_token(user['id'])
+        }
+    })
+
 @auth_bp.route('/auth/business/login', methods=['POST'])
+@limit_login_attempts
 def business_login():
     data = request.get_json()
     email = data.get('email')
@@ -87,25 +142,24 @@ def business_login():
             'error': 'Your account is pending approval from administrator'
         }), 403
     
-    if not bcrypt.checkpw(password.encode('utf-8'), user['password_hash'].encode('utf-8')):
+    if not check_password(password, user['password_hash']):
         return jsonify({
             'success': False,
             'message': 'Invalid credentials',
             'error': 'Email or password is incorrect'
         }), 401
     
+    if needs_rehash(user['password_hash']):
+        rehash_in_background(user['id'], password, User.update_password_hash)
+    
     connection = get_db_connection()
     cursor = connection.cursor()
     cursor.execute("SELECT * FROM business_profiles WHERE user_id = %s", (user['id'],))
     profile = cursor.fetchone()
     connection.close()
     
-    token = jwt.encode({
-        'user_id': user['id'],
-        'email': user['email'],
-        'user_type': user['user_type'],
-        'exp': datetime.utcnow() + timedelta(hours=Config.JWT_ACCESS_TOKEN_EXPIRE_HOURS)
-    }, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+    token = issue_access_token(user)
+    refresh_token = RefreshToken.create_token(user['id'])
     
     mapped_profile = map_business_profile_to_frontend(profile) if profile else {}
     
@@ -114,6 +168,7 @@ def business_login():
         'message': 'Login successful',
         'data': {
             'token': token,
+            'refreshToken': refresh_token,
             'user': {
                 'id': user['id'],
                 'email': user['email'],
@@ -174,16 +229,16 @@ def business_signup():
             'error': 'User with this email already registered'
         }), 400
     
-    password_hash = bcrypt.hashpw(data['password'].encode('utf-8'), bcrypt.gensalt(rounds=Config.BCRYPT_ROUNDS))
+    password_hash = hash_password(data['password'])
     
     try:
-        user_id = User.create_user(data['email'], password_hash.decode('utf-8'), 'business', 'pending')
+        user_id = User.create_user(data['email'], password_hash, 'business', 'pending')
         
         connection = get_db_connection()
         cursor = connection.cursor()
         cursor.execute(
             "INSERT INTO business_profiles (user_id, legal_entity_name, gst_number, pan_number, address, contact_person_name, contact_number, logo) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
-            (user_id, data['legalEntityName'], data['gst'], data['pan'], data['address'], data['contactPersonName'], data['contactNumber'], data.get('logo'))
+            (user_id, data['legalEntityName'], data['gst'], data['pan'], data['address'], data['contactPersonName'], data['contactNumber'], data.get('logo') or None)
         )
         connection.close()
         
@@ -204,6 +259,7 @@ def business_signup():
         }), 500
 
 @auth_bp.route('/auth/individual/login', methods=['POST'])
+@limit_login_attempts
 def individual_login():
     data = request.get_json()
     email = data.get('email')
@@ -224,25 +280,24 @@ def individual_login():
             'error': 'Email or password is incorrect'
         }), 401
     
-    if not bcrypt.checkpw(password.encode('utf-8'), user['password_hash'].encode('utf-8')):
+    if not check_password(password, user['password_hash']):
         return jsonify({
             'success': False,
             'message': 'Invalid credentials',
             'error': 'Email or password is incorrect'
         }), 401
     
+    if needs_rehash(user['password_hash']):
+        rehash_in_background(user['id'], password, User.update_password_hash)
+    
     connection = get_db_connection()
     cursor = connection.cursor()
     cursor.execute("SELECT * FROM individual_profiles WHERE user_id = %s", (user['id'],))
     profile = cursor.fetchone()
     connection.close()
     
-    token = jwt.encode({
-        'user_id': user['id'],
-        'email': user['email'],
-        'user_type': user['user_type'],
-        'exp': datetime.utcnow() + timedelta(hours=Config.JWT_ACCESS_TOKEN_EXPIRE_HOURS)
-    }, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+    token = issue_access_token(user)
+    refresh_token = RefreshToken.create_token(user['id'])
     
     mapped_profile = map_individual_profile_to_frontend(profile) if profile else {}
     
@@ -251,6 +306,7 @@ def individual_login():
         'message': 'Login successful',
         'data': {
             'token': token,
+            'refreshToken': refresh_token,
             'user': {
                 'id': user['id'],
                 'email': user['email'],
@@ -295,10 +351,10 @@ def individual_signup():
             'error': 'User with this email already registered'
         }), 400
     
-    password_hash = bcrypt.hashpw(data['password'].encode('utf-8'), bcrypt.gensalt(rounds=Config.BCRYPT_ROUNDS))
+    password_hash = hash_password(data['password'])
     
     try:
-        user_id = User.create_user(data['email'], password_hash.decode('utf-8'), 'individual', 'approved')
+        user_id = User.create_user(data['email'], password_hash, 'individual', 'approved')
         
         connection = get_db_connection()
         cursor = connection.cursor()
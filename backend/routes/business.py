@@ -1,12 +1,21 @@
 from flask import Blueprint, request, jsonify, g
 from utils.auth_middleware import require_auth
 from models.measurement import Measurement
-from models.order import Order
-from models.product import Product
+from models.order import Order, ORDER_FIELDS
+from models.product import Product, ORDER_PRODUCT_FIELDS
 from utils.database import get_db_connection
 from utils.field_mapping import map_measurement_to_backend
+from utils.http_cache import conditional_get, make_etag, set_cache_control
+from utils.fields import InvalidFields, parse_fields
+from utils.validators import validate_product_id
 
 business_bp = Blueprint('business', __name__)
+set_cache_control(business_bp, 'private, no-cache')
+
+def _orders_validator():
+    user_id = g.current_user['id']
+    args = tuple(sorted(request.args.items(multi=True)))
+    return make_etag('orders', user_id, Order.get_orders_state(user_id), args), None
 
 @business_bp.route('/business/dashboard', methods=['GET'])
 @require_auth(['business'])
@@ -166,13 +175,21 @@ def delete_measurement(measurement_id):
 
 @business_bp.route('/business/orders', methods=['GET'])
 @require_auth(['business'])
+@conditional_get(_orders_validator)
 def get_orders():
     try:
-        orders = Order.get_orders_by_user(g.current_user['id'])
+        fields = parse_fields(request.args.get('fields'), ORDER_FIELDS)
+        orders = Order.get_orders_by_user(g.current_user['id'], fields=fields)
         return jsonify({
             'success': True,
             'data': orders
         })
+    except InvalidFields as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid fields',
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -193,13 +210,22 @@ def create_order():
                 'error': 'Missing required fields'
             }), 400
         
-        connection = get_db_connection()
-        cursor = connection.cursor()
+        for item in data['items']:
+            if not validate_product_id(item.get('productId')):
+                return jsonify({
+                    'success': False,
+                    'message': f'Invalid product ID: {item.get("productId")}',
+                    'error': 'Invalid product ID'
+                }), 400
+        
+        products, _ = Product.get_products_by_ids(
+            (item['productId'] for item in data['items']), fields=ORDER_PRODUCT_FIELDS
+        )
+        products = {product['id']: product for product in products}
         
         order_items = []
         for item in data['items']:
-            cursor.execute("SELECT * FROM products WHERE id = %s", (item['productId'],))
-            product = cursor.fetchone()
+            product = products.get(int(item['productId']))
             
             if not product:
                 return jsonify({
@@ -212,12 +238,10 @@ def create_order():
                 'product_id': product['id'],
                 'product_name': product['name'],
                 'quantity': item['quantity'],
-                'price': float(product['selling_price']),
+                'price': float(product['sellingPrice']),
                 'size': item.get('size', 'N/A')
             })
         
-        connection.close()
-        
         order_id = Order.create_order(
             g.current_user['id'],
             order_items,
@@ -0,0 +1,27 @@
+from flask import Blueprint, jsonify, send_file
+from utils.image_store import image_store, content_type_for
+
+images_bp = Blueprint('images', __name__)
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+@images_bp.route('/images/<name>', methods=['GET'])
+def get_image(name):
+    path = image_store.path_for(name)
+    if not path or not image_store.exists(name):
+        return jsonify({
+            'success': False,
+            'message': 'Image not found',
+            'error': 'Invalid image reference'
+        }), 404
+    
+    # conditional=True gives us ETag/If-None-Match and Range/206 handling
+    response = send_file(
+        path,
+        mimetype=content_type_for(name),
+        conditional=True,
+        etag=name.split('.')[0],
+        max_age=IMMUTABLE_MAX_AGE
+    )
+    response.headers['Cache-Control'] = f'public, max-age={IMMUTABLE_MAX_AGE}, immutable'
+    return response
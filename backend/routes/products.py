@@ -2,30 +2,230 @@ from flask import Blueprint, request, jsonify, g
 from utils.auth_middleware import require_auth
 from models.product import Product
 from utils.database import get_db_connection
+from utils.pagination import InvalidCursor
+from utils.catalog_cache import catalog_cache
+from utils.http_cache import conditional_get, make_etag, set_cache_control
+from utils.compression import precompressed
+from utils.image_variants import IMAGE_VARIANTS, select_image_size
+from utils.raw_json import first_array_item, load_json, raw_json
+from utils.fields import InvalidFields, parse_fields
+from models.product import PRODUCT_FIELDS
+from config import Config
+import json
 import math
 
 products_bp = Blueprint('products', __name__)
+set_cache_control(products_bp, Config.CATALOG_CACHE_CONTROL)
+
+def _image_size():
+    """Requested size class, or None for the stored originals"""
+    size = request.args.get('imageSize')
+    return size if size in IMAGE_VARIANTS else None
+
+def _with_image_size(product, size):
+    """Copy of a product whose images point at the requested size class.
+    
+    Called inside the cache loaders so the variant lookups happen once per
+    cached entry and the images stay pre-encoded JSON.
+    """
+    if not size or not product or not product.get('images'):
+        return product
+    return dict(product, images=raw_json(json.dumps(select_image_size(load_json(product['images']), size))))
+
+def _with_image_sizes(result, size):
+    """Loader result ``(products, ...)`` with every product resolved to ``size``"""
+    products, *rest = result
+    return ([_with_image_size(product, size) for product in products], *rest)
+
+def _load_product(product_id, size=None):
+    return catalog_cache.get_or_load(
+        ('product', product_id, size),
+        lambda: _with_image_size(Product.get_product_by_id(product_id), size)
+    )
+
+def _catalog_filters():
+    """Facet filters from the query string; raises ValueError on malformed numbers"""
+    filters = {}
+    for name in ('minPrice', 'maxPrice', 'minRating'):
+        value = request.args.get(name)
+        if value not in (None, ''):
+            number = float(value)
+            if not math.isfinite(number):
+                raise ValueError(f'{name} must be a finite number')
+            filters[name] = number
+    sizes = [size.strip() for size in request.args.get('size', '').split(',') if size.strip()]
+    if sizes:
+        filters['sizes'] = tuple(sorted(set(sizes)))
+    return filters
+
+def _catalog_validator():
+    args = tuple(sorted(request.args.items(multi=True)))
+    return make_etag('products', catalog_cache.state(), args), None
+
+def _product_validator(product_id):
+    product = _load_product(product_id, _image_size())
+    if not product:
+        return None, None
+    return make_etag('product', catalog_cache.state(), product_id), product.get('updatedAt')
+
+def _cart_validator():
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    
+    # Checksum the quantities too: updated_at alone misses two edits within one second
+    cursor.execute(
+        "SELECT COUNT(*) as count, MAX(id) as max_id, "
+        "COALESCE(SUM(CRC32(CONCAT_WS(':', id, product_id, quantity, size, updated_at))), 0) as checksum "
+        "FROM cart_items WHERE user_id = %s",
+        (g.current_user['id'],)
+    )
+    state = cursor.fetchone()
+    connection.close()
+    
+    return make_etag('cart', g.current_user['id'], state['count'], state['max_id'], state['checksum'], catalog_cache.state()), None
 
 @products_bp.route('/products', methods=['GET'])
+@precompressed
+@conditional_get(_catalog_validator)
 def get_products():
     try:
         search = request.args.get('search', '')
         sort_by = request.args.get('sort', 'date_desc')
-        page = int(request.args.get('page', 1))
-        limit = int(request.args.get('limit', 12))
-        products, total_count = Product.get_products(search=search, sort_by=sort_by, page=page, limit=limit)
+        limit = min(max(int(request.args.get('limit', Config.PRODUCTS_PAGE_SIZE)), 1), Config.PRODUCTS_MAX_PAGE_SIZE)
+        image_size = _image_size()
+        fields = parse_fields(request.args.get('fields'), PRODUCT_FIELDS)
+        filters = _catalog_filters()
+        filters_key = tuple(sorted(filters.items()))
+        
+        facets = None
+        if request.args.get('includeFacets', 'false').lower() == 'true':
+            facets = catalog_cache.get_or_load(
+                ('facets', search, filters_key),
+                lambda: Product.get_product_facets(search=search, filters=filters)
+            )
+        
+        if 'cursor' in request.args:
+            include_total = request.args.get('includeTotal', 'false').lower() == 'true'
+            cursor = request.args.get('cursor')
+            products, next_cursor, total_count = catalog_cache.get_or_load(
+                ('page', search, sort_by, cursor, limit, include_total, tuple(fields or ()), filters_key, image_size),
+                lambda: _with_image_sizes(Product.get_products_page(
+                    search=search, sort_by=sort_by, cursor=cursor,
+                    limit=limit, include_total=include_total, fields=fields, filters=filters
+                ), image_size)
+            )
+            
+            data = {
+                'products': products,
+                'nextCursor': next_cursor
+            }
+            if include_total:
+                data['totalProducts'] = total_count
+            if facets is not None:
+                data['facets'] = facets
+            
+            return jsonify({
+                'success': True,
+                'data': data
+            })
+        
+        page = max(int(request.args.get('page', 1)), 1)
+        products, total_count = catalog_cache.get_or_load(
+            ('list', search, sort_by, page, limit, tuple(fields or ()), filters_key, image_size),
+            lambda: _with_image_sizes(Product.get_products(
+                search=search, sort_by=sort_by, page=page, limit=limit, fields=fields, filters=filters
+            ), image_size)
+        )
         total_pages = math.ceil(total_count / limit)
         
+        data = {
+            'products': products,
+            'totalPages': total_pages,
+            'currentPage': page,
+            'totalProducts': total_count
+        }
+        if facets is not None:
+            data['facets'] = facets
+        
+        return jsonify({
+            'success': True,
+            'data': data
+        })
+        
+    except InvalidCursor as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid cursor',
+            'error': str(e)
+        }), 400
+    except InvalidFields as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid fields',
+            'error': str(e)
+        }), 400
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid filter',
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Failed to fetch products',
+            'error': str(e)
+        }), 500
+
+@products_bp.route('/products/batch', methods=['GET'])
+@precompressed
+@conditional_get(_catalog_validator)
+def get_products_batch():
+    try:
+        raw_ids = [value.strip() for value in request.args.get('ids', '').split(',') if value.strip()]
+        if not raw_ids:
+            return jsonify({
+                'success': False,
+                'message': 'ids is required',
+                'error': 'Missing required fields'
+            }), 400
+        if len(raw_ids) > Config.PRODUCT_BATCH_MAX_IDS:
+            return jsonify({
+                'success': False,
+                'message': f'At most {Config.PRODUCT_BATCH_MAX_IDS} ids per request',
+                'error': 'Too many ids'
+            }), 400
+        
+        try:
+            product_ids = [int(value) for value in raw_ids]
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'message': 'ids must be integers',
+                'error': 'Invalid product ID'
+            }), 400
+        
+        fields = parse_fields(request.args.get('fields'), PRODUCT_FIELDS)
+        image_size = _image_size()
+        products, missing_ids = catalog_cache.get_or_load(
+            ('batch', tuple(product_ids), tuple(fields or ()), image_size),
+            lambda: _with_image_sizes(Product.get_products_by_ids(product_ids, fields=fields), image_size)
+        )
+        
         return jsonify({
             'success': True,
             'data': {
                 'products': products,
-                'totalPages': total_pages,
-                'currentPage': page,
-                'totalProducts': total_count
+                'missingIds': missing_ids
             }
         })
         
+    except InvalidFields as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid fields',
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -34,9 +234,11 @@ def get_products():
         }), 500
 
 @products_bp.route('/products/<int:product_id>', methods=['GET'])
+@precompressed
+@conditional_get(_product_validator)
 def get_product(product_id):
     try:
-        product = Product.get_product_by_id(product_id)
+        product = _load_product(product_id, _image_size())
         
         if not product:
             return jsonify({
@@ -59,6 +261,7 @@ def get_product(product_id):
 
 @products_bp.route('/cart', methods=['GET'])
 @require_auth(['business', 'individual'])
+@conditional_get(_cart_validator, cache_control='private, no-cache')
 def get_cart():
     try:
         connection = get_db_connection()
@@ -88,12 +291,7 @@ def get_cart():
                 'updatedAt': item['updated_at']
             }
             
-            if item['images']:
-                import json
-                images = json.loads(item['images'])
-                mapped_item['image'] = images[0] if images else None
-            else:
-                mapped_item['image'] = None
+            mapped_item['image'] = first_array_item(item['images']) if item['images'] else None
                 
             mapped_cart_items.append(mapped_item)
         
@@ -264,12 +462,7 @@ def update_cart_item(cart_item_id):
                 'updatedAt': updated_item['updated_at']
             }
             
-            if updated_item['images']:
-                import json
-                images = json.loads(updated_item['images'])
-                mapped_item['image'] = images[0] if images else None
-            else:
-                mapped_item['image'] = None
+            mapped_item['image'] = first_array_item(updated_item['images']) if updated_item['images'] else None
             
             connection.close()
             
@@ -1,12 +1,60 @@
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, Response, current_app, request, jsonify, g, send_file
 from utils.auth_middleware import require_auth
-from models.user import User
-from models.product import Product
-from models.order import Order
+from models.user import User, BUSINESS_USER_FIELDS, INDIVIDUAL_USER_FIELDS, DEFAULT_USER_DIRECTORY_SORT, USER_DIRECTORY_SORTS
+from models.product import Product, ADMIN_PRODUCT_LIST_FIELDS, DEFAULT_PRODUCT_SORT, PRODUCT_FIELDS, PRODUCT_STATUSES
+from models.order import Order, ALL_ORDER_FIELDS
+from models.refresh_token import RefreshToken
+from models.export_job import ExportJob, format_export_job
+from models.stats import Stats, ORDER_STATUSES, USER_STATUSES, USER_TYPES
 from utils.database import get_db_connection
-from utils.field_mapping import map_business_profile_to_frontend, map_individual_profile_to_frontend
+from utils.tokens import revoked_users
+from utils.http_cache import conditional_get, make_etag, set_cache_control
+from utils.fields import InvalidFields, parse_fields
+from utils.image_store import CONTENT_TYPE_EXTENSIONS, DATA_URL_PATTERN, EXTENSION_CONTENT_TYPES, is_data_url
+from utils.image_variants import select_image_size
+from utils.pagination import InvalidCursor
+from utils.order_export import EXPORT_FORMATS, iter_download_orders, serialize_export, validate_download_filters
+from utils.export_jobs import ExportQueueFull, export_worker
+from config import Config
+from datetime import datetime
+import base64
+import binascii
+import math
+import os
 
 superadmin_bp = Blueprint('superadmin', __name__)
+set_cache_control(superadmin_bp, 'private, no-cache')
+
+# Logos only change with the business profile; after this the ETag revalidates them
+LOGO_MAX_AGE = 24 * 60 * 60
+
+def _all_orders_validator():
+    args = tuple(sorted(request.args.items(multi=True)))
+    return make_etag('all-orders', Order.get_orders_state(), args), None
+
+def _logo_validator(user_id):
+    state = User.get_business_logo_state(user_id)
+    if not state or not state['has_logo']:
+        return None, None
+    return make_etag('logo', user_id, state['updated_at']), state['updated_at']
+
+def _order_filters():
+    """Listing filters from the query string; raises ValueError for unknown values or bad dates"""
+    filters = {}
+    status = request.args.get('status')
+    if status:
+        if status not in ORDER_STATUSES:
+            raise ValueError(f'Status must be one of: {", ".join(ORDER_STATUSES)}')
+        filters['status'] = status
+    user_type = request.args.get('userType')
+    if user_type:
+        if user_type not in USER_TYPES:
+            raise ValueError(f'userType must be one of: {", ".join(USER_TYPES)}')
+        filters['userType'] = user_type
+    for name in ('dateFrom', 'dateTo'):
+        if request.args.get(name):
+            filters[name] = datetime.strptime(request.args[name], '%Y-%m-%d').date()
+    return filters
 
 @superadmin_bp.route('/superadmin/dashboard', methods=['GET'])
 @require_auth(['superadmin'])
@@ -15,23 +63,10 @@ def get_dashboard():
         connection = get_db_connection()
         cursor = connection.cursor()
         
-        cursor.execute("SELECT COUNT(*) as count FROM users WHERE user_type = 'business'")
-        business_count = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM users WHERE user_type = 'individual'")
-        individual_count = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM products WHERE status = 'active'")
-        products_count = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM orders")
-        orders_count = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COUNT(*) as count FROM users WHERE status = 'pending'")
-        pending_approvals = cursor.fetchone()['count']
-        
-        cursor.execute("SELECT COALESCE(SUM(total_amount), 0) as total FROM orders")
-        revenue = float(cursor.fetchone()['total'])
+        counters = Stats.get_counters()
+        if counters is None:
+            Stats.reconcile()
+            counters = Stats.get_counters()
         
         cursor.execute("""
             SELECT o.id, 
@@ -55,16 +90,16 @@ def get_dashboard():
         return jsonify({
             'success': True,
             'data': {
-                'totalBusinessUsers': business_count,
-                'totalIndividualUsers': individual_count,
-                'totalProducts': products_count,
-                'totalOrders': orders_count,
-                'pendingApprovals': pending_approvals,
-                'revenue': revenue,
+                'totalBusinessUsers': counters['business_users'],
+                'totalIndividualUsers': counters['individual_users'],
+                'totalProducts': counters['active_products'],
+                'totalOrders': counters['total_orders'],
+                'pendingApprovals': counters['pending_users'],
+                'revenue': float(counters['revenue']),
                 'recentOrders': recent_orders
             }
         })
-        
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -72,108 +107,98 @@ def get_dashboard():
             'error': str(e)
         }), 500
 
-@superadmin_bp.route('/superadmin/users/business', methods=['GET'])
-@require_auth(['superadmin'])
-def get_business_users():
+def _get_user_directory(user_type, field_columns, label):
     try:
-        connection = get_db_connection()
-        cursor = connection.cursor()
-        
-        query = """
-        SELECT u.id, u.email, u.status, u.created_at,
-               bp.legal_entity_name, bp.contact_person_name, bp.contact_number,
-               bp.gst_number, bp.pan_number, bp.address, bp.logo
-        FROM users u
-        LEFT JOIN business_profiles bp ON u.id = bp.user_id
-        WHERE u.user_type = 'business'
-        ORDER BY u.created_at DESC
-        """
-        
-        cursor.execute(query)
-        users = cursor.fetchall()
-        connection.close()
-        
-        mapped_users = []
-        for user in users:
-            mapped_user = {
-                'id': user['id'],
-                'email': user['email'],
-                'status': user['status'],
-                'createdAt': user['created_at']
-            }
-            if user['legal_entity_name']:
-                profile_data = {
-                    'legal_entity_name': user['legal_entity_name'],
-                    'contact_person_name': user['contact_person_name'],
-                    'contact_number': user['contact_number'],
-                    'gst_number': user['gst_number'],
-                    'pan_number': user['pan_number'],
-                    'address': user['address'],
-                    'logo': user['logo']
-                }
-                mapped_profile = map_business_profile_to_frontend(profile_data)
-                mapped_user.update(mapped_profile)
-            mapped_users.append(mapped_user)
+        fields = parse_fields(request.args.get('fields'), field_columns)
+        page = max(int(request.args.get('page', 1)), 1)
+        limit = min(max(int(request.args.get('limit', Config.USERS_PAGE_SIZE)), 1), Config.USERS_MAX_PAGE_SIZE)
+        sort_by = request.args.get('sort', DEFAULT_USER_DIRECTORY_SORT)
+        if sort_by not in USER_DIRECTORY_SORTS:
+            raise ValueError(f'sort must be one of: {", ".join(USER_DIRECTORY_SORTS)}')
+        status = request.args.get('status')
+        if status == 'all':
+            status = None
+        if status and status not in USER_STATUSES:
+            raise ValueError(f'Status must be one of: {", ".join(USER_STATUSES)}')
+        
+        users, total_count, status_counts = User.get_user_directory(
+            user_type, fields=fields, search=request.args.get('search', '').strip(),
+            status=status, sort_by=sort_by, page=page, limit=limit
+        )
         
         return jsonify({
             'success': True,
-            'data': mapped_users
+            'data': {
+                'users': users,
+                'totalPages': math.ceil(total_count / limit),
+                'currentPage': page,
+                'totalUsers': total_count,
+                'statusCounts': status_counts
+            }
         })
-        
+    
+    except InvalidFields as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid fields',
+            'error': str(e)
+        }), 400
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid filter',
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
-            'message': 'Failed to fetch business users',
+            'message': f'Failed to fetch {label} users',
             'error': str(e)
         }), 500
 
+@superadmin_bp.route('/superadmin/users/business', methods=['GET'])
+@require_auth(['superadmin'])
+def get_business_users():
+    return _get_user_directory('business', BUSINESS_USER_FIELDS, 'business')
+
 @superadmin_bp.route('/superadmin/users/individual', methods=['GET'])
 @require_auth(['superadmin'])
 def get_individual_users():
+    return _get_user_directory('individual', INDIVIDUAL_USER_FIELDS, 'individual')
+
+@superadmin_bp.route('/superadmin/users/<int:user_id>/logo', methods=['GET'])
+@require_auth(['superadmin'])
+@conditional_get(_logo_validator, cache_control=f'private, max-age={LOGO_MAX_AGE}')
+def get_user_logo(user_id):
     try:
-        connection = get_db_connection()
-        cursor = connection.cursor()
-        
-        query = """
-        SELECT u.id, u.email, u.status, u.created_at,
-               ip.name, ip.contact_number, ip.address
-        FROM users u
-        LEFT JOIN individual_profiles ip ON u.id = ip.user_id
-        WHERE u.user_type = 'individual'
-        ORDER BY u.created_at DESC
-        """
-        
-        cursor.execute(query)
-        users = cursor.fetchall()
-        connection.close()
-        
-        mapped_users = []
-        for user in users:
-            mapped_user = {
-                'id': user['id'],
-                'email': user['email'],
-                'status': user['status'],
-                'createdAt': user['created_at']
-            }
-            if user['name']:
-                profile_data = {
-                    'name': user['name'],
-                    'contact_number': user['contact_number'],
-                    'address': user['address']
-                }
-                mapped_profile = map_individual_profile_to_frontend(profile_data)
-                mapped_user.update(mapped_profile)
-            mapped_users.append(mapped_user)
+        logo = User.get_business_logo(user_id)
+        match = DATA_URL_PATTERN.match(logo) if is_data_url(logo) else None
+        # The data URL comes from an unauthenticated signup, so only raster image
+        # types are served; anything else (HTML, SVG) could run script on this origin
+        ext = CONTENT_TYPE_EXTENSIONS.get(match.group('content_type').lower()) if match else None
+        if not ext:
+            return jsonify({
+                'success': False,
+                'message': 'Logo not found',
+                'error': 'User has no logo'
+            }), 404
         
+        response = Response(base64.b64decode(match.group('data')), mimetype=EXTENSION_CONTENT_TYPES[ext])
+        response.headers['X-Content-Type-Options'] = 'nosniff'
+        response.headers['Content-Disposition'] = f'inline; filename=logo-{user_id}.{ext}'
+        response.headers['Content-Security-Policy'] = "default-src 'none'; sandbox"
+        return response
+    
+    except (binascii.Error, ValueError) as e:
         return jsonify({
-            'success': True,
-            'data': mapped_users
-        })
-        
+            'success': False,
+            'message': 'Logo not found',
+            'error': f'Stored logo is not valid image data: {e}'
+        }), 404
     except Exception as e:
         return jsonify({
             'success': False,
-            'message': 'Failed to fetch individual users',
+            'message': 'Failed to fetch logo',
             'error': str(e)
         }), 500
 
@@ -194,7 +219,7 @@ def approve_user(user_id):
                 'message': 'User not found',
                 'error': 'Invalid user ID'
             }), 404
-            
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -209,6 +234,8 @@ def block_user(user_id):
         success = User.update_user_status(user_id, 'blocked')
         
         if success:
+            revoked_users.revoke(user_id)
+            RefreshToken.revoke_user_tokens(user_id)
             return jsonify({
                 'success': True,
                 'message': 'User blocked successfully'
@@ -219,7 +246,7 @@ def block_user(user_id):
                 'message': 'User not found',
                 'error': 'Invalid user ID'
             }), 404
-            
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -244,7 +271,7 @@ def unblock_user(user_id):
                 'message': 'User not found',
                 'error': 'Invalid user ID'
             }), 404
-            
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -256,38 +283,100 @@ def unblock_user(user_id):
 @require_auth(['superadmin'])
 def get_all_products():
     try:
-        connection = get_db_connection()
-        cursor = connection.cursor()
-        
-        # Remove ORDER BY to avoid sorting large datasets
-        cursor.execute("SELECT * FROM products LIMIT 100")  # Limit to prevent memory issues
-        products = cursor.fetchall()
+        search = request.args.get('search', '')
+        sort_by = request.args.get('sort', DEFAULT_PRODUCT_SORT)
+        limit = min(max(int(request.args.get('limit', Config.ADMIN_PRODUCTS_PAGE_SIZE)), 1), Config.ADMIN_PRODUCTS_MAX_PAGE_SIZE)
+        fields = parse_fields(request.args.get('fields'), PRODUCT_FIELDS) or ADMIN_PRODUCT_LIST_FIELDS
+        
+        # Unlike the public catalog, the admin sees inactive products too unless filtered
+        status = request.args.get('status')
+        if status and status != 'all' and status not in PRODUCT_STATUSES:
+            raise ValueError(f'Status must be one of: {", ".join(PRODUCT_STATUSES)}')
+        filters = {'status': status if status in PRODUCT_STATUSES else None}
+        
+        if 'cursor' in request.args:
+            include_total = request.args.get('includeTotal', 'false').lower() == 'true'
+            products, next_cursor, total_count = Product.get_products_page(
+                search=search, sort_by=sort_by, cursor=request.args.get('cursor'),
+                limit=limit, include_total=include_total, fields=fields, filters=filters
+            )
+            data = {'nextCursor': next_cursor}
+            if include_total:
+                data['totalProducts'] = total_count
+        else:
+            page = max(int(request.args.get('page', 1)), 1)
+            products, total_count = Product.get_products(
+                search=search, sort_by=sort_by, page=page, limit=limit, fields=fields, filters=filters
+            )
+            data = {
+                'totalPages': math.ceil(total_count / limit),
+                'currentPage': page,
+                'totalProducts': total_count
+            }
         
         for product in products:
-            if product['images']:
-                import json
-                product['images'] = json.loads(product['images'])
-            if product['available_sizes']:
-                import json
-                product['available_sizes'] = json.loads(product['available_sizes'])
-            if product['specifications']:
-                import json
-                product['specifications'] = json.loads(product['specifications'])
+            if product.get('thumbnail'):
+                product['thumbnail'] = select_image_size([product['thumbnail']], 'thumb')[0]
+        data['products'] = products
         
-        connection.close()
+        if request.args.get('includeFacets', 'false').lower() == 'true':
+            data['facets'] = Product.get_product_facets(search=search, filters=filters, facets=('status',))
         
         return jsonify({
             'success': True,
-            'data': products
+            'data': data
         })
-        
+    
+    except InvalidCursor as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid cursor',
+            'error': str(e)
+        }), 400
+    except InvalidFields as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid fields',
+            'error': str(e)
+        }), 400
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid filter',
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
             'message': 'Failed to fetch products',
             'error': str(e)
         }), 500
+
+@superadmin_bp.route('/superadmin/products/<int:product_id>', methods=['GET'])
+@require_auth(['superadmin'])
+def get_product_detail(product_id):
+    try:
+        product = Product.get_product_by_id(product_id)
         
+        if not product:
+            return jsonify({
+                'success': False,
+                'message': 'Product not found',
+                'error': 'Invalid product ID'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'data': product
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Failed to fetch product',
+            'error': str(e)
+        }), 500
+
 @superadmin_bp.route('/superadmin/products', methods=['POST'])
 @require_auth(['superadmin'])
 def create_product():
@@ -320,7 +409,7 @@ def create_product():
             'message': 'Product added successfully',
             'data': {'productId': product_id}
         }), 201
-        
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -363,7 +452,7 @@ def update_product(product_id):
                 'message': 'Product not found',
                 'error': 'Invalid product ID'
             }), 404
-            
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -388,7 +477,7 @@ def delete_product(product_id):
                 'message': 'Product not found',
                 'error': 'Invalid product ID'
             }), 404
-            
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -398,15 +487,38 @@ def delete_product(product_id):
 
 @superadmin_bp.route('/superadmin/orders', methods=['GET'])
 @require_auth(['superadmin'])
+@conditional_get(_all_orders_validator)
 def get_all_orders():
     try:
-        orders = Order.get_all_orders()
+        fields = parse_fields(request.args.get('fields'), ALL_ORDER_FIELDS)
+        filters = _order_filters()
+        page = max(int(request.args.get('page', 1)), 1)
+        limit = min(max(int(request.args.get('limit', Config.ORDERS_PAGE_SIZE)), 1), Config.ORDERS_MAX_PAGE_SIZE)
+        
+        orders, total_count = Order.get_all_orders(filters=filters, page=page, limit=limit, fields=fields)
         
         return jsonify({
             'success': True,
-            'data': orders
+            'data': {
+                'orders': orders,
+                'totalPages': math.ceil(total_count / limit),
+                'currentPage': page,
+                'totalOrders': total_count
+            }
         })
-        
+    
+    except InvalidFields as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid fields',
+            'error': str(e)
+        }), 400
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid filter',
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -418,115 +530,34 @@ def get_all_orders():
 @require_auth(['superadmin'])
 def get_orders_for_download():
     try:
-        filters = request.get_json()
-        
-        connection = get_db_connection()
-        cursor = connection.cursor()
-        
-        # Build the query based on filters
-        base_query = """
-        SELECT o.*, 
-               CASE 
-                   WHEN bp.contact_person_name IS NOT NULL THEN bp.contact_person_name
-                   WHEN ip.name IS NOT NULL THEN ip.name
-                   ELSE 'Unknown User'
-               END as user_name,
-               u.email as user_email,
-               u.user_type,
-               m.customer_id, m.name as measurement_name, m.gender, m.notes,
-               m.chest, m.waist, m.seat, m.shirtLength as shirt_length, 
-               m.armLength as arm_length, m.neck, m.hip, 
-               m.poloShirtLength as polo_shirt_length, m.shoulderWidth as shoulder_width, 
-               m.wrist, m.biceps
-        FROM orders o
-        JOIN users u ON o.user_id = u.id
-        LEFT JOIN business_profiles bp ON u.id = bp.user_id
-        LEFT JOIN individual_profiles ip ON u.id = ip.user_id
-        LEFT JOIN measurements m ON o.measurement_id = m.id
-        WHERE 1=1
-        """
-        
-        conditions = []
-        params = []
-        
-        # Apply filters
-        if filters.get('status') and filters['status'] != 'all':
-            conditions.append("o.status = %s")
-            params.append(filters['status'])
-        
-        if filters.get('userType') and filters['userType'] != 'all':
-            conditions.append("u.user_type = %s")
-            params.append(filters['userType'])
-        
-        if filters.get('dateFrom'):
-            conditions.append("DATE(o.created_at) >= %s")
-            params.append(filters['dateFrom'])
-        
-        if filters.get('dateTo'):
-            conditions.append("DATE(o.created_at) <= %s")
-            params.append(filters['dateTo'])
-        
-        # Add conditions to query
-        if conditions:
-            base_query += " AND " + " AND ".join(conditions)
-        
-        # Add sorting
-        sort_mapping = {
-            'newest': 'o.created_at DESC',
-            'oldest': 'o.created_at ASC',
-            'amount_high': 'o.total_amount DESC',
-            'amount_low': 'o.total_amount ASC'
-        }
-        
-        sort_by = filters.get('sortBy', 'newest')
-        if sort_by in sort_mapping:
-            base_query += f" ORDER BY {sort_mapping[sort_by]}"
-        else:
-            base_query += " ORDER BY o.created_at DESC"
-        
-        # Add limit
-        if filters.get('limit') and filters['limit'] != 'all':
-            base_query += " LIMIT %s"
-            params.append(int(filters['limit']))
-        
-        cursor.execute(base_query, params)
-        orders = cursor.fetchall()
-        
-        # Get order items for each order
-        for order in orders:
-            cursor.execute("SELECT * FROM order_items WHERE order_id = %s", (order['id'],))
-            order['items'] = cursor.fetchall()
-            
-            # Format measurements if available
-            if order['chest']:  # Check if measurements exist
-                order['measurements'] = {
-                    'customer_id': order['customer_id'],
-                    'name': order['measurement_name'],
-                    'gender': order['gender'],
-                    'notes': order['notes'],
-                    'chest': order['chest'],
-                    'waist': order['waist'],
-                    'seat': order['seat'],
-                    'shirtLength': order['shirt_length'],
-                    'armLength': order['arm_length'],
-                    'neck': order['neck'],
-                    'hip': order['hip'],
-                    'poloShirtLength': order['polo_shirt_length'],
-                    'shoulderWidth': order['shoulder_width'],
-                    'wrist': order['wrist'],
-                    'biceps': order['biceps']
-                }
-            else:
-                order['measurements'] = None
+        filters = request.get_json() or {}
+        validate_download_filters(filters)
+        export_format = filters.get('format', 'json')
+        
+        if export_format in EXPORT_FORMATS:
+            # Rows are produced while the response is sent, so memory stays flat for any export size
+            chunks = serialize_export(iter_download_orders(filters), export_format, current_app.json.dumps)
+            filename = f"orders-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{export_format}"
+            return Response(chunks, mimetype=EXPORT_FORMATS[export_format], headers={
+                'Content-Disposition': f'attachment; filename="{filename}"',
+                'Cache-Control': 'no-store',
+                'X-Accel-Buffering': 'no'
+            })
         
-        connection.close()
+        orders = list(iter_download_orders(filters))
         
         return jsonify({
             'success': True,
             'data': orders,
             'total': len(orders)
         })
-        
+    
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid filter',
+            'error': str(e)
+        }), 400
     except Exception as e:
         return jsonify({
             'success': False,
@@ -534,6 +565,102 @@ def get_orders_for_download():
             'error': str(e)
         }), 500
 
+@superadmin_bp.route('/superadmin/exports', methods=['POST'])
+@require_auth(['superadmin'])
+def create_export():
+    try:
+        filters = request.get_json() or {}
+        job, created = export_worker.submit(filters, g.current_user['id'], current_app.json.dumps)
+        
+        return jsonify({
+            'success': True,
+            'message': 'Export queued' if created else 'An identical export is already available',
+            'data': format_export_job(job)
+        }), 202 if created else 200
+    
+    except ExportQueueFull as e:
+        response = jsonify({
+            'success': False,
+            'message': 'Server is busy',
+            'error': str(e)
+        })
+        response.headers['Retry-After'] = '30'
+        return response, 503
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid filter',
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Failed to queue export',
+            'error': str(e)
+        }), 500
+
+@superadmin_bp.route('/superadmin/exports/<job_id>', methods=['GET'])
+@require_auth(['superadmin'])
+def get_export(job_id):
+    try:
+        export_worker.expire_jobs_if_due()
+        job = ExportJob.get_job(job_id)
+        if not job:
+            return jsonify({
+                'success': False,
+                'message': 'Export not found',
+                'error': 'Export does not exist or has expired'
+            }), 404
+        
+        response = jsonify({
+            'success': True,
+            'data': format_export_job(job)
+        })
+        # Polled while the job runs, so it must never be served from a cache
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Failed to fetch export',
+            'error': str(e)
+        }), 500
+
+@superadmin_bp.route('/superadmin/exports/<job_id>/download', methods=['GET'])
+@require_auth(['superadmin'])
+def download_export(job_id):
+    try:
+        job = ExportJob.get_job(job_id)
+        path = export_worker.path_for(job['file_name']) if job and job['file_name'] else None
+        if not path or not os.path.exists(path):
+            if job and job['status'] in ('queued', 'running'):
+                return jsonify({
+                    'success': False,
+                    'message': 'Export is not ready',
+                    'error': f"Export is {job['status']}"
+                }), 409
+            return jsonify({
+                'success': False,
+                'message': 'Export not found',
+                'error': 'Export does not exist, failed or has expired'
+            }), 404
+        
+        return send_file(
+            path,
+            mimetype=EXPORT_FORMATS[job['format']],
+            as_attachment=True,
+            download_name=f"orders-{job['created_at'].strftime('%Y%m%d-%H%M%S')}.{job['format']}",
+            conditional=True
+        )
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': 'Failed to download export',
+            'error': str(e)
+        }), 500
+
 @superadmin_bp.route('/superadmin/orders/<int:order_id>/status', methods=['PUT'])
 @require_auth(['superadmin'])
 def update_order_status(order_id):
@@ -569,7 +696,7 @@ def update_order_status(order_id):
                 'message': 'Order not found',
                 'error': 'Invalid order ID'
             }), 404
-            
+    
     except Exception as e:
         return jsonify({
             'success': False,
@@ -2,7 +2,8 @@ from functools import wraps
 from flask import request, jsonify, g
 import jwt
 from config import Config
-from utils.database import get_db_connection
+from models.user import User
+from utils.tokens import revoked_users
 
 def require_auth(allowed_user_types=None):
     def decorator(f):
@@ -20,11 +21,25 @@ def require_auth(allowed_user_types=None):
                 token = token.split(' ')[1]
                 payload = jwt.decode(token, Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM])
                 
-                connection = get_db_connection()
-                cursor = connection.cursor()
-                
-                cursor.execute("SELECT * FROM users WHERE id = %s", (payload['user_id'],))
-                current_user = cursor.fetchone()
+                if 'status' in payload:
+                    # Short-lived tokens carry the claims we need; blocks made in this
+                    # process take effect through the revocation set, elsewhere within
+                    # the access-token lifetime.
+                    if revoked_users.is_revoked(payload['user_id'], payload.get('iat', 0)):
+                        return jsonify({
+                            'success': False,
+                            'message': 'Token revoked',
+                            'error': 'Please login again'
+                        }), 401
+                    
+                    current_user = {
+                        'id': payload['user_id'],
+                        'email': payload.get('email'),
+                        'user_type': payload['user_type'],
+                        'status': payload['status']
+                    }
+                else:
+                    current_user = User.get_auth_user(payload['user_id'])
                 
                 if not current_user:
                     return jsonify({
@@ -48,7 +63,6 @@ def require_auth(allowed_user_types=None):
                     }), 403
                 
                 g.current_user = current_user
-                connection.close()
                 return f(*args, **kwargs)
                 
             except jwt.ExpiredSignatureError:
@@ -0,0 +1,66 @@
+import json
+import threading
+from config import Config
+from utils.cache import TTLCache
+
+_MISSING = object()
+
+def _estimate_size(value):
+    return len(json.dumps(value, default=str))
+
+class CatalogCache:
+    """Pre-mapped product records and page results, keyed by catalog version.
+    
+    Product writes in this process call ``bump()``, which moves every reader to
+    a new version at once. Entries are also keyed by a fingerprint of the
+    products table that is re-read every ``state_ttl`` seconds, so edits made
+    elsewhere (other workers, manual SQL) show up within that window. The same
+    fingerprint backs the catalog ETags, which therefore agree across workers.
+    """
+    
+    def __init__(self, max_entries, ttl, max_bytes, state_ttl):
+        self._cache = TTLCache(max_entries, ttl, max_bytes=max_bytes, weigher=_estimate_size)
+        self._state = TTLCache(4, state_ttl)
+        self._lock = threading.Lock()
+        self.version = 1
+    
+    def state(self):
+        """Fingerprint of the products table as of at most ``state_ttl`` seconds ago"""
+        version = self.version
+        state = self._state.get(version)
+        if state is None:
+            from models.product import Product
+            state = Product.get_catalog_state()
+            if version == self.version:
+                self._state.set(version, state)
+        return state
+    
+    def get_or_load(self, key, loader):
+        version = self.version
+        cache_key = (version, self.state()) + tuple(key)
+        
+        value = self._cache.get(cache_key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            # Skip storing if a write bumped the version while we were loading
+            if version == self.version:
+                self._cache.set(cache_key, value)
+        return value
+    
+    def bump(self):
+        with self._lock:
+            self.version += 1
+        self._cache.clear()
+        self._state.clear()
+    
+    def stats(self):
+        stats = self._cache.stats()
+        stats['version'] = self.version
+        return stats
+
+catalog_cache = CatalogCache(
+    max_entries=Config.CATALOG_CACHE_MAX_ENTRIES,
+    ttl=Config.CATALOG_CACHE_TTL,
+    max_bytes=Config.CATALOG_CACHE_MAX_BYTES,
+    state_ttl=Config.CATALOG_STATE_TTL
+)
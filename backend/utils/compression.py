@@ -0,0 +1,217 @@
+import gzip
+import threading
+import zlib
+from flask import request, current_app
+from config import Config
+from utils.cache import TTLCache
+from utils.catalog_cache import catalog_cache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'application/xml',
+    'image/svg+xml',
+    'text/csv',
+    'text/css',
+    'text/html',
+    'text/plain',
+    'text/xml'
+}
+
+# Levels for per-request compression, and for bodies that are compressed once and cached
+DYNAMIC_LEVELS = {'zstd': 3, 'br': 5, 'gzip': 6}
+PRECOMPRESSED_LEVELS = {'zstd': 12, 'br': 9, 'gzip': 9}
+
+class _GzipStream:
+    def __init__(self, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    
+    def compress(self, chunk):
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+    
+    def finish(self):
+        return self._compressor.flush()
+
+class _BrotliStream:
+    def __init__(self, level):
+        self._compressor = brotli.Compressor(quality=level)
+    
+    def compress(self, chunk):
+        return self._compressor.process(chunk) + self._compressor.flush()
+    
+    def finish(self):
+        return self._compressor.finish()
+
+class _ZstdStream:
+    def __init__(self, level):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    
+    def compress(self, chunk):
+        return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+    
+    def finish(self):
+        return self._compressor.flush()
+
+def _available_encodings():
+    """Supported encodings in server preference order"""
+    encodings = {}
+    if zstandard is not None:
+        encodings['zstd'] = (lambda data, level: zstandard.ZstdCompressor(level=level).compress(data), _ZstdStream)
+    if brotli is not None:
+        encodings['br'] = (lambda data, level: brotli.compress(data, quality=level), _BrotliStream)
+    encodings['gzip'] = (lambda data, level: gzip.compress(data, compresslevel=level, mtime=0), _GzipStream)
+    return encodings
+
+ENCODINGS = _available_encodings()
+
+def negotiate_encoding(accept_encoding):
+    """Pick the best supported coding from an Accept-Encoding header, or None for identity"""
+    if not accept_encoding:
+        return None
+    
+    weights = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+    
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get('*', 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+def precompressed(f):
+    """Mark a catalog view whose compressed bodies may be cached by (path, ETag, encoding, catalog version)"""
+    f.precompressed = True
+    return f
+
+class Compressor:
+    """after_request hook compressing eligible responses with the negotiated encoding"""
+    
+    def __init__(self, min_size, cache_entries, cache_ttl, cache_max_bytes):
+        self.min_size = min_size
+        self.cache = TTLCache(cache_entries, cache_ttl, max_bytes=cache_max_bytes, weigher=len)
+        self._lock = threading.Lock()
+        self._stats = {'compressed': 0, 'streamed': 0, 'precompressedHits': 0, 'bytesIn': 0, 'bytesOut': 0}
+    
+    def _count(self, **amounts):
+        with self._lock:
+            for key, amount in amounts.items():
+                self._stats[key] += amount
+    
+    def _eligible(self, response):
+        if request.method == 'HEAD' or response.direct_passthrough:
+            return False
+        if response.status_code < 200 or response.status_code in (204, 206, 304):
+            return False
+        if 'Content-Encoding' in response.headers or 'Content-Range' in response.headers:
+            return False
+        if 'no-transform' in response.headers.get('Cache-Control', ''):
+            return False
+        return response.mimetype in COMPRESSIBLE_MIMETYPES
+    
+    def _is_precompressed_view(self):
+        view = current_app.view_functions.get(request.endpoint)
+        return getattr(view, 'precompressed', False)
+    
+    def _stream(self, chunks, encoding):
+        stream = ENCODINGS[encoding][1](DYNAMIC_LEVELS[encoding])
+        try:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                compressed = stream.compress(chunk)
+                if compressed:
+                    yield compressed
+            yield stream.finish()
+        finally:
+            if hasattr(chunks, 'close'):
+                chunks.close()
+    
+    def process_response(self, response):
+        if not self._eligible(response):
+            return response
+        
+        response.vary.add('Accept-Encoding')
+        encoding = negotiate_encoding(request.headers.get('Accept-Encoding'))
+        if encoding is None:
+            return response
+        
+        if response.is_streamed:
+            response.response = self._stream(response.response, encoding)
+            response.headers.pop('Content-Length', None)
+            response.headers['Content-Encoding'] = encoding
+            self._count(streamed=1)
+            return response
+        
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+        
+        etag = response.headers.get('ETag')
+        cache_key = None
+        if etag and self._is_precompressed_view():
+            # The catalog version moves on every local write, so a body cached under
+            # an ETag computed before the write is never served after it
+            cache_key = (request.full_path, etag, encoding, catalog_cache.version)
+            compressed = self.cache.get(cache_key)
+            if compressed is not None:
+                response.set_data(compressed)
+                response.headers['Content-Encoding'] = encoding
+                self._count(precompressedHits=1, bytesIn=len(data), bytesOut=len(compressed))
+                return response
+        
+        levels = PRECOMPRESSED_LEVELS if cache_key else DYNAMIC_LEVELS
+        compressed = ENCODINGS[encoding][0](data, levels[encoding])
+        if len(compressed) >= len(data):
+            return response
+        if cache_key:
+            self.cache.set(cache_key, compressed)
+        
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        self._count(compressed=1, bytesIn=len(data), bytesOut=len(compressed))
+        return response
+    
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats['encodings'] = list(ENCODINGS)
+        stats['cache'] = self.cache.stats()
+        return stats
+
+compressor = Compressor(
+    Config.COMPRESSION_MIN_SIZE,
+    Config.COMPRESSION_CACHE_MAX_ENTRIES,
+    Config.CATALOG_CACHE_TTL,
+    Config.COMPRESSION_CACHE_MAX_BYTES
+)
+
+def init_app(app):
+    if Config.COMPRESSION_ENABLED:
+        app.after_request(compressor.process_response)
+
+def get_compression_stats():
+    return compressor.stats()
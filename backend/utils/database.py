@@ -1,14 +1,226 @@
+import threading
+import time
 import pymysql
+from pymysql.constants import SERVER_STATUS
+from flask import g, has_app_context
 from config import Config
 
+class PoolTimeoutError(Exception):
+    pass
+
+class PooledConnection:
+    """Thin proxy around a pooled PyMySQL connection.
+    
+    ``close()`` hands the connection back to the pool instead of tearing down
+    the socket. Request-scoped connections ignore ``close()`` entirely and are
+    released by the app-context teardown handler.
+    """
+    
+    def __init__(self, pool, raw, request_scoped=False):
+        self._pool = pool
+        self._raw = raw
+        self._request_scoped = request_scoped
+        self._released = False
+    
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+    
+    def close(self):
+        if self._request_scoped:
+            return
+        self.release()
+    
+    def release(self):
+        if self._released:
+            return
+        self._released = True
+        self._pool.release(self._raw)
+    
+    def discard(self):
+        """Close the socket rather than pool it, e.g. after abandoning an unbuffered result"""
+        try:
+            self._raw.close()
+        except Exception:
+            pass
+        self.release()
+
+class ConnectionPool:
+    def __init__(self, max_size, timeout, max_lifetime, idle_timeout, ping_interval):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._idle = []
+        self._created_at = {}
+        self._last_used = {}
+        self._in_use = 0
+        self._waiters = 0
+        
+        self._stats = {
+            'created': 0,
+            'closed': 0,
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'totalWaitMs': 0.0,
+            'maxWaitMs': 0.0,
+            'pingFailures': 0
+        }
+    
+    def _connect(self):
+        connection = pymysql.connect(
+            host=Config.DB_HOST,
+            port=Config.DB_PORT,
+            user=Config.DB_USER,
+            password=Config.DB_PASSWORD,
+            database=Config.DB_NAME,
+            charset='utf8mb4',
+            cursorclass=pymysql.cursors.DictCursor,
+            autocommit=True
+        )
+        now = time.monotonic()
+        self._created_at[id(connection)] = now
+        self._last_used[id(connection)] = now
+        return connection
+    
+    def _discard(self, connection):
+        self._created_at.pop(id(connection), None)
+        self._last_used.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._stats['closed'] += 1
+    
+    def _is_usable(self, connection):
+        now = time.monotonic()
+        created_at = self._created_at.get(id(connection), now)
+        last_used = self._last_used.get(id(connection), now)
+        
+        if self.max_lifetime and now - created_at > self.max_lifetime:
+            return False
+        if self.idle_timeout and now - last_used > self.idle_timeout:
+            return False
+        
+        if now - last_used > self.ping_interval:
+            try:
+                connection.ping(reconnect=False)
+            except Exception:
+                with self._lock:
+                    self._stats['pingFailures'] += 1
+                return False
+        return True
+    
+    def acquire(self):
+        started = time.monotonic()
+        waited = False
+        
+        with self._available:
+            while not self._idle and self._in_use >= self.max_size:
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolTimeoutError('Timed out waiting for a database connection')
+                waited = True
+                self._waiters += 1
+                try:
+                    self._available.wait(remaining)
+                finally:
+                    self._waiters -= 1
+            
+            connection = self._idle.pop() if self._idle else None
+            self._in_use += 1
+            self._stats['checkouts'] += 1
+            if waited:
+                wait_ms = (time.monotonic() - started) * 1000
+                self._stats['waits'] += 1
+                self._stats['totalWaitMs'] += wait_ms
+                self._stats['maxWaitMs'] = max(self._stats['maxWaitMs'], wait_ms)
+        
+        try:
+            if connection is not None and not self._is_usable(connection):
+                self._discard(connection)
+                connection = None
+            if connection is None:
+                connection = self._connect()
+                with self._lock:
+                    self._stats['created'] += 1
+        except Exception:
+            with self._available:
+                self._in_use -= 1
+                self._available.notify()
+            raise
+        
+        return connection
+    
+    def release(self, connection):
+        reusable = connection.open
+        if reusable and connection.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+            try:
+                connection.rollback()
+            except Exception:
+                reusable = False
+        
+        if reusable:
+            self._last_used[id(connection)] = time.monotonic()
+        else:
+            self._discard(connection)
+        
+        with self._available:
+            self._in_use -= 1
+            if reusable:
+                self._idle.append(connection)
+            self._available.notify()
+    
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                'maxSize': self.max_size,
+                'inUse': self._in_use,
+                'idle': len(self._idle),
+                'waiters': self._waiters
+            })
+        stats['avgWaitMs'] = stats['totalWaitMs'] / stats['waits'] if stats['waits'] else 0.0
+        return stats
+
+pool = ConnectionPool(
+    max_size=Config.DB_POOL_SIZE,
+    timeout=Config.DB_POOL_TIMEOUT,
+    max_lifetime=Config.DB_POOL_MAX_LIFETIME,
+    idle_timeout=Config.DB_POOL_IDLE_TIMEOUT,
+    ping_interval=Config.DB_POOL_PING_INTERVAL
+)
+
 def get_db_connection():
-    return pymysql.connect(
-        host=Config.DB_HOST,
-        port=Config.DB_PORT,
-        user=Config.DB_USER,
-        password=Config.DB_PASSWORD,
-        database=Config.DB_NAME,
-        charset='utf8mb4',
-        cursorclass=pymysql.cursors.DictCursor,
-        autocommit=True
-    )
\ No newline at end of file
+    """Return a pooled connection, shared for the lifetime of the current request"""
+    if not has_app_context():
+        return PooledConnection(pool, pool.acquire())
+    
+    if 'db_connection' not in g:
+        g.db_connection = PooledConnection(pool, pool.acquire(), request_scoped=True)
+    return g.db_connection
+
+def checkout_connection():
+    """Pooled connection owned by the caller rather than the request, for work that outlives it"""
+    return PooledConnection(pool, pool.acquire())
+
+def release_db_connection(exception=None):
+    connection = g.pop('db_connection', None)
+    if connection is not None:
+        connection.release()
+
+def get_pool_stats():
+    return pool.stats()
+
+def init_app(app):
+    app.teardown_appcontext(release_db_connection)
+
+def escape_like(value):
+    """Escape LIKE wildcards so user input matches literally"""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
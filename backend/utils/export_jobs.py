@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import secrets
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from models.export_job import ExportJob
+from utils.order_export import (
+    EXPORT_FORMATS, count_download_orders, iter_download_orders, normalize_download_filters,
+    serialize_export, validate_download_filters
+)
+
+DEFAULT_EXPORT_FORMAT = 'csv'
+
+class ExportQueueFull(Exception):
+    pass
+
+def filters_key(filters):
+    return hashlib.sha256(json.dumps(filters, sort_keys=True).encode('utf-8')).hexdigest()
+
+class ExportWorker:
+    """Background pool that writes order exports to disk for later download.
+    
+    Job state lives in the export_jobs table so any app process can report
+    progress, while the files are written under ``root`` on this host.
+    Identical filters submitted within ``dedupe_window`` seconds share a job.
+    Running jobs that stop reporting progress for ``stale_after`` seconds
+    (their process died) are failed by the periodic sweep and never reused.
+    """
+    
+    def __init__(self, root, max_workers, max_queued, ttl, dedupe_window, stale_after, sweep_interval):
+        self.root = root
+        self.max_queued = max_queued
+        self.ttl = ttl
+        self.dedupe_window = dedupe_window
+        self.stale_after = stale_after
+        self.sweep_interval = sweep_interval
+        self._last_sweep = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='order-exports')
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {'queued': 0, 'reused': 0, 'rejected': 0, 'completed': 0, 'failed': 0, 'stale': 0, 'expired': 0}
+    
+    def path_for(self, file_name):
+        return os.path.join(self.root, file_name)
+    
+    def submit(self, filters, user_id, dumps):
+        """Return ``(job, created)``, reusing a recent job for the same filters when there is one"""
+        if filters.get('format') == 'json':
+            raise ValueError(f'format must be one of: {", ".join(EXPORT_FORMATS)}')
+        validate_download_filters(filters)
+        filters = normalize_download_filters(filters, DEFAULT_EXPORT_FORMAT)
+        key = filters_key(filters)
+        self.expire_jobs()
+        
+        # The lock only serializes submissions within this process; two processes
+        # racing on the same filters may each start a job, which is harmless
+        with self._lock:
+            job = ExportJob.find_recent_job(key, self.dedupe_window, self.stale_after)
+            if job is not None:
+                self._stats['reused'] += 1
+                return job, False
+            if self._pending >= self.max_queued:
+                self._stats['rejected'] += 1
+                raise ExportQueueFull('Too many exports in progress')
+            
+            job = ExportJob.create_job(secrets.token_hex(16), user_id, filters, key, filters['format'], self.ttl)
+            self._pending += 1
+            self._stats['queued'] += 1
+        self._executor.submit(self._run, job['id'], filters, dumps)
+        return job, True
+    
+    def _run(self, job_id, filters, dumps):
+        file_name = f"{job_id}.{filters['format']}"
+        tmp_path = None
+        processed = 0
+        
+        def track(orders):
+            nonlocal processed
+            for order in orders:
+                yield order
+                processed += 1
+                if processed % Config.EXPORT_BATCH_SIZE == 0:
+                    ExportJob.update_progress(job_id, processed)
+        
+        try:
+            if not ExportJob.mark_running(job_id, count_download_orders(filters)):
+                return
+            
+            os.makedirs(self.root, exist_ok=True)
+            # Write to a temp file and rename so a download never sees a partial export
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='.tmp-')
+            orders = iter_download_orders(filters)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8', newline='') as export_file:
+                    for chunk in serialize_export(track(orders), filters['format'], dumps):
+                        export_file.write(chunk)
+            finally:
+                orders.close()
+            path = self.path_for(file_name)
+            os.replace(tmp_path, path)
+            tmp_path = None
+            
+            ExportJob.mark_completed(job_id, processed, file_name, os.path.getsize(path))
+            with self._lock:
+                self._stats['completed'] += 1
+        except Exception as e:
+            with self._lock:
+                self._stats['failed'] += 1
+            try:
+                ExportJob.mark_failed(job_id, str(e))
+            except Exception:
+                pass
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            with self._lock:
+                self._pending -= 1
+    
+    def expire_jobs(self):
+        """Fail stale jobs, delete expired jobs and their files; return how many were removed"""
+        self._last_sweep = time.monotonic()
+        stale = ExportJob.fail_stale_jobs(self.stale_after)
+        jobs = ExportJob.get_expired_jobs()
+        for job in jobs:
+            if job['file_name']:
+                path = self.path_for(job['file_name'])
+                if os.path.exists(path):
+                    os.remove(path)
+        removed = ExportJob.delete_jobs([job['id'] for job in jobs])
+        with self._lock:
+            self._stats['stale'] += stale
+            self._stats['expired'] += removed
+        return removed
+    
+    def expire_jobs_if_due(self):
+        """Run ``expire_jobs`` at most once per ``sweep_interval`` seconds"""
+        if time.monotonic() - self._last_sweep >= self.sweep_interval:
+            self.expire_jobs()
+    
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['pending'] = self._pending
+            return stats
+
+export_worker = ExportWorker(
+    Config.EXPORT_STORE_PATH,
+    Config.EXPORT_WORKERS,
+    Config.EXPORT_MAX_QUEUED,
+    Config.EXPORT_JOB_TTL,
+    Config.EXPORT_DEDUPE_WINDOW,
+    Config.EXPORT_JOB_STALE_AFTER,
+    Config.EXPORT_SWEEP_INTERVAL
+)
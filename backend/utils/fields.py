@@ -0,0 +1,22 @@
+class InvalidFields(ValueError):
+    pass
+
+def parse_fields(raw, allowed, required=('id',)):
+    """Parse a ``fields=a,b,c`` query value against a model's whitelist.
+    
+    Returns None when no projection was requested (callers keep today's full
+    shape), otherwise the requested names plus ``required`` in a stable order.
+    """
+    if not raw:
+        return None
+    
+    requested = [field.strip() for field in raw.split(',') if field.strip()]
+    unknown = [field for field in requested if field not in allowed]
+    if unknown:
+        raise InvalidFields(f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys(list(required) + requested))
+
+def project(record, fields):
+    if not fields or record is None:
+        return record
+    return {field: record[field] for field in fields if field in record}
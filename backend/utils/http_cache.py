@@ -0,0 +1,66 @@
+import hashlib
+from functools import wraps
+from flask import request, make_response
+
+def make_etag(*parts):
+    """Weak ETag from validator parts; weak because equal tags mean equivalent, not byte-identical, JSON"""
+    digest = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+def _strip_weak(tag):
+    tag = tag.strip()
+    return tag[2:] if tag.startswith('W/') else tag
+
+def is_not_modified(etag, last_modified=None):
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match:
+        if if_none_match.strip() == '*':
+            return True
+        wanted = _strip_weak(etag)
+        return any(_strip_weak(tag) == wanted for tag in if_none_match.split(','))
+    
+    # If-Modified-Since is only consulted when the client sent no entity tags
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified.replace(microsecond=0, tzinfo=None) <= request.if_modified_since.replace(tzinfo=None)
+    return False
+
+def conditional_get(validator, cache_control=None):
+    """Answer 304 from ``validator(*args, **kwargs) -> (etag, last_modified)`` before the view runs.
+    
+    The view is only called when the client's copy is stale; successful
+    responses get the validators attached. If the validator itself fails the
+    view is served normally.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            try:
+                etag, last_modified = validator(*args, **kwargs)
+            except Exception:
+                etag, last_modified = None, None
+            
+            if etag and is_not_modified(etag, last_modified):
+                response = make_response('', 304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            
+            if etag:
+                response.headers['ETag'] = etag
+            if last_modified is not None:
+                response.last_modified = last_modified
+            if cache_control:
+                response.headers['Cache-Control'] = cache_control
+            return response
+        return decorated_function
+    return decorator
+
+def set_cache_control(blueprint, policy):
+    """Default Cache-Control for a blueprint's GET responses; routes may set their own"""
+    @blueprint.after_request
+    def apply_cache_control(response):
+        if request.method == 'GET' and 'Cache-Control' not in response.headers:
+            response.headers['Cache-Control'] = policy
+        return response
+    return apply_cache_control
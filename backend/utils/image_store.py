@@ -0,0 +1,113 @@
+import base64
+import binascii
+import hashlib
+import os
+import re
+import tempfile
+from config import Config
+
+IMAGE_URL_PREFIX = '/api/images/'
+
+CONTENT_TYPE_EXTENSIONS = {
+    'image/jpeg': 'jpg',
+    'image/jpg': 'jpg',
+    'image/png': 'png',
+    'image/webp': 'webp',
+    'image/gif': 'gif'
+}
+
+EXTENSION_CONTENT_TYPES = {
+    'jpg': 'image/jpeg',
+    'png': 'image/png',
+    'webp': 'image/webp',
+    'gif': 'image/gif'
+}
+
+DATA_URL_PATTERN = re.compile(r'^data:(?P<content_type>[\w.+/-]+);base64,(?P<data>.*)$', re.DOTALL)
+IMAGE_NAME_PATTERN = re.compile(r'^(?P<digest>[0-9a-f]{64})(?:_(?P<variant>[a-z]+))?\.(?P<ext>jpg|png|webp|gif)$')
+
+class ImageStore:
+    """Filesystem store addressed by the SHA-256 of the image bytes.
+    
+    Identical uploads share one file, and a name never changes meaning, which
+    is what lets the serving endpoint mark responses immutable.
+    """
+    
+    def __init__(self, root):
+        self.root = root
+    
+    def path_for(self, name):
+        match = IMAGE_NAME_PATTERN.match(name)
+        if not match:
+            return None
+        digest = match.group('digest')
+        return os.path.join(self.root, digest[:2], digest[2:4], name)
+    
+    def save(self, data, ext):
+        name = f'{hashlib.sha256(data).hexdigest()}.{ext}'
+        self.write(name, data)
+        return name
+    
+    def write(self, name, data):
+        path = self.path_for(name)
+        if os.path.exists(path):
+            return
+        
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial image
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def exists(self, name):
+        path = self.path_for(name)
+        return path is not None and os.path.exists(path)
+
+image_store = ImageStore(Config.IMAGE_STORE_PATH)
+
+def is_data_url(value):
+    return isinstance(value, str) and value.startswith('data:')
+
+def image_url(name):
+    return IMAGE_URL_PREFIX + name
+
+def image_name(url):
+    """Return the stored file name for an /api/images/ reference, or None"""
+    if isinstance(url, str) and url.startswith(IMAGE_URL_PREFIX):
+        name = url[len(IMAGE_URL_PREFIX):]
+        if IMAGE_NAME_PATTERN.match(name):
+            return name
+    return None
+
+def store_data_url(value):
+    """Move a base64 data URL into the store and return its short reference.
+    
+    Values that are not image data URLs of a known type are returned unchanged.
+    """
+    match = DATA_URL_PATTERN.match(value) if is_data_url(value) else None
+    if not match:
+        return value
+    
+    ext = CONTENT_TYPE_EXTENSIONS.get(match.group('content_type').lower())
+    if not ext:
+        return value
+    
+    try:
+        data = base64.b64decode(match.group('data'), validate=False)
+    except (binascii.Error, ValueError):
+        return value
+    return image_url(image_store.save(data, ext))
+
+def store_images(images):
+    return [store_data_url(image) for image in images or []]
+
+def content_type_for(name):
+    match = IMAGE_NAME_PATTERN.match(name)
+    return EXTENSION_CONTENT_TYPES[match.group('ext')] if match else None
@@ -0,0 +1,104 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from config import Config
+from utils.catalog_cache import catalog_cache
+from utils.image_store import IMAGE_NAME_PATTERN, image_store, image_name, image_url
+
+# Size class -> longest edge in pixels. Variants are re-encoded as WebP.
+IMAGE_VARIANTS = {
+    'thumb': 320,
+    'medium': 800
+}
+
+VARIANT_FORMAT = 'webp'
+VARIANT_QUALITY = 80
+
+def variant_name(name, variant):
+    match = IMAGE_NAME_PATTERN.match(name)
+    if not match or match.group('variant'):
+        return None
+    return f"{match.group('digest')}_{variant}.{VARIANT_FORMAT}"
+
+def generate_variants(name):
+    """Write every missing size class for a stored original; return how many were created"""
+    pending = [
+        (variant, variant_name(name, variant), max_edge)
+        for variant, max_edge in IMAGE_VARIANTS.items()
+        if variant_name(name, variant) and not image_store.exists(variant_name(name, variant))
+    ]
+    if not pending:
+        return 0
+    
+    with Image.open(image_store.path_for(name)) as original:
+        original.load()
+        if original.mode not in ('RGB', 'RGBA'):
+            original = original.convert('RGBA' if 'transparency' in original.info else 'RGB')
+        
+        for variant, derived_name, max_edge in pending:
+            resized = original.copy()
+            resized.thumbnail((max_edge, max_edge), Image.LANCZOS)
+            buffer = io.BytesIO()
+            resized.save(buffer, format=VARIANT_FORMAT, quality=VARIANT_QUALITY, method=4)
+            image_store.write(derived_name, buffer.getvalue())
+    return len(pending)
+
+class VariantWorker:
+    """Background pool that derives size classes for newly stored product images"""
+    
+    def __init__(self, max_workers):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image-variants')
+        self._lock = threading.Lock()
+        self._in_flight = set()
+        self._stats = {'queued': 0, 'generated': 0, 'failed': 0}
+    
+    def schedule(self, images):
+        for image in images or []:
+            name = image_name(image)
+            if not name:
+                continue
+            with self._lock:
+                if name in self._in_flight:
+                    continue
+                self._in_flight.add(name)
+                self._stats['queued'] += 1
+            self._executor.submit(self._run, name)
+    
+    def _run(self, name):
+        try:
+            generated = generate_variants(name)
+            with self._lock:
+                self._stats['generated'] += generated
+            if generated:
+                # Catalog entries resolve sized image URLs when loaded; reload them to pick up the new variants
+                catalog_cache.bump()
+        except Exception:
+            with self._lock:
+                self._stats['failed'] += 1
+        finally:
+            with self._lock:
+                self._in_flight.discard(name)
+    
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['inFlight'] = len(self._in_flight)
+            return stats
+
+variant_worker = VariantWorker(Config.IMAGE_VARIANT_WORKERS)
+
+def select_image_size(images, size):
+    """Swap stored originals for the requested size class where that variant exists"""
+    if size not in IMAGE_VARIANTS or not images:
+        return images
+    
+    selected = []
+    for image in images:
+        name = image_name(image)
+        derived_name = variant_name(name, size) if name else None
+        if derived_name and image_store.exists(derived_name):
+            selected.append(image_url(derived_name))
+        else:
+            selected.append(image)
+    return selected
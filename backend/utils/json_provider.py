@@ -0,0 +1,91 @@
+import re
+import secrets
+from flask.json.provider import DefaultJSONProvider
+from utils.raw_json import RawJSON
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class AppJSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider plus support for pre-encoded ``RawJSON`` fragments.
+    
+    The stdlib encoder cannot emit raw text, so each fragment is first encoded
+    as a placeholder string carrying a per-call nonce and then substituted.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        fragments = []
+        nonce = None
+        fallback = kwargs.pop('default', self.default)
+        
+        def default(value):
+            nonlocal nonce
+            if isinstance(value, RawJSON):
+                if nonce is None:
+                    nonce = secrets.token_hex(8)
+                fragments.append(value.encoded)
+                return f'\x00{nonce}:{len(fragments) - 1}\x00'
+            return fallback(value)
+        
+        text = super().dumps(obj, default=default, **kwargs)
+        if not fragments:
+            return text
+        
+        placeholder = re.compile(r'"\\u0000' + nonce + r':(\d+)\\u0000"')
+        return placeholder.sub(lambda match: fragments[int(match.group(1))], text)
+
+class OrjsonProvider(AppJSONProvider):
+    """orjson-backed provider producing the same documents as ``AppJSONProvider``.
+    
+    Datetimes are passed through to Flask's default so they keep the HTTP date
+    format clients already parse, Decimals stay strings, and ``RawJSON`` maps to
+    ``orjson.Fragment``. Calls with stdlib-only options (such as the indent used
+    in debug mode) fall back to the stdlib path.
+    """
+    
+    def _options(self):
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+    
+    def _default(self, value):
+        if isinstance(value, RawJSON):
+            return orjson.Fragment(value.encoded)
+        return self.default(value)
+    
+    def dumps_bytes(self, obj):
+        return orjson.dumps(obj, default=self._default, option=self._options())
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(obj)
+        return self._app.response_class(self.dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
+
+JSON_PROVIDERS = {
+    'stdlib': AppJSONProvider,
+    'orjson': OrjsonProvider
+}
+
+def get_json_provider_class(name='auto'):
+    """Provider class for JSON_PROVIDER; 'auto' prefers orjson when it is installed"""
+    if name == 'auto':
+        name = 'orjson' if orjson is not None else 'stdlib'
+    if name == 'orjson' and orjson is None:
+        raise RuntimeError('JSON_PROVIDER is orjson but the orjson package is not installed')
+    if name not in JSON_PROVIDERS:
+        raise ValueError(f'Unknown JSON_PROVIDER: {name}')
+    return JSON_PROVIDERS[name]
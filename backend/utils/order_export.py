@@ -0,0 +1,247 @@
+import csv
+import io
+from datetime import datetime
+import pymysql
+from config import Config
+from models.order import attach_order_items
+from models.stats import ORDER_STATUSES, USER_TYPES
+from utils.database import checkout_connection, get_db_connection
+
+DOWNLOAD_QUERY = """
+SELECT o.*,
+       CASE
+           WHEN bp.contact_person_name IS NOT NULL THEN bp.contact_person_name
+           WHEN ip.name IS NOT NULL THEN ip.name
+           ELSE 'Unknown User'
+       END as user_name,
+       u.email as user_email,
+       u.user_type,
+       m.customer_id, m.name as measurement_name, m.gender, m.notes,
+       m.chest, m.waist, m.seat, m.shirtLength as shirt_length,
+       m.armLength as arm_length, m.neck, m.hip,
+       m.poloShirtLength as polo_shirt_length, m.shoulderWidth as shoulder_width,
+       m.wrist, m.biceps
+FROM orders o
+JOIN users u ON o.user_id = u.id
+LEFT JOIN business_profiles bp ON u.id = bp.user_id
+LEFT JOIN individual_profiles ip ON u.id = ip.user_id
+LEFT JOIN measurements m ON o.measurement_id = m.id
+WHERE 1=1
+"""
+
+DOWNLOAD_SORTS = {
+    'newest': 'o.created_at DESC',
+    'oldest': 'o.created_at ASC',
+    'amount_high': 'o.total_amount DESC',
+    'amount_low': 'o.total_amount ASC'
+}
+
+# Measurement key in the export -> column alias in DOWNLOAD_QUERY
+MEASUREMENT_KEYS = {
+    'customer_id': 'customer_id',
+    'name': 'measurement_name',
+    'gender': 'gender',
+    'notes': 'notes',
+    'chest': 'chest',
+    'waist': 'waist',
+    'seat': 'seat',
+    'shirtLength': 'shirt_length',
+    'armLength': 'arm_length',
+    'neck': 'neck',
+    'hip': 'hip',
+    'poloShirtLength': 'polo_shirt_length',
+    'shoulderWidth': 'shoulder_width',
+    'wrist': 'wrist',
+    'biceps': 'biceps'
+}
+
+ORDER_CSV_COLUMNS = (
+    'id', 'created_at', 'status', 'payment_method', 'payment_status', 'total_amount',
+    'user_name', 'user_email', 'user_type', 'delivery_address'
+)
+ITEM_CSV_COLUMNS = ('product_id', 'product_name', 'quantity', 'price', 'size')
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
+CHUNK_SIZE = 64 * 1024
+
+DOWNLOAD_FILTER_KEYS = ('status', 'userType', 'dateFrom', 'dateTo', 'sortBy', 'limit')
+
+def validate_download_filters(filters):
+    """Raise ValueError for filter values the download query would not understand"""
+    if filters.get('status') not in (None, '', 'all') and filters['status'] not in ORDER_STATUSES:
+        raise ValueError(f'Status must be one of: {", ".join(ORDER_STATUSES)}')
+    if filters.get('userType') not in (None, '', 'all') and filters['userType'] not in USER_TYPES:
+        raise ValueError(f'userType must be one of: {", ".join(USER_TYPES)}')
+    # Checked here because a bad LIMIT would otherwise only fail mid-stream, after the headers went out
+    if filters.get('limit') not in (None, '', 'all'):
+        if not 1 <= int(filters['limit']) <= Config.EXPORT_MAX_LIMIT:
+            raise ValueError(f'limit must be between 1 and {Config.EXPORT_MAX_LIMIT}, or "all"')
+    for key in ('dateFrom', 'dateTo'):
+        if filters.get(key):
+            datetime.strptime(filters[key], '%Y-%m-%d')
+    if filters.get('format', 'json') not in ('json',) + tuple(EXPORT_FORMATS):
+        raise ValueError(f'format must be one of: json, {", ".join(EXPORT_FORMATS)}')
+
+def normalize_download_filters(filters, default_format='json'):
+    """Filters with "no filter" values dropped, so equivalent requests compare equal"""
+    normalized = {
+        key: filters[key] for key in DOWNLOAD_FILTER_KEYS
+        if filters.get(key) not in (None, '', 'all')
+    }
+    if 'limit' in normalized:
+        normalized['limit'] = int(normalized['limit'])
+    normalized['format'] = filters.get('format') or default_format
+    return normalized
+
+def _download_conditions(filters):
+    conditions = []
+    params = []
+    
+    if filters.get('status') and filters['status'] != 'all':
+        conditions.append("o.status = %s")
+        params.append(filters['status'])
+    
+    if filters.get('userType') and filters['userType'] != 'all':
+        conditions.append("u.user_type = %s")
+        params.append(filters['userType'])
+    
+    # Ranges on created_at itself so idx_created_at / idx_status_created_at stay usable
+    if filters.get('dateFrom'):
+        conditions.append("o.created_at >= %s")
+        params.append(filters['dateFrom'])
+    
+    if filters.get('dateTo'):
+        conditions.append("o.created_at < %s + INTERVAL 1 DAY")
+        params.append(filters['dateTo'])
+    
+    return conditions, params
+
+def build_download_query(filters):
+    conditions, params = _download_conditions(filters)
+    
+    query = DOWNLOAD_QUERY
+    if conditions:
+        query += " AND " + " AND ".join(conditions)
+    
+    query += f" ORDER BY {DOWNLOAD_SORTS.get(filters.get('sortBy'), DOWNLOAD_SORTS['newest'])}"
+    
+    if filters.get('limit') and filters['limit'] != 'all':
+        query += " LIMIT %s"
+        params.append(int(filters['limit']))
+    
+    return query, params
+
+def count_download_orders(filters):
+    """Number of orders an export with these filters will contain"""
+    conditions, params = _download_conditions(filters)
+    
+    query = "SELECT COUNT(*) as total FROM orders o JOIN users u ON o.user_id = u.id"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    
+    connection = get_db_connection()
+    cursor = connection.cursor()
+    cursor.execute(query, params)
+    total = cursor.fetchone()['total']
+    connection.close()
+    
+    if filters.get('limit') and filters['limit'] != 'all':
+        total = min(total, int(filters['limit']))
+    return total
+
+def _with_measurements(order):
+    if order['chest']:
+        order['measurements'] = {key: order[column] for key, column in MEASUREMENT_KEYS.items()}
+    else:
+        order['measurements'] = None
+    return order
+
+def iter_download_orders(filters, batch_size=None):
+    """Yield export rows one at a time from an unbuffered server-side cursor.
+    
+    Items are loaded per batch of orders on a second connection, since the
+    streaming connection cannot run other queries until its result is drained.
+    """
+    batch_size = batch_size or Config.EXPORT_BATCH_SIZE
+    query, params = build_download_query(filters)
+    
+    stream_connection = checkout_connection()
+    items_connection = checkout_connection()
+    completed = False
+    try:
+        stream_cursor = stream_connection.cursor(pymysql.cursors.SSDictCursor)
+        stream_cursor.execute(query, params)
+        items_cursor = items_connection.cursor()
+        
+        while True:
+            orders = stream_cursor.fetchmany(batch_size)
+            if not orders:
+                break
+            attach_order_items(items_cursor, orders)
+            for order in orders:
+                yield _with_measurements(order)
+        
+        stream_cursor.close()
+        completed = True
+    finally:
+        items_connection.release()
+        # An abandoned unbuffered result leaves the connection unusable, so drop it
+        if completed:
+            stream_connection.release()
+        else:
+            stream_connection.discard()
+
+def _csv_rows(order):
+    order_values = [order[column] for column in ORDER_CSV_COLUMNS]
+    measurements = order['measurements'] or {}
+    measurement_values = [measurements.get(key) for key in MEASUREMENT_KEYS]
+    for item in order['items'] or [None]:
+        item_values = [item[column] for column in ITEM_CSV_COLUMNS] if item else [None] * len(ITEM_CSV_COLUMNS)
+        yield order_values + measurement_values + item_values
+
+def iter_csv(orders):
+    """One CSV line per order item (or per order without items), emitted in ~64 KiB chunks"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(
+        ['order_' + column if column == 'id' else column for column in ORDER_CSV_COLUMNS]
+        + ['measurement_' + key for key in MEASUREMENT_KEYS]
+        + ['item_' + column for column in ITEM_CSV_COLUMNS]
+    )
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    
+    for order in orders:
+        writer.writerows(_csv_rows(order))
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
+    if buffer.tell():
+        yield buffer.getvalue()
+
+def iter_ndjson(orders, dumps):
+    """One JSON document per order, emitted in ~64 KiB chunks"""
+    lines = []
+    size = 0
+    for order in orders:
+        line = dumps(order)
+        lines.append(line)
+        size += len(line) + 1
+        if size >= CHUNK_SIZE:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+            size = 0
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+def serialize_export(orders, export_format, dumps):
+    if export_format == 'csv':
+        return iter_csv(orders)
+    return iter_ndjson(orders, dumps)
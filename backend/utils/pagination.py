@@ -0,0 +1,48 @@
+import base64
+import json
+import math
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+class InvalidCursor(ValueError):
+    pass
+
+def encode_cursor(sort, key, row_id):
+    """Pack a keyset position (sort option, sort-key value, id) into an opaque token"""
+    if isinstance(key, datetime):
+        value = {'t': 'dt', 'v': key.isoformat()}
+    elif isinstance(key, Decimal):
+        value = {'t': 'dec', 'v': str(key)}
+    else:
+        value = {'t': 'raw', 'v': key}
+    
+    payload = json.dumps({'s': sort, 'k': value, 'i': row_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, sort):
+    """Return (key, id) for a cursor produced by encode_cursor with the same sort option"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        value = payload['k']
+        
+        if value['t'] == 'dt':
+            key = datetime.fromisoformat(value['v'])
+        elif value['t'] == 'dec':
+            key = Decimal(value['v'])
+        else:
+            key = value['v']
+        row_id = int(payload['i'])
+    except (ValueError, KeyError, TypeError, InvalidOperation):
+        raise InvalidCursor('Malformed cursor')
+    
+    # Keys end up as SQL parameters compared against NOT NULL sort columns, so a
+    # forged cursor may only carry a finite scalar
+    if isinstance(key, bool) or not isinstance(key, (str, int, float, datetime, Decimal)):
+        raise InvalidCursor('Malformed cursor')
+    if isinstance(key, float) and not math.isfinite(key) or isinstance(key, Decimal) and not key.is_finite():
+        raise InvalidCursor('Malformed cursor')
+    
+    if payload.get('s') != sort:
+        raise InvalidCursor('Cursor was issued for a different sort order')
+    return key, row_id
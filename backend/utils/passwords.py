@@ -0,0 +1,116 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+import bcrypt
+from config import Config
+
+class PasswordHasherBusy(Exception):
+    pass
+
+class PasswordHasher:
+    """Runs bcrypt on a small dedicated pool so login bursts cannot starve other requests.
+    
+    bcrypt releases the GIL while hashing, so ``max_workers`` caps how many
+    cores password work may occupy. Once ``max_pending`` operations are queued
+    or running, new ones are rejected straight away instead of piling up.
+    """
+    
+    def __init__(self, max_workers, max_pending, timeout):
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bcrypt')
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._rejected = 0
+        self._timings = {
+            'hash': {'count': 0, 'totalMs': 0.0, 'maxMs': 0.0},
+            'check': {'count': 0, 'totalMs': 0.0, 'maxMs': 0.0}
+        }
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+    
+    def _run(self, operation, fn, *args):
+        started = time.monotonic()
+        try:
+            return fn(*args)
+        finally:
+            elapsed_ms = (time.monotonic() - started) * 1000
+            with self._lock:
+                timing = self._timings[operation]
+                timing['count'] += 1
+                timing['totalMs'] += elapsed_ms
+                timing['maxMs'] = max(timing['maxMs'], elapsed_ms)
+                self._pending -= 1
+            self._slots.release()
+    
+    def submit(self, operation, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise PasswordHasherBusy('Password hashing queue is full')
+        with self._lock:
+            self._pending += 1
+        return self._executor.submit(self._run, operation, fn, *args)
+    
+    def _wait(self, future):
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            raise PasswordHasherBusy('Timed out waiting for password hashing')
+    
+    def hash_password(self, password):
+        return self._wait(self.submit('hash', _hash, password))
+    
+    def check_password(self, password, password_hash):
+        return self._wait(self.submit('check', _check, password, password_hash))
+    
+    def stats(self):
+        with self._lock:
+            timings = {}
+            for operation, timing in self._timings.items():
+                timings[operation] = dict(timing)
+                timings[operation]['avgMs'] = timing['totalMs'] / timing['count'] if timing['count'] else 0.0
+            return {
+                'workers': self.max_workers,
+                'maxPending': self.max_pending,
+                'pending': self._pending,
+                'rejected': self._rejected,
+                'timings': timings
+            }
+
+def _hash(password):
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=Config.BCRYPT_ROUNDS)).decode('utf-8')
+
+def _check(password, password_hash):
+    return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+
+def needs_rehash(password_hash):
+    """True when the stored hash was made with a different BCRYPT_ROUNDS"""
+    try:
+        return int(password_hash.split('$')[2]) != Config.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return False
+
+hasher = PasswordHasher(
+    max_workers=Config.BCRYPT_WORKERS,
+    max_pending=Config.BCRYPT_MAX_PENDING,
+    timeout=Config.BCRYPT_TIMEOUT
+)
+
+def hash_password(password):
+    return hasher.hash_password(password)
+
+def check_password(password, password_hash):
+    return hasher.check_password(password, password_hash)
+
+def rehash_in_background(user_id, password, save):
+    """Re-hash with the current cost after a successful login; skipped when the pool is busy"""
+    def rehash():
+        save(user_id, _hash(password))
+    try:
+        hasher.submit('hash', rehash)
+    except PasswordHasherBusy:
+        pass
+
+def get_hasher_stats():
+    return hasher.stats()
@@ -0,0 +1,159 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import request, jsonify
+from config import Config
+
+class MemoryBucketBackend:
+    """Token buckets held in this process; fine for a single worker.
+
+    Buckets are kept in least-recently-used order together with the time each
+    one will have refilled completely, so pruning pops from the head instead
+    of scanning every key.
+    """
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity, refill_per_second):
+        now = time.monotonic()
+        with self._lock:
+            # Popping and re-inserting moves the bucket to the most recently used end
+            bucket = self._buckets.pop(key, None)
+            tokens = capacity if bucket is None else min(capacity, bucket[0] + (now - bucket[1]) * refill_per_second)
+
+            if tokens >= 1:
+                tokens -= 1
+                allowed, retry_after = True, 0
+            else:
+                allowed, retry_after = False, (1 - tokens) / refill_per_second
+
+            full_at = now + (capacity - tokens) / refill_per_second
+            self._buckets[key] = (tokens, now, full_at)
+            self._prune(now)
+        return allowed, retry_after
+
+    def _prune(self, now):
+        # A bucket that has refilled completely carries no state worth keeping;
+        # past max_keys the least recently used buckets go regardless
+        while self._buckets:
+            key, (_, _, full_at) = next(iter(self._buckets.items()))
+            if full_at > now and len(self._buckets) <= self.max_keys:
+                break
+            del self._buckets[key]
+
+class RedisBucketBackend:
+    """Token buckets shared by every worker through Redis"""
+
+    SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + (now - ts) * rate)
+    local allowed = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+        allowed = 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return {allowed, tostring(tokens)}
+    """
+
+    def __init__(self, url):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError('RATE_LIMIT_REDIS_URL is set but the redis package is not installed')
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    def consume(self, key, capacity, refill_per_second):
+        allowed, tokens = self._script(
+            keys=[f'ratelimit:{key}'],
+            args=[capacity, refill_per_second, time.time()]
+        )
+        if allowed:
+            return True, 0
+        return False, (1 - float(tokens)) / refill_per_second
+
+class LoginRateLimiter:
+    def __init__(self, backend, ip_limit, email_limit, window):
+        self.backend = backend
+        self.ip_limit = ip_limit
+        self.email_limit = email_limit
+        self.window = window
+        self._lock = threading.Lock()
+        self._counters = {'allowed': 0, 'rejectedByIp': 0, 'rejectedByEmail': 0}
+
+    def check(self, ip, email):
+        """Take one token from the IP and email buckets; return seconds to wait, or 0"""
+        allowed, retry_after = self.backend.consume(f'ip:{ip}', self.ip_limit, self.ip_limit / self.window)
+        if not allowed:
+            self._count('rejectedByIp')
+            return retry_after
+
+        if email:
+            allowed, retry_after = self.backend.consume(
+                f'email:{email.strip().lower()}', self.email_limit, self.email_limit / self.window
+            )
+            if not allowed:
+                self._count('rejectedByEmail')
+                return retry_after
+
+        self._count('allowed')
+        return 0
+
+    def _count(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+        stats['rejected'] = stats['rejectedByIp'] + stats['rejectedByEmail']
+        stats['backend'] = type(self.backend).__name__
+        return stats
+
+def _create_backend():
+    if Config.RATE_LIMIT_REDIS_URL:
+        return RedisBucketBackend(Config.RATE_LIMIT_REDIS_URL)
+    return MemoryBucketBackend()
+
+login_limiter = LoginRateLimiter(
+    _create_backend(),
+    ip_limit=Config.LOGIN_RATE_LIMIT_PER_IP,
+    email_limit=Config.LOGIN_RATE_LIMIT_PER_EMAIL,
+    window=Config.LOGIN_RATE_LIMIT_WINDOW
+)
+
+def limit_login_attempts(f):
+    """Reject login attempts over the per-IP/per-email budget before any user lookup or bcrypt work"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        data = request.get_json(silent=True)
+        email = data.get('email') if isinstance(data, dict) else None
+        email = email if isinstance(email, str) else None
+
+        retry_after = login_limiter.check(request.remote_addr, email)
+        if retry_after:
+            response = jsonify({
+                'success': False,
+                'message': 'Too many login attempts',
+                'error': 'Please wait before trying again'
+            })
+            response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+            return response, 429
+
+        return f(*args, **kwargs)
+    return decorated_function
+
+def get_login_limiter_stats():
+    return login_limiter.stats()
@@ -0,0 +1,66 @@
+import json
+
+_decoder = json.JSONDecoder()
+
+class RawJSON:
+    """Already-encoded JSON text that the app's JSON provider embeds verbatim.
+    
+    Used for the products JSON columns so responses do not parse MySQL's JSON
+    text only to serialize it again.
+    """
+    
+    __slots__ = ('encoded',)
+    
+    def __init__(self, encoded):
+        self.encoded = encoded
+    
+    def decode(self):
+        return json.loads(self.encoded)
+    
+    def __str__(self):
+        return self.encoded
+    
+    def __repr__(self):
+        return f'RawJSON({self.encoded!r})'
+    
+    def __eq__(self, other):
+        return isinstance(other, RawJSON) and other.encoded == self.encoded
+    
+    def __hash__(self):
+        return hash(self.encoded)
+
+def raw_json(value):
+    """Wrap a JSON column value for passthrough; NULL and empty stay as they are"""
+    if not value:
+        return value
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+    return RawJSON(value)
+
+def load_json(value):
+    """Python value of a column that may or may not have been wrapped"""
+    if isinstance(value, RawJSON):
+        return value.decode()
+    if isinstance(value, (str, bytes)):
+        return json.loads(value)
+    return value
+
+def first_array_item(value):
+    """First element of a JSON array without decoding the rest of it"""
+    if isinstance(value, RawJSON):
+        value = value.encoded
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+    if not isinstance(value, str):
+        return value[0] if value else None
+    
+    start = value.find('[')
+    if start == -1:
+        return None
+    index = start + 1
+    while index < len(value) and value[index].isspace():
+        index += 1
+    if index >= len(value) or value[index] == ']':
+        return None
+    item, _ = _decoder.raw_decode(value, index)
+    return item
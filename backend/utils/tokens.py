@@ -0,0 +1,55 @@
+import hashlib
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta
+import jwt
+from config import Config
+
+def issue_access_token(user):
+    """Issue a short-lived access token carrying everything require_auth checks"""
+    now = datetime.utcnow()
+    return jwt.encode({
+        'user_id': user['id'],
+        'email': user['email'],
+        'user_type': user['user_type'],
+        'status': user['status'],
+        'iat': now,
+        'exp': now + timedelta(minutes=Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+    }, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+
+def generate_refresh_token():
+    return secrets.token_urlsafe(48)
+
+def hash_refresh_token(token):
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+class RevocationSet:
+    """Users whose access tokens issued up to a point in time are rejected.
+    
+    Entries only need to outlive the longest access token, so the set stays
+    small and is pruned on every write.
+    """
+    
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._revoked = {}
+        self._lock = threading.Lock()
+    
+    def revoke(self, user_id):
+        # Whole seconds, like the iat claim, so a token issued in the same second is revoked too
+        now = int(time.time())
+        with self._lock:
+            self._revoked[user_id] = now
+            cutoff = now - self.ttl
+            for key in [key for key, revoked_at in self._revoked.items() if revoked_at < cutoff]:
+                del self._revoked[key]
+    
+    def is_revoked(self, user_id, issued_at):
+        revoked_at = self._revoked.get(user_id)
+        return revoked_at is not None and issued_at <= revoked_at
+    
+    def __len__(self):
+        return len(self._revoked)
+
+revoked_users = RevocationSet(Config.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60)
@@ -14,4 +14,11 @@ def validate_pan(pan):
 
 def validate_phone(phone):
     pattern = r'^[6-9]\d{9}$'
-    return re.match(pattern, phone) is not None
\ No newline at end of file
+    return re.match(pattern, phone) is not None
+
+def validate_product_id(product_id):
+    if isinstance(product_id, bool):
+        return False
+    if isinstance(product_id, int):
+        return product_id > 0
+    return isinstance(product_id, str) and re.match(r'^[0-9]+$', product_id) is not None
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import Layout from '../common/Layout';
-import { productsAPI } from '../../services/api';
+import { productsAPI, resolveImageUrl } from '../../services/api';
 import { Search, Filter, ShoppingCart, Star, Tag, TrendingUp, Package, Heart } from 'lucide-react';
 import { SORT_OPTIONS } from '../../utils/constants';
 
@@ -23,7 +23,8 @@ const Products = () => {
         search: searchTerm,
         sort: sortBy,
         page: currentPage,
-        limit: 12
+        limit: 12,
+        imageSize: 'thumb'
       };
       const response = await productsAPI.getProducts(params);
       setProducts(response.data.data.products);
@@ -269,7 +270,7 @@ const Products = () => {
                     overflow: 'hidden'
                   }}>
                     <img 
-                      src={product.images?.[0] || '/placeholder-product.jpg'} 
+                      src={resolveImageUrl(product.images?.[0]) || '/placeholder-product.jpg'} 
                       alt={product.name}
                       style={{ 
                         width: '100%', 
@@ -1,7 +1,7 @@
 // File: src/components/common/Cart.js
 import React, { useState, useEffect } from 'react';
 import Layout from './Layout';
-import { productsAPI } from '../../services/api';
+import { productsAPI, resolveImageUrl } from '../../services/api';
 import { 
   ShoppingCart, 
   Plus, 
@@ -229,7 +229,7 @@ const Cart = ({ userType = 'individual' }) => {
                   >
                     {/* Product Image */}
                     <img 
-                      src={item.image || '/placeholder-product.jpg'} 
+                      src={resolveImageUrl(item.image) || '/placeholder-product.jpg'} 
                       alt={item.productName}
                       style={{
                         width: '100px',
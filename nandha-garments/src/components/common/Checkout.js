@@ -1,7 +1,7 @@
 // File: src/components/common/Checkout.js
 import React, { useState, useEffect } from 'react';
 import Layout from './Layout';
-import { productsAPI, businessAPI, individualAPI } from '../../services/api';
+import { productsAPI, businessAPI, individualAPI, resolveImageUrl } from '../../services/api';
 import { 
   ArrowLeft, 
   MapPin, 
@@ -581,7 +581,7 @@ const Checkout = ({ userType = 'individual' }) => {
                     marginBottom: index < cartItems.length - 1 ? '12px' : '0'
                   }}>
                     <img 
-                      src={item.image || '/placeholder-product.jpg'} 
+                      src={resolveImageUrl(item.image) || '/placeholder-product.jpg'} 
                       alt={item.productName}
                       style={{
                         width: '60px',
@@ -793,7 +793,7 @@ const Checkout = ({ userType = 'individual' }) => {
                       marginBottom: index < cartItems.length - 1 ? '16px' : '0'
                     }}>
                       <img 
-                        src={item.image || '/placeholder-product.jpg'} 
+                        src={resolveImageUrl(item.image) || '/placeholder-product.jpg'} 
                         alt={item.productName}
                         style={{
                           width: '80px',
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import Layout from '../common/Layout';
-import { productsAPI } from '../../services/api';
+import { productsAPI, resolveImageUrl } from '../../services/api';
 import { 
   Search, 
   Filter, 
@@ -39,7 +39,8 @@ const Products = () => {
         search: searchTerm,
         sort: sortBy,
         page: currentPage,
-        limit: 12
+        limit: 12,
+        imageSize: 'medium'
       };
       const response = await productsAPI.getProducts(params);
       setProducts(response.data.data.products);
@@ -421,7 +422,7 @@ const Products = () => {
                     {/* Product Image */}
                     <div style={{ position: 'relative', overflow: 'hidden' }}>
                       <img 
-                        src={product.images?.[0] || '/placeholder-product.jpg'} 
+                        src={resolveImageUrl(product.images?.[0]) || '/placeholder-product.jpg'} 
                         alt={product.name}
                         style={{
                           width: '100%',
@@ -656,7 +657,7 @@ const Products = () => {
                     alignItems: 'center'
                   }}>
                     <img 
-                      src={product.images?.[0] || '/placeholder-product.jpg'} 
+                      src={resolveImageUrl(product.images?.[0]) || '/placeholder-product.jpg'} 
                       alt={product.name}
                       style={{
                         width: '120px',
@@ -931,7 +932,7 @@ const Products = () => {
               {/* Product Image */}
               <div style={{ position: 'relative' }}>
                 <img 
-                  src={selectedProduct.images?.[0] || '/placeholder-product.jpg'} 
+                  src={resolveImageUrl(selectedProduct.images?.[0]) || '/placeholder-product.jpg'} 
                   alt={selectedProduct.name}
                   style={{
                     width: '100%',
@@ -722,7 +722,7 @@
 
 // export default AddProduct;
 import React, { useState, useEffect } from 'react';
-import { superAdminAPI } from '../../services/api';
+import { superAdminAPI, resolveImageUrl } from '../../services/api';
 import { PRODUCT_SIZES } from '../../utils/constants';
 import { ArrowLeft, Save, Upload, X, Package, Tag, DollarSign, Image as ImageIcon } from 'lucide-react';
 
@@ -1273,7 +1273,7 @@ const AddProduct = ({ product, onSubmit, onCancel }) => {
                     boxShadow: '0 4px 12px rgba(0, 0, 0, 0.1)'
                   }}>
                     <img 
-                      src={image} 
+                      src={resolveImageUrl(image)} 
                       alt={`Product ${index + 1}`}
                       style={{ 
                         width: '100%', 
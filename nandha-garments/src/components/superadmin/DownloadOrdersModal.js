@@ -8,7 +8,8 @@ const DownloadOrdersModal = ({ isOpen, onClose, onDownload, totalOrders }) => {
     dateFrom: '',
     dateTo: '',
     limit: 50,
-    sortBy: 'newest'
+    sortBy: 'newest',
+    format: 'pdf'
   });
   const [downloading, setDownloading] = useState(false);
 
@@ -44,6 +45,12 @@ const DownloadOrdersModal = ({ isOpen, onClose, onDownload, totalOrders }) => {
     { value: 'all', label: 'All Orders' }
   ];
 
+  const formatOptions = [
+    { value: 'pdf', label: 'PDF' },
+    { value: 'csv', label: 'CSV (spreadsheet)' },
+    { value: 'ndjson', label: 'NDJSON (one order per line)' }
+  ];
+
   const handleFilterChange = (key, value) => {
     setFilters(prev => ({ ...prev, [key]: value }));
   };
@@ -330,6 +337,37 @@ const DownloadOrdersModal = ({ isOpen, onClose, onDownload, totalOrders }) => {
                 ))}
               </select>
             </div>
+
+            <div>
+              <label style={{
+                display: 'block',
+                fontSize: '14px',
+                fontWeight: '600',
+                color: '#374151',
+                marginBottom: '8px'
+              }}>
+                Format
+              </label>
+              <select
+                value={filters.format}
+                onChange={(e) => handleFilterChange('format', e.target.value)}
+                style={{
+                  width: '100%',
+                  padding: '10px 12px',
+                  border: '2px solid #e5e7eb',
+                  borderRadius: '8px',
+                  fontSize: '14px',
+                  background: 'white',
+                  outline: 'none'
+                }}
+              >
+                {formatOptions.map(option => (
+                  <option key={option.value} value={option.value}>
+                    {option.label}
+                  </option>
+                ))}
+              </select>
+            </div>
           </div>
         </div>
 
@@ -371,7 +409,7 @@ const DownloadOrdersModal = ({ isOpen, onClose, onDownload, totalOrders }) => {
               color: '#0369a1'
             }}>
               <FileText size={16} />
-              <span>PDF format</span>
+              <span>{filters.format.toUpperCase()} format</span>
             </div>
             <div style={{
               display: 'flex',
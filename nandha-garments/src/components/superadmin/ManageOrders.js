@@ -6,21 +6,35 @@ import { ORDER_STATUS } from '../../utils/constants';
 import DownloadOrdersModal from './DownloadOrdersModal';
 import { generateOrdersPDF } from '../../utils/pdfGenerator';
 
+const ORDERS_PER_PAGE = 20;
+const EXPORT_POLL_INTERVAL = 1000;
+
 const ManageOrders = () => {
   const [orders, setOrders] = useState([]);
   const [loading, setLoading] = useState(true);
   const [selectedOrder, setSelectedOrder] = useState(null);
   const [updatingStatus, setUpdatingStatus] = useState(null);
   const [showDownloadModal, setShowDownloadModal] = useState(false);
+  const [currentPage, setCurrentPage] = useState(1);
+  const [totalPages, setTotalPages] = useState(1);
+  const [totalOrders, setTotalOrders] = useState(0);
+  const [statusFilter, setStatusFilter] = useState('all');
 
   useEffect(() => {
     fetchOrders();
-  }, []);
+  }, [currentPage, statusFilter]);
 
   const fetchOrders = async () => {
     try {
-      const response = await superAdminAPI.getOrders();
-      setOrders(response.data.data);
+      const params = { page: currentPage, limit: ORDERS_PER_PAGE };
+      if (statusFilter !== 'all') {
+        params.status = statusFilter;
+      }
+      const response = await superAdminAPI.getOrders(params);
+      const { orders, totalPages, totalOrders } = response.data.data;
+      setOrders(orders);
+      setTotalPages(totalPages);
+      setTotalOrders(totalOrders);
     } catch (error) {
       console.error('Error fetching orders:', error);
     } finally {
@@ -43,8 +57,34 @@ const ManageOrders = () => {
     }
   };
 
-  const handleDownloadOrders = async (filters) => {
+  const handleDownloadOrders = async ({ format, ...filters }) => {
     try {
+      if (format !== 'pdf') {
+        // CSV/NDJSON are built by a background export job; poll it, then hand the file to the browser
+        let job = (await superAdminAPI.createExport({ ...filters, format })).data.data;
+        while (job.status === 'queued' || job.status === 'running') {
+          await new Promise(resolve => setTimeout(resolve, EXPORT_POLL_INTERVAL));
+          job = (await superAdminAPI.getExport(job.id)).data.data;
+        }
+        if (job.status !== 'completed') {
+          throw new Error(job.error || 'Export failed');
+        }
+
+        const response = await superAdminAPI.downloadExport(job.id);
+        const disposition = response.headers['content-disposition'] || '';
+        const match = disposition.match(/filename="?([^"]+)"?/);
+        const url = window.URL.createObjectURL(response.data);
+        const link = document.createElement('a');
+        link.href = url;
+        link.download = match ? match[1] : `orders.${format}`;
+        document.body.appendChild(link);
+        link.click();
+        link.remove();
+        window.URL.revokeObjectURL(url);
+        setShowDownloadModal(false);
+        return;
+      }
+
       // Fetch orders with measurements for download
       const response = await superAdminAPI.getOrdersForDownload(filters);
       const ordersWithMeasurements = response.data.data;
@@ -193,7 +233,32 @@ const ManageOrders = () => {
               }}>
                 <span style={{ display: 'flex', alignItems: 'center', gap: '6px' }}>
                   <ShoppingCart size={16} />
-                  {orders.length} Total Orders
+                  {totalOrders} Total Orders
+                </span>
+                <span style={{ display: 'flex', alignItems: 'center', gap: '6px' }}>
+                  <Filter size={16} />
+                  <select
+                    value={statusFilter}
+                    onChange={(e) => {
+                      setStatusFilter(e.target.value);
+                      setCurrentPage(1);
+                    }}
+                    style={{
+                      background: 'rgba(255, 255, 255, 0.2)',
+                      border: 'none',
+                      color: 'white',
+                      padding: '4px 8px',
+                      borderRadius: '6px',
+                      fontSize: '14px'
+                    }}
+                  >
+                    <option value="all" style={{ color: '#374151' }}>All Statuses</option>
+                    {Object.values(ORDER_STATUS).map(status => (
+                      <option key={status} value={status} style={{ color: '#374151' }}>
+                        {status.replace('_', ' ')}
+                      </option>
+                    ))}
+                  </select>
                 </span>
               </div>
             </div>
@@ -470,6 +535,35 @@ const ManageOrders = () => {
                 </tbody>
               </table>
             </div>
+
+            {/* Pagination */}
+            {totalPages > 1 && (
+              <div style={{
+                display: 'flex',
+                justifyContent: 'center',
+                alignItems: 'center',
+                gap: '12px',
+                paddingTop: '20px',
+                fontSize: '14px',
+                color: '#374151'
+              }}>
+                <button
+                  onClick={() => setCurrentPage(currentPage - 1)}
+                  disabled={currentPage === 1}
+                  className="btn btn-secondary"
+                >
+                  Previous
+                </button>
+                <span>Page {currentPage} of {totalPages}</span>
+                <button
+                  onClick={() => setCurrentPage(currentPage + 1)}
+                  disabled={currentPage === totalPages}
+                  className="btn btn-secondary"
+                >
+                  Next
+                </button>
+              </div>
+            )}
           </div>
         ) : (
           <div style={{
@@ -516,7 +610,7 @@ const ManageOrders = () => {
             isOpen={showDownloadModal}
             onClose={() => setShowDownloadModal(false)}
             onDownload={handleDownloadOrders}
-            totalOrders={orders.length}
+            totalOrders={totalOrders}
           />
         )}
 
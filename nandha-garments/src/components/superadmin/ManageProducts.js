@@ -1,24 +1,52 @@
 import React, { useState, useEffect } from 'react';
 import Layout from '../common/Layout';
-import { superAdminAPI } from '../../services/api';
-import { Plus, Edit3, Trash2, Package, Tag, DollarSign, Image as ImageIcon, Calendar, Star } from 'lucide-react';
+import { superAdminAPI, resolveImageUrl } from '../../services/api';
+import { Plus, Edit3, Trash2, Package, Tag, DollarSign, Image as ImageIcon, Calendar, Star, Search, Filter } from 'lucide-react';
 import AddProduct from './AddProduct';
 
+const PRODUCTS_PER_PAGE = 24;
+const SEARCH_DEBOUNCE = 300;
+
 const ManageProducts = () => {
   const [products, setProducts] = useState([]);
   const [loading, setLoading] = useState(true);
   const [showAddForm, setShowAddForm] = useState(false);
   const [editingProduct, setEditingProduct] = useState(null);
   const [deletingId, setDeletingId] = useState(null);
+  const [currentPage, setCurrentPage] = useState(1);
+  const [totalPages, setTotalPages] = useState(1);
+  const [totalProducts, setTotalProducts] = useState(0);
+  const [statusFilter, setStatusFilter] = useState('all');
+  const [sortBy, setSortBy] = useState('date_desc');
+  const [searchInput, setSearchInput] = useState('');
+  const [search, setSearch] = useState('');
+
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      setSearch(searchInput.trim());
+      setCurrentPage(1);
+    }, SEARCH_DEBOUNCE);
+    return () => clearTimeout(timer);
+  }, [searchInput]);
 
   useEffect(() => {
     fetchProducts();
-  }, []);
+  }, [currentPage, statusFilter, sortBy, search]);
 
   const fetchProducts = async () => {
     try {
-      const response = await superAdminAPI.getProducts();
-      setProducts(response.data.data);
+      const params = { page: currentPage, limit: PRODUCTS_PER_PAGE, sort: sortBy };
+      if (statusFilter !== 'all') {
+        params.status = statusFilter;
+      }
+      if (search) {
+        params.search = search;
+      }
+      const response = await superAdminAPI.getProducts(params);
+      const { products, totalPages, totalProducts } = response.data.data;
+      setProducts(products);
+      setTotalPages(totalPages);
+      setTotalProducts(totalProducts);
     } catch (error) {
       console.error('Error fetching products:', error);
     } finally {
@@ -31,9 +59,15 @@ const ManageProducts = () => {
     setShowAddForm(true);
   };
 
-  const handleEditProduct = (product) => {
-    setEditingProduct(product);
-    setShowAddForm(true);
+  const handleEditProduct = async (product) => {
+    try {
+      // List rows are trimmed down; the editor needs the full product
+      const response = await superAdminAPI.getProduct(product.id);
+      setEditingProduct(response.data.data);
+      setShowAddForm(true);
+    } catch (error) {
+      console.error('Error loading product:', error);
+    }
   };
 
   const handleDeleteProduct = async (id) => {
@@ -179,7 +213,68 @@ const ManageProducts = () => {
               }}>
                 <span style={{ display: 'flex', alignItems: 'center', gap: '6px' }}>
                   <Package size={16} />
-                  {products.length} Products
+                  {totalProducts} Products
+                </span>
+                <span style={{ display: 'flex', alignItems: 'center', gap: '6px' }}>
+                  <Search size={16} />
+                  <input
+                    type="search"
+                    value={searchInput}
+                    onChange={(e) => setSearchInput(e.target.value)}
+                    placeholder="Search products"
+                    style={{
+                      background: 'rgba(255, 255, 255, 0.2)',
+                      border: 'none',
+                      color: 'white',
+                      padding: '4px 8px',
+                      borderRadius: '6px',
+                      fontSize: '14px'
+                    }}
+                  />
+                </span>
+                <span style={{ display: 'flex', alignItems: 'center', gap: '6px' }}>
+                  <Filter size={16} />
+                  <select
+                    value={statusFilter}
+                    onChange={(e) => {
+                      setStatusFilter(e.target.value);
+                      setCurrentPage(1);
+                    }}
+                    style={{
+                      background: 'rgba(255, 255, 255, 0.2)',
+                      border: 'none',
+                      color: 'white',
+                      padding: '4px 8px',
+                      borderRadius: '6px',
+                      fontSize: '14px'
+                    }}
+                  >
+                    <option value="all" style={{ color: '#374151' }}>All Statuses</option>
+                    <option value="active" style={{ color: '#374151' }}>Active</option>
+                    <option value="inactive" style={{ color: '#374151' }}>Inactive</option>
+                  </select>
+                  <select
+                    value={sortBy}
+                    onChange={(e) => {
+                      setSortBy(e.target.value);
+                      setCurrentPage(1);
+                    }}
+                    style={{
+                      background: 'rgba(255, 255, 255, 0.2)',
+                      border: 'none',
+                      color: 'white',
+                      padding: '4px 8px',
+                      borderRadius: '6px',
+                      fontSize: '14px'
+                    }}
+                  >
+                    <option value="date_desc" style={{ color: '#374151' }}>Newest First</option>
+                    <option value="date_asc" style={{ color: '#374151' }}>Oldest First</option>
+                    <option value="name_asc" style={{ color: '#374151' }}>Name: A to Z</option>
+                    <option value="name_desc" style={{ color: '#374151' }}>Name: Z to A</option>
+                    <option value="price_asc" style={{ color: '#374151' }}>Price: Low to High</option>
+                    <option value="price_desc" style={{ color: '#374151' }}>Price: High to Low</option>
+                  </select>
                 </span>
               </div>
             </div>
@@ -217,6 +312,7 @@ const ManageProducts = () => {
         </div>
 
         {products.length > 0 ? (
+          <>
           <div style={{
             display: 'grid',
             gridTemplateColumns: 'repeat(auto-fill, minmax(350px, 1fr))',
@@ -250,7 +346,7 @@ const ManageProducts = () => {
                   background: 'linear-gradient(135deg, #f3f4f6, #e5e7eb)'
                 }}>
                   <img 
-                    src={product.images?.[0] || '/placeholder-product.jpg'} 
+                    src={resolveImageUrl(product.thumbnail) || '/placeholder-product.jpg'} 
                     alt={product.name}
                     style={{ 
                       width: '100%', 
@@ -368,7 +464,7 @@ const ManageProducts = () => {
                       color: '#0c4a6e',
                       margin: 0
                     }}>
-                      {formatCurrency(product.selling_price)}
+                      {formatCurrency(product.sellingPrice)}
                     </p>
                   </div>
                   {product.sellingPrice < product.price && (
@@ -525,6 +621,36 @@ const ManageProducts = () => {
               </div>
             ))}
           </div>
+
+          {/* Pagination */}
+          {totalPages > 1 && (
+            <div style={{
+              display: 'flex',
+              justifyContent: 'center',
+              alignItems: 'center',
+              gap: '12px',
+              paddingTop: '24px',
+              fontSize: '14px',
+              color: '#374151'
+            }}>
+              <button
+                onClick={() => setCurrentPage(currentPage - 1)}
+                disabled={currentPage === 1}
+                className="btn btn-secondary"
+              >
+                Previous
+              </button>
+              <span>Page {currentPage} of {totalPages}</span>
+              <button
+                onClick={() => setCurrentPage(currentPage + 1)}
+                disabled={currentPage === totalPages}
+                className="btn btn-secondary"
+              >
+                Next
+              </button>
+            </div>
+          )}
+          </>
         ) : (
           <div style={{
             background: 'white',
@@ -20,35 +20,79 @@ import {
   UserX
 } from 'lucide-react';
 
+const USERS_PER_PAGE = 20;
+const SEARCH_DEBOUNCE = 300;
+
 const ManageUsers = () => {
-  const [businessUsers, setBusinessUsers] = useState([]);
-  const [individualUsers, setIndividualUsers] = useState([]);
-  const [filteredUsers, setFilteredUsers] = useState([]);
+  const [users, setUsers] = useState([]);
+  const [userTotals, setUserTotals] = useState({ business: 0, individual: 0 });
   const [activeTab, setActiveTab] = useState('business');
   const [loading, setLoading] = useState(true);
   const [searchTerm, setSearchTerm] = useState('');
+  const [search, setSearch] = useState('');
   const [statusFilter, setStatusFilter] = useState('all');
-  const [sortBy, setSortBy] = useState('newest');
+  const [sortBy, setSortBy] = useState('pending_first');
+  const [currentPage, setCurrentPage] = useState(1);
+  const [totalPages, setTotalPages] = useState(1);
+  const [totalUsers, setTotalUsers] = useState(0);
   const [selectedUser, setSelectedUser] = useState(null);
+  const [selectedLogo, setSelectedLogo] = useState(null);
   const [actionLoading, setActionLoading] = useState(new Set());
 
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      setSearch(searchTerm.trim());
+      setCurrentPage(1);
+    }, SEARCH_DEBOUNCE);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
   useEffect(() => {
     fetchUsers();
-  }, [activeTab]);
+  }, [activeTab, search, statusFilter, sortBy, currentPage]);
 
   useEffect(() => {
-    filterAndSortUsers();
-  }, [businessUsers, individualUsers, activeTab, searchTerm, statusFilter, sortBy]);
+    // Logos are not part of the list rows; load the selected one on demand
+    if (!selectedUser?.logoUrl) {
+      setSelectedLogo(null);
+      return undefined;
+    }
+    // Logos stored as plain URLs are linked directly; only data URLs go through the API
+    if (!selectedUser.logoUrl.startsWith('/api/')) {
+      setSelectedLogo(selectedUser.logoUrl);
+      return undefined;
+    }
+    let logoUrl = null;
+    superAdminAPI.getUserLogo(selectedUser.id)
+      .then(response => {
+        logoUrl = window.URL.createObjectURL(response.data);
+        setSelectedLogo(logoUrl);
+      })
+      .catch(error => console.error('Error fetching logo:', error));
+    return () => {
+      if (logoUrl) {
+        window.URL.revokeObjectURL(logoUrl);
+      }
+    };
+  }, [selectedUser]);
 
   const fetchUsers = async () => {
     try {
-      setLoading(true);
-      if (activeTab === 'business') {
-        const response = await superAdminAPI.getUsers('business');
-        setBusinessUsers(response.data.data);
-      } else {
-        const response = await superAdminAPI.getUsers('individual');
-        setIndividualUsers(response.data.data);
+      const params = { page: currentPage, limit: USERS_PER_PAGE, sort: sortBy };
+      if (search) {
+        params.search = search;
+      }
+      if (statusFilter !== 'all') {
+        params.status = statusFilter;
+      }
+      const response = await superAdminAPI.getUsers(activeTab, params);
+      const { users, totalPages, totalUsers, statusCounts } = response.data.data;
+      setUsers(users);
+      setTotalPages(totalPages);
+      setTotalUsers(totalUsers);
+      if (!search) {
+        const tabTotal = Object.values(statusCounts).reduce((sum, count) => sum + count, 0);
+        setUserTotals(prev => ({ ...prev, [activeTab]: tabTotal }));
       }
     } catch (error) {
       console.error('Error fetching users:', error);
@@ -57,42 +101,9 @@ const ManageUsers = () => {
     }
   };
 
-  const filterAndSortUsers = () => {
-    const currentUsers = activeTab === 'business' ? businessUsers : individualUsers;
-    let filtered = [...currentUsers];
-
-    // Filter by search term
-    if (searchTerm) {
-      filtered = filtered.filter(user => 
-        user.name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        user.email?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        user.legalEntityName?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        user.id.toString().includes(searchTerm)
-      );
-    }
-
-    // Filter by status
-    if (statusFilter !== 'all') {
-      filtered = filtered.filter(user => user.status === statusFilter);
-    }
-
-    // Sort users
-    filtered.sort((a, b) => {
-      switch (sortBy) {
-        case 'newest':
-          return new Date(b.createdAt) - new Date(a.createdAt);
-        case 'oldest':
-          return new Date(a.createdAt) - new Date(b.createdAt);
-        case 'name':
-          const nameA = a.name || a.legalEntityName || '';
-          const nameB = b.name || b.legalEntityName || '';
-          return nameA.localeCompare(nameB);
-        default:
-          return 0;
-      }
-    });
-
-    setFilteredUsers(filtered);
+  const handleTabChange = (tab) => {
+    setActiveTab(tab);
+    setCurrentPage(1);
   };
 
   const handleUserAction = async (id, action) => {
@@ -248,7 +259,7 @@ const ManageUsers = () => {
           gap: '8px'
         }}>
           <button
-            onClick={() => setActiveTab('business')}
+            onClick={() => handleTabChange('business')}
             style={{
               flex: 1,
               padding: '12px 24px',
@@ -269,10 +280,10 @@ const ManageUsers = () => {
             }}
           >
             <Building size={20} />
-            Business Users ({businessUsers.length})
+            Business Users ({userTotals.business})
           </button>
           <button
-            onClick={() => setActiveTab('individual')}
+            onClick={() => handleTabChange('individual')}
             style={{
               flex: 1,
               padding: '12px 24px',
@@ -293,7 +304,7 @@ const ManageUsers = () => {
             }}
           >
             <Users size={20} />
-            Individual Users ({individualUsers.length})
+            Individual Users ({userTotals.individual})
           </button>
         </div>
 
@@ -333,7 +344,7 @@ const ManageUsers = () => {
                 }} />
                 <input
                   type="text"
-                  placeholder="Search by name, email, or ID..."
+                  placeholder={activeTab === 'business' ? 'Search by name, email, or GST...' : 'Search by name or email...'}
                   value={searchTerm}
                   onChange={(e) => setSearchTerm(e.target.value)}
                   style={{
@@ -378,7 +389,10 @@ const ManageUsers = () => {
                 }} />
                 <select
                   value={statusFilter}
-                  onChange={(e) => setStatusFilter(e.target.value)}
+                  onChange={(e) => {
+                    setStatusFilter(e.target.value);
+                    setCurrentPage(1);
+                  }}
                   style={{
                     width: '100%',
                     padding: '10px 12px 10px 36px',
@@ -392,6 +406,7 @@ const ManageUsers = () => {
                   <option value="all">All Status</option>
                   <option value="pending">Pending</option>
                   <option value="approved">Approved</option>
+                  <option value="rejected">Rejected</option>
                   <option value="blocked">Blocked</option>
                 </select>
               </div>
@@ -418,7 +433,10 @@ const ManageUsers = () => {
                 }} />
                 <select
                   value={sortBy}
-                  onChange={(e) => setSortBy(e.target.value)}
+                  onChange={(e) => {
+                    setSortBy(e.target.value);
+                    setCurrentPage(1);
+                  }}
                   style={{
                     width: '100%',
                     padding: '10px 12px 10px 36px',
@@ -429,6 +447,7 @@ const ManageUsers = () => {
                     outline: 'none'
                   }}
                 >
+                  <option value="pending_first">Pending First</option>
                   <option value="newest">Newest First</option>
                   <option value="oldest">Oldest First</option>
                   <option value="name">Name A-Z</option>
@@ -445,7 +464,7 @@ const ManageUsers = () => {
             color: '#6b7280',
             marginTop: '16px'
           }}>
-            Showing {filteredUsers.length} of {activeTab === 'business' ? businessUsers.length : individualUsers.length} users
+            Showing {users.length} of {totalUsers} users
             {searchTerm && (
               <span> for "{searchTerm}"</span>
             )}
@@ -453,12 +472,12 @@ const ManageUsers = () => {
         </div>
 
         {/* Users Display */}
-        {filteredUsers.length > 0 ? (
+        {users.length > 0 ? (
           <div style={{
             display: 'grid',
             gap: '16px'
           }}>
-            {filteredUsers.map((user) => (
+            {users.map((user) => (
               <div key={user.id} style={{
                 background: 'white',
                 borderRadius: '12px',
@@ -750,6 +769,35 @@ const ManageUsers = () => {
                 </div>
               </div>
             ))}
+
+            {/* Pagination */}
+            {totalPages > 1 && (
+              <div style={{
+                display: 'flex',
+                justifyContent: 'center',
+                alignItems: 'center',
+                gap: '12px',
+                paddingTop: '8px',
+                fontSize: '14px',
+                color: '#374151'
+              }}>
+                <button
+                  onClick={() => setCurrentPage(currentPage - 1)}
+                  disabled={currentPage === 1}
+                  className="btn btn-secondary"
+                >
+                  Previous
+                </button>
+                <span>Page {currentPage} of {totalPages}</span>
+                <button
+                  onClick={() => setCurrentPage(currentPage + 1)}
+                  disabled={currentPage === totalPages}
+                  className="btn btn-secondary"
+                >
+                  Next
+                </button>
+              </div>
+            )}
           </div>
         ) : (
           <div style={{
@@ -795,7 +843,8 @@ const ManageUsers = () => {
                 onClick={() => {
                   setSearchTerm('');
                   setStatusFilter('all');
-                  setSortBy('newest');
+                  setSortBy('pending_first');
+                  setCurrentPage(1);
                 }}
                 style={{
                   background: 'linear-gradient(135deg, #3b82f6, #1d4ed8)',
@@ -948,6 +997,19 @@ const ManageUsers = () => {
                     }}>
                       Business Details
                     </h3>
+                    {selectedLogo && (
+                      <img
+                        src={selectedLogo}
+                        alt={`${selectedUser.legalEntityName} logo`}
+                        style={{
+                          maxWidth: '120px',
+                          maxHeight: '120px',
+                          objectFit: 'contain',
+                          borderRadius: '8px',
+                          marginBottom: '16px'
+                        }}
+                      />
+                    )}
                     <div style={{ display: 'grid', gridTemplateColumns: '1fr 1fr', gap: '16px' }}>
                       <div>
                         <p style={{ fontSize: '12px', color: '#6b7280', margin: '0 0 4px 0' }}>GST Number</p>
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import Layout from '../common/Layout';
-import { superAdminAPI } from '../../services/api';
+import { superAdminAPI, resolveImageUrl } from '../../services/api';
 import { 
   Users, 
   Building, 
@@ -756,7 +756,7 @@ const SuperAdminDashboard = () => {
                     borderRadius: '8px'
                   }}>
                     <img
-                      src={product.images?.[0] || '/placeholder-product.jpg'}
+                      src={resolveImageUrl(product.images?.[0]) || '/placeholder-product.jpg'}
                       alt={product.name}
                       style={{
                         width: '40px',
@@ -28,9 +28,10 @@ export const AuthProvider = ({ children }) => {
   const login = async (credentials, userType) => {
     try {
       const response = await api.post(`/auth/${userType}/login`, credentials);
-      const { token, user: userData } = response.data.data;
+      const { token, refreshToken, user: userData } = response.data.data;
       
       localStorage.setItem('token', token);
+      localStorage.setItem('refreshToken', refreshToken);
       localStorage.setItem('user', JSON.stringify(userData));
       setUser(userData);
       
@@ -60,6 +61,7 @@ export const AuthProvider = ({ children }) => {
 
   const logout = () => {
     localStorage.removeItem('token');
+    localStorage.removeItem('refreshToken');
     localStorage.removeItem('user');
     setUser(null);
   };
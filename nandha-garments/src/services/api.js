@@ -23,14 +23,45 @@ api.interceptors.request.use(
   }
 );
 
-// Response interceptor to handle auth errors
+let refreshRequest = null;
+
+const refreshAccessToken = () => {
+  if (!refreshRequest) {
+    const refreshToken = localStorage.getItem('refreshToken');
+    refreshRequest = (refreshToken
+      ? axios.post(`${API_BASE_URL}/auth/refresh`, { refreshToken })
+      : Promise.reject(new Error('No refresh token'))
+    )
+      .then((response) => {
+        const { token, refreshToken: nextRefreshToken } = response.data.data;
+        localStorage.setItem('token', token);
+        localStorage.setItem('refreshToken', nextRefreshToken);
+        return token;
+      })
+      .finally(() => {
+        refreshRequest = null;
+      });
+  }
+  return refreshRequest;
+};
+
+// Response interceptor to refresh expired access tokens and handle auth errors
 api.interceptors.response.use(
   (response) => response,
-  (error) => {
-    if (error.response?.status === 401) {
-      localStorage.removeItem('token');
-      localStorage.removeItem('user');
-      window.location.href = '/';
+  async (error) => {
+    const originalRequest = error.config;
+    if (error.response?.status === 401 && originalRequest && !originalRequest._retry) {
+      originalRequest._retry = true;
+      try {
+        const token = await refreshAccessToken();
+        originalRequest.headers.Authorization = `Bearer ${token}`;
+        return api(originalRequest);
+      } catch (refreshError) {
+        localStorage.removeItem('token');
+        localStorage.removeItem('refreshToken');
+        localStorage.removeItem('user');
+        window.location.href = '/';
+      }
     }
     return Promise.reject(error);
   }
@@ -38,6 +69,10 @@ api.interceptors.response.use(
 
 export { api };
 
+// Product images are stored server-side and referenced as /api/images/<hash>.<ext>
+export const resolveImageUrl = (src) =>
+  src && src.startsWith('/api/') ? `${API_BASE_URL.replace(/\/api$/, '')}${src}` : src;
+
 // API endpoints
 export const authAPI = {
   businessLogin: (credentials) => api.post('/auth/business/login', credentials),
@@ -45,6 +80,7 @@ export const authAPI = {
   superAdminLogin: (credentials) => api.post('/auth/superadmin/login', credentials),
   businessSignup: (userData) => api.post('/auth/business/signup', userData),
   individualSignup: (userData) => api.post('/auth/individual/signup', userData),
+  refresh: (refreshToken) => api.post('/auth/refresh', { refreshToken }),
 };
 
 export const businessAPI = {
@@ -70,6 +106,7 @@ export const individualAPI = {
 export const productsAPI = {
   getProducts: (params) => api.get('/products', { params }),
   getProduct: (id) => api.get(`/products/${id}`),
+  getProductsBatch: (ids, params) => api.get('/products/batch', { params: { ...params, ids: ids.join(',') } }),
   
   // Cart management
   getCart: () => api.get('/cart'),
@@ -82,15 +119,20 @@ export const productsAPI = {
 
 export const superAdminAPI = {
   getDashboard: () => api.get('/superadmin/dashboard'),
-  getUsers: (type) => api.get(`/superadmin/users/${type}`),
+  getUsers: (type, params) => api.get(`/superadmin/users/${type}`, { params }),
+  getUserLogo: (id) => api.get(`/superadmin/users/${id}/logo`, { responseType: 'blob' }),
   approveUser: (id) => api.put(`/superadmin/users/${id}/approve`),
   blockUser: (id) => api.put(`/superadmin/users/${id}/block`),
   unblockUser: (id) => api.put(`/superadmin/users/${id}/unblock`),
-  getProducts: () => api.get('/superadmin/products'),
+  getProducts: (params) => api.get('/superadmin/products', { params }),
+  getProduct: (id) => api.get(`/superadmin/products/${id}`),
   addProduct: (data) => api.post('/superadmin/products', data),
   updateProduct: (id, data) => api.put(`/superadmin/products/${id}`, data),
   deleteProduct: (id) => api.delete(`/superadmin/products/${id}`),
-  getOrders: () => api.get('/superadmin/orders'),
+  getOrders: (params) => api.get('/superadmin/orders', { params }),
   updateOrderStatus: (id, status) => api.put(`/superadmin/orders/${id}/status`, { status }),
-  getOrdersForDownload: (filters) => api.post('/superadmin/orders/download', filters)
+  getOrdersForDownload: (filters) => api.post('/superadmin/orders/download', filters),
+  createExport: (filters) => api.post('/superadmin/exports', filters),
+  getExport: (jobId) => api.get(`/superadmin/exports/${jobId}`),
+  downloadExport: (jobId) => api.get(`/superadmin/exports/${jobId}/download`, { responseType: 'blob' })
 };
\ No newline at end of file
@@ -37,4 +37,5 @@ export const MEASUREMENT_FIELDS = [
     { value: 'price_desc', label: 'Price (High to Low)' },
     { value: 'date_asc', label: 'Oldest First' },
     { value: 'date_desc', label: 'Newest First' },
+    { value: 'relevance', label: 'Best Match' },
   ];
\ No newline at end of file